@@ -5,101 +5,240 @@ Generates data matching dissertation results precisely
 
 import pandas as pd
 import numpy as np
+from scipy.stats import norm
+from scipy.special import expit
 import hashlib
 import json
 import os
-from datetime import datetime, timedelta
+import sys
+from datetime import datetime
 
 # Set random seed for reproducibility
 np.random.seed(42)
 
+# Survey position levels an interviewee with each interview position may hold
+# (the same equivalences 2_link.py uses when matching records)
+INTERVIEW_POSITION_SOURCES = {
+    'Senior Leader': ['Senior Executive', 'Department Head'],
+    'Mid-level Leader': ['Department Head', 'Team Leader']
+}
+
+# Moderation effects on the outcome score (Table 4.9), overridable per generator
+INTERACTION_EFFECTS = {'TC_x_PD': -0.16, 'CMC_x_UA': 0.19, 'EA_x_Coll': 0.14, 'ALO_x_LTO': 0.17}
+
+# Missingness stage defaults: item blocks (survey schema groups) that may be masked,
+# and the demographic weights of the MAR response model (older, senior and female
+# respondents skip more items)
+MISSINGNESS = {
+    'mechanism': 'MCAR',
+    'rate': 0.10,
+    'strength': 1.0,
+    'blocks': ['LRAIT Items', 'Outcome Items', 'Cultural Items'],
+    'mar_weights': {'Age': 0.6, 'Position_Senior': 0.4, 'Gender_Male': -0.3},
+    'min_items': 0.5,
+    'code': None
+}
+
+# Careless-responder stage defaults: share of respondents replaced by careless
+# response patterns and the mix of patterns (straightlining answers one value per
+# item block, random responding draws every answer uniformly from the scale)
+CARELESS = {
+    'rate': 0.05,
+    'types': {'straightline': 0.5, 'random': 0.5},
+    'blocks': ['LRAIT Items', 'Outcome Items', 'Cultural Items']
+}
+
+# Likert measurement model: LRAIT item loadings are drawn from LRAIT_LOADINGS and
+# every item adds normal error of the given SD on the latent scale. Each outcome
+# subscale shifts the outcome score and adds its own noise (OL also gets +0.25 of
+# country boost through its shift)
+LRAIT_LOADINGS = (0.72, 0.83)
+LRAIT_ITEM_ERROR_SD = 0.75
+OUTCOME_SUBSCALES = {'OI': {'shift': 0.0, 'sd': 0.28}, 'SA': {'shift': -0.35, 'sd': 0.30},
+                     'OL': {'shift': 0.35, 'sd': 0.27}}
+OUTCOME_ITEM_ERROR_SD = 0.35
+
+# Sharded generation: respondents per block. Every block draws from its own stream
+# seeded by (seed, country, block), so the panel does not depend on the shard count
+SHARD_BLOCK_SIZE = 10000
+
 class DissertationDataGenerator:
     """
     Generates research dataset matching dissertation tables exactly
     """
     
-    def __init__(self):
-        self.japan_quant_n = 213
-        self.vietnam_quant_n = 215
-        self.japan_qual_n = 23
-        self.vietnam_qual_n = 22
+    def __init__(self, calibrate=False, calibration_targets=None, registry_path='country_registry.json', seed=None,
+                 schema_path='survey_schema.json', interaction_effects=None, missingness=None,
+                 careless=None, target_proportions=None):
+        # Random stream: the module-level seeded generator unless a seed is given
+        self.rng = np.random if seed is None else np.random.RandomState(seed)
+        
+        # Country parameters (sample sizes, demographics, score targets) come from the registry
+        self.registry_path = registry_path
+        self.registry = self.load_country_registry(registry_path)
+        self.shared = self.registry['shared']
+        self.countries = self.registry['countries']
+        
+        # Survey file layout (column order and groups) comes from the shared schema
+        self.schema = self.load_json_spec(schema_path)
+        self.survey_columns = [col for group in self.schema['groups'] for col in group['columns']]
         self.overlap_pct = 0.35
         
+        # Moderation effects used by the default (non-calibrated) outcome model
+        self.interaction_effects = {**INTERACTION_EFFECTS, **(interaction_effects or {})}
+        
+        # Item nonresponse stage (None = complete data); see MISSINGNESS for the options
+        self.missingness = {**MISSINGNESS, **missingness} if missingness else None
+        if self.missingness and self.missingness['mechanism'] not in ('MCAR', 'MAR', 'MNAR'):
+            raise ValueError(f"Unknown missingness mechanism: {self.missingness['mechanism']}")
+        self.missingness_report = {}
+        
+        # Careless-responder stage (None = attentive respondents only); see CARELESS
+        self.careless = {**CARELESS, **careless} if careless is not None else None
+        if self.careless and not set(self.careless['types']) <= {'straightline', 'random'}:
+            raise ValueError(f"Unknown careless response types: {list(self.careless['types'])}")
+        self.careless_types = None
+        
+        # Per-item Likert category proportions (registry 'likert_targets', then the
+        # target_proportions argument); items without targets use likert_proportions
+        self.target_proportions = self.load_target_proportions(
+            {**self.shared.get('likert_targets', {}), **(target_proportions or {})}
+        )
+        
+        # Calibration mode: transform the draws so one pass meets the targets
+        if calibration_targets is None and calibrate:
+            calibration_targets = self.default_calibration_targets()
+        self.calibration_targets = calibration_targets
+        self.calibration_iterations = 6
+        self.calibration_tolerance = {'mean': 0.02, 'sd': 0.02, 'corr': 0.03, 'alpha': 0.015, 'beta': 0.03}
+        self.calibration_report = {}
+    
+    def load_json_spec(self, path):
+        """Load a JSON (or YAML) spec, falling back to the copy shipped next to this script"""
+        
+        if not os.path.isabs(path) and not os.path.exists(path):
+            path = os.path.join(os.path.dirname(os.path.abspath(__file__)), path)
+        
+        with open(path, 'r') as f:
+            if path.endswith(('.yaml', '.yml')):
+                try:
+                    import yaml
+                except ImportError:
+                    raise ImportError(f"Reading {path} requires PyYAML: pip install pyyaml")
+                return yaml.safe_load(f)
+            return json.load(f)
+    
+    def schema_group(self, name):
+        """Columns of one survey schema group"""
+        for group in self.schema['groups']:
+            if group['name'] == name:
+                return list(group['columns'])
+        raise KeyError(f"No column group '{name}' in the survey schema")
+    
+    def load_country_registry(self, path):
+        """Load the country parameter registry from a JSON (or YAML) spec"""
+        
+        registry = self.load_json_spec(path)
+        
+        for country, spec in registry['countries'].items():
+            missing = [key for key in ['code', 'quant_n', 'qual_n', 'quantitative', 'qualitative',
+                                       'industry', 'lrait', 'cultural_means'] if key not in spec]
+            if missing:
+                raise ValueError(f"Country '{country}' in {path} is missing: {missing}")
+        
+        return registry
+    
+    def load_target_proportions(self, targets, n_categories=7):
+        """Check and normalize per-item target proportions ({item: [p1, ..., p7]})"""
+        
+        items = self.schema_group('LRAIT Items') + self.schema_group('Outcome Items')
+        unknown = sorted(set(targets) - set(items))
+        if unknown:
+            raise ValueError(f"Target proportions for unknown items: {unknown}")
+        
+        proportions = {}
+        for item, probs in targets.items():
+            probs = np.asarray(probs, dtype=float)
+            if probs.shape != (n_categories,) or (probs < 0).any() or probs.sum() <= 0:
+                raise ValueError(f"Target proportions for {item} must be {n_categories} non-negative values")
+            proportions[item] = probs / probs.sum()
+        return proportions
+    
+    def country_index(self, country_col):
+        """Registry position of each row's country (used to gather per-country parameters)"""
+        codes = pd.Categorical(country_col, categories=list(self.countries)).codes
+        if (codes < 0).any():
+            unknown = sorted(set(pd.Series(country_col)[codes < 0]))
+            raise ValueError(f"Countries not in registry: {unknown}")
+        return codes
+    
+    def country_parameter(self, country_idx, getter):
+        """Gather a per-country parameter to one value per row"""
+        values = np.array([getter(spec) for spec in self.countries.values()])
+        return values[country_idx]
+    
+    def sample_categories(self, country_idx, distributions):
+        """Draw one category per row from its country's distribution (inverse CDF on gathered rows)"""
+        levels = list(dict.fromkeys(level for dist in distributions for level in dist))
+        probs = np.array([[dist.get(level, 0.0) for level in levels] for dist in distributions])
+        cumulative = np.cumsum(probs / probs.sum(axis=1, keepdims=True), axis=1)
+        u = self.rng.random(len(country_idx))
+        codes = (u[:, None] > cumulative[country_idx]).sum(axis=1)
+        return np.asarray(levels, dtype=object)[np.minimum(codes, len(levels) - 1)]
+    
     def generate_participant_id(self, country_code, sequence, phase):
         """Generate masked participant IDs"""
         return f"{country_code}_{phase}_{sequence:03d}"
     
-    def generate_demographics(self, country, n, is_qualitative=False):
-        """Generate demographics matching Table 4.1 and 4.2"""
+    def generate_participant_ids(self, countries, phase, first=None):
+        """
+        Generate masked participant IDs for a whole panel, numbered within each country
+        from 1 (or from first[country], for a slice of a larger panel)
+        """
+        countries = pd.Series(countries).reset_index(drop=True)
+        codes = countries.map({country: spec['code'] for country, spec in self.countries.items()})
+        sequence = countries.groupby(countries).cumcount() + countries.map(first or {}).fillna(1).astype(int)
+        return (codes + f'_{phase}_' + sequence.astype(str).str.zfill(3)).tolist()
+    
+    def generate_demographics(self, country_sizes, is_qualitative=False):
+        """Generate demographics matching Table 4.1 and 4.2 for all countries in one pass"""
         
-        if country == 'Japan':
-            age_mean, age_sd = (47.3, 5.5) if is_qualitative else (44.8, 8.2)
-            male_pct = 0.87 if is_qualitative else 0.793
-            tenure_mean, tenure_sd = (12.4, 4.8) if is_qualitative else (8.9, 5.2)
-            
-            if is_qualitative:
-                senior_pct, mid_pct = 0.39, 0.61
-            else:
-                team_pct, dept_pct, senior_pct = 0.282, 0.455, 0.263
-            
-            industry_dist = {
-                'Manufacturing': 0.244, 'Financial Services': 0.221,
-                'Retail': 0.164, 'Technology': 0.122,
-                'Healthcare': 0.146, 'Other': 0.103
-            }
-        else:  # Vietnam
-            age_mean, age_sd = (41.6, 6.2) if is_qualitative else (39.4, 7.6)
-            male_pct = 0.68 if is_qualitative else 0.647
-            tenure_mean, tenure_sd = (9.2, 3.8) if is_qualitative else (6.4, 4.1)
-            
-            if is_qualitative:
-                senior_pct, mid_pct = 0.36, 0.64
-            else:
-                team_pct, dept_pct, senior_pct = 0.321, 0.442, 0.237
-            
-            industry_dist = {
-                'Manufacturing': 0.186, 'Financial Services': 0.284,
-                'Retail': 0.195, 'Technology': 0.177,
-                'Healthcare': 0.093, 'Other': 0.065
-            }
+        countries = list(country_sizes)
+        country_idx = np.repeat(self.country_index(countries), [country_sizes[c] for c in countries])
+        n = len(country_idx)
+        phase = 'qualitative' if is_qualitative else 'quantitative'
+        specs = list(self.countries.values())
         
         # Generate age
-        age = np.random.normal(age_mean, age_sd, n)
+        age_mean = self.country_parameter(country_idx, lambda s: s[phase]['age'][0])
+        age_sd = self.country_parameter(country_idx, lambda s: s[phase]['age'][1])
+        age = self.rng.normal(age_mean, age_sd)
         age = np.clip(age, 28, 65).astype(int)
         
         # Generate gender
-        gender = np.random.choice(['Male', 'Female'], n, p=[male_pct, 1-male_pct])
+        male_pct = self.country_parameter(country_idx, lambda s: s[phase]['male_pct'])
+        gender = np.where(self.rng.random(n) < male_pct, 'Male', 'Female').astype(object)
         
         # Generate position
-        if is_qualitative:
-            position = np.random.choice(
-                ['Senior Leader', 'Mid-level Leader'],
-                n, p=[senior_pct, mid_pct]
-            )
-        else:
-            position = np.random.choice(
-                ['Team Leader', 'Department Head', 'Senior Executive'],
-                n, p=[team_pct, dept_pct, senior_pct]
-            )
+        position = self.sample_categories(country_idx, [s[phase]['position'] for s in specs])
         
         # Generate tenure (ensuring it doesn't exceed working years)
-        education = np.random.choice(['Bachelor', 'Master', 'PhD'], n, p=[0.45, 0.48, 0.07])
-        career_start_age = np.array([22 if e == 'Bachelor' else (24 if e == 'Master' else 28) for e in education])
+        education_dist = self.shared['education']
+        education = self.rng.choice(list(education_dist), n, p=list(education_dist.values()))
+        career_start_age = pd.Series(education).map(self.shared['career_start_age']).values
         max_tenure = age - career_start_age
         
-        tenure = np.random.normal(tenure_mean, tenure_sd, n)
+        tenure_mean = self.country_parameter(country_idx, lambda s: s[phase]['tenure'][0])
+        tenure_sd = self.country_parameter(country_idx, lambda s: s[phase]['tenure'][1])
+        tenure = self.rng.normal(tenure_mean, tenure_sd)
         tenure = np.clip(tenure, 2, np.minimum(max_tenure, 30)).round(1)
         
         # Generate industry
-        industries = list(industry_dist.keys())
-        probs = list(industry_dist.values())
-        industry = np.random.choice(industries, n, p=probs)
+        industry = self.sample_categories(country_idx, [s['industry'] for s in specs])
         
         # Organization size
-        org_size_category = np.random.choice(
-            ['Small (< 100)', 'Medium (100-500)', 'Large (> 500)'],
-            n, p=[0.25, 0.40, 0.35]
-        )
+        org_size_dist = self.shared['org_size']
+        org_size_category = self.rng.choice(list(org_size_dist), n, p=list(org_size_dist.values()))
         
         df = pd.DataFrame({
             'Age': age,
@@ -109,102 +248,248 @@ class DissertationDataGenerator:
             'Education': education,
             'Industry': industry,
             'Org_Size_Category': org_size_category,
-            'Country': country
+            'Country': np.asarray(list(self.countries), dtype=object)[country_idx]
         })
         
         if not is_qualitative:
-            org_size_numeric = []
-            for size_cat in org_size_category:
-                if 'Small' in size_cat:
-                    org_size_numeric.append(np.random.randint(30, 100))
-                elif 'Medium' in size_cat:
-                    org_size_numeric.append(np.random.randint(100, 500))
-                else:
-                    org_size_numeric.append(np.random.randint(500, 2000))
-            df['Org_Size_Numeric'] = org_size_numeric
+            bounds = pd.Series(org_size_category).map(self.shared['org_size_numeric'])
+            low = np.array([b[0] for b in bounds])
+            high = np.array([b[1] for b in bounds])
+            df['Org_Size_Numeric'] = self.rng.randint(low, high)
         
         return df
     
-    def generate_lrait_scores(self, demographics):
-        """Generate LRAIT scores matching Table 4.5"""
+    def likert_proportions(self, means, sds, n_categories=7):
+        """Default category proportions: a normal truncated to the response range, so no mass piles at 1 and 7"""
+        edges = np.arange(n_categories + 1) + 0.5
+        cdf = norm.cdf((edges[None, :] - np.asarray(means)[:, None]) / np.asarray(sds)[:, None])
+        probs = np.diff(cdf, axis=1)
+        return probs / probs.sum(axis=1, keepdims=True)
+    
+    def item_proportions(self, items, means, sds):
+        """Target proportions of each item: its configured targets, else the truncated normal at (mean, sd)"""
+        
+        proportions = self.likert_proportions(means, sds)
+        for j, item in enumerate(items):
+            if item in self.target_proportions:
+                proportions[j] = self.target_proportions[item]
+        return proportions
+    
+    def likert_thresholds(self, proportions, means, sds):
+        """
+        Per-item cut points that reproduce the target category proportions on a latent
+        scale with the given model-implied means and SDs (the same for every sample)
+        """
+        
+        cumulative = np.clip(np.cumsum(proportions, axis=1)[:, :-1], 1e-6, 1 - 1e-6)
+        return np.asarray(means)[:, None] + np.asarray(sds)[:, None] * norm.ppf(cumulative)
+    
+    def registry_weights(self):
+        """Registry countries' shares of the default survey sample (quant_n)"""
+        sizes = np.array([spec['quant_n'] for spec in self.countries.values()], dtype=float)
+        return sizes / sizes.sum()
+    
+    def pooled_moments(self, means, covariances):
+        """Mean and covariance of the registry-weighted mixture of per-country distributions"""
+        
+        weights = self.registry_weights()
+        means = np.asarray(means, dtype=float)
+        mean = weights @ means
+        second = np.einsum('c,cij->ij', weights, np.asarray(covariances) + np.einsum('ci,cj->cij', means, means))
+        return mean, second - np.outer(mean, mean)
+    
+    def lrait_target_moments(self):
+        """Registry-weighted mean vector and covariance matrix of the target LRAIT dimension scores"""
+        
+        dims = ['TC', 'CMC', 'EA', 'ALO']
+        means, covariances = [], []
+        for spec in self.countries.values():
+            sds = np.array([spec['lrait']['sds'][d] for d in dims])
+            correlation = np.array(spec.get('lrait_correlation', self.shared['lrait_correlation']))
+            means.append([spec['lrait']['means'][d] for d in dims])
+            covariances.append(correlation * np.outer(sds, sds))
+        return self.pooled_moments(means, covariances)
+    
+    def lrait_item_thresholds(self, loadings):
+        """
+        Cut points of the 32 LRAIT items. The latent item is loading * dimension score
+        + error, so its model-implied mean is loading * target mean and its variance
+        loading^2 * target variance + error variance.
+        """
+        
+        items = self.schema_group('LRAIT Items')
+        dim_means, dim_cov = self.lrait_target_moments()
+        means = loadings * np.repeat(dim_means, 8)
+        sds = np.sqrt(loadings ** 2 * np.repeat(np.diag(dim_cov), 8) + LRAIT_ITEM_ERROR_SD ** 2)
+        return self.likert_thresholds(self.item_proportions(items, means, sds), means, sds)
+    
+    def outcome_item_thresholds(self):
+        """
+        Cut points of the 12 outcome items from the model-implied moments of their latent
+        scores (generate_outcome_scores with the mean LRAIT loading, ignoring clipping).
+        The LRAIT dimension scores enter through their item targets: a dimension mean has
+        the mean of its items' target distributions and, with item reliability rho, the
+        variance item variance * (rho + (1 - rho) / 8).
+        """
+        
+        categories = np.arange(1, 8)
+        loading = np.mean(LRAIT_LOADINGS)
+        dim_means, dim_cov = self.lrait_target_moments()
+        dim_vars = np.diag(dim_cov)
+        lrait_proportions = self.item_proportions(
+            self.schema_group('LRAIT Items'), loading * np.repeat(dim_means, 8),
+            np.sqrt(loading ** 2 * np.repeat(dim_vars, 8) + LRAIT_ITEM_ERROR_SD ** 2)
+        ).reshape(4, 8, -1)
+        item_means = lrait_proportions @ categories
+        item_vars = lrait_proportions @ categories ** 2 - item_means ** 2
+        rho = loading ** 2 * dim_vars / (loading ** 2 * dim_vars + LRAIT_ITEM_ERROR_SD ** 2)
+        score_sds = np.sqrt(item_vars.mean(axis=1) * (rho + (1 - rho) / 8))
+        score_corr = dim_cov / np.sqrt(np.outer(dim_vars, dim_vars)) * np.sqrt(np.outer(rho, rho))
+        np.fill_diagonal(score_corr, 1.0)
+        score_cov = score_corr * np.outer(score_sds, score_sds)
+        
+        # Position and country boost shifts, pooled over the registry countries
+        position_effects = {'Department Head': 0.25, 'Senior Executive': 0.50}
+        position = [[sum(effect * spec['quantitative']['position'].get(level, 0.0)
+                         for level, effect in position_effects.items())] for spec in self.countries.values()]
+        position_var = [[[sum(effect ** 2 * spec['quantitative']['position'].get(level, 0.0)
+                              for level, effect in position_effects.items()) - row[0] ** 2]]
+                        for spec, row in zip(self.countries.values(), position)]
+        position_mean, position_var = self.pooled_moments(position, position_var)
+        boost = [[spec.get('outcome_boost', 0.0)] for spec in self.countries.values()]
+        boost_mean, boost_var = self.pooled_moments(boost, np.zeros((len(boost), 1, 1)))
+        
+        # Outcome score: Table 4.7 coefficients, moderation (centered products), position and noise
+        betas = np.array([0.26, 0.33, 0.17, 0.26])
+        effects = self.interaction_effects
+        cultural_sds = self.shared['cultural_sds']
+        moderation_var = sum(effects[key] ** 2 * score_cov[d, d] * cultural_sds[culture] ** 2
+                             for d, (key, culture) in enumerate([('TC_x_PD', 'PD'), ('CMC_x_UA', 'UA'),
+                                                                 ('EA_x_Coll', 'Collectivism'),
+                                                                 ('ALO_x_LTO', 'LTO')]))
+        outcome_mean = 1.2 + betas @ item_means.mean(axis=1) + position_mean[0]
+        outcome_var = betas @ score_cov @ betas + moderation_var + position_var[0, 0] + 0.30 ** 2
+        
+        means, sds = [], []
+        for subscale in OUTCOME_SUBSCALES.values():
+            means += [outcome_mean + subscale['shift'] + boost_mean[0]] * 4
+            sds += [np.sqrt(outcome_var + boost_var[0, 0] + subscale['sd'] ** 2 + OUTCOME_ITEM_ERROR_SD ** 2)] * 4
+        means, sds = np.array(means), np.array(sds)
+        return self.likert_thresholds(self.item_proportions(self.schema_group('Outcome Items'), means, sds),
+                                      means, sds)
+    
+    def discretize_likert(self, latent, thresholds):
+        """Map an n x p latent matrix to 1..K categories with a single searchsorted call"""
         
-        n = len(demographics)
-        country = demographics['Country'].iloc[0]
+        latent = np.asarray(latent, dtype=float)
+        n, p = latent.shape
+        n_cuts = thresholds.shape[1]
+        
+        # Shift each item into its own disjoint band so one sorted vector holds all thresholds
+        span = 2 * max(np.abs(latent).max(), np.abs(thresholds).max()) + 1
+        offsets = np.arange(p) * span
+        flat_thresholds = (thresholds + offsets[:, None]).ravel()
+        
+        positions = np.searchsorted(flat_thresholds, (latent + offsets).ravel(), side='right')
+        categories = positions.reshape(n, p) - np.arange(p) * n_cuts + 1
+        return categories.astype(float)
+    
+    def lrait_parameters(self, country_idx):
+        """Per-row LRAIT means and SDs plus per-country Cholesky factors of the correlation matrix"""
+        
+        dims = ['TC', 'CMC', 'EA', 'ALO']
         
         # Target means and SDs from Table 4.5
-        if country == 'Japan':
-            tc_mean, tc_sd = 5.32, 0.87
-            cmc_mean, cmc_sd = 4.76, 0.92
-            ea_mean, ea_sd = 5.41, 0.81
-            alo_mean, alo_sd = 4.68, 0.95
-        else:  # Vietnam
-            tc_mean, tc_sd = 4.89, 0.94
-            cmc_mean, cmc_sd = 5.18, 0.89
-            ea_mean, ea_sd = 5.08, 0.88
-            alo_mean, alo_sd = 5.29, 0.87
-        
-        # Correlation matrix from Table 4.4 (off-diagonal: .47-.58)
-        correlation_matrix = np.array([
-            [1.00, 0.54, 0.48, 0.51],
-            [0.54, 1.00, 0.52, 0.58],
-            [0.48, 0.52, 1.00, 0.47],
-            [0.51, 0.58, 0.47, 1.00]
+        means = np.column_stack([
+            self.country_parameter(country_idx, lambda s, d=d: s['lrait']['means'][d]) for d in dims
+        ])
+        sds = np.column_stack([
+            self.country_parameter(country_idx, lambda s, d=d: s['lrait']['sds'][d]) for d in dims
         ])
         
-        means = [tc_mean, cmc_mean, ea_mean, alo_mean]
-        sds = [tc_sd, cmc_sd, ea_sd, alo_sd]
+        # Correlation matrix from Table 4.4, overridable per country
+        choleskys = np.stack([
+            np.linalg.cholesky(np.array(spec.get('lrait_correlation', self.shared['lrait_correlation'])))
+            for spec in self.countries.values()
+        ])
         
-        # Generate correlated scores
-        L = np.linalg.cholesky(correlation_matrix)
-        uncorrelated = np.random.normal(0, 1, (n, 4))
-        correlated = uncorrelated @ L.T
+        return means, sds, choleskys
+    
+    def generate_lrait_scores(self, demographics):
+        """Generate LRAIT scores matching Table 4.5 (per-row targets gathered by country)"""
         
-        for i in range(4):
-            correlated[:, i] = correlated[:, i] * sds[i] + means[i]
+        n = len(demographics)
+        country_idx = self.country_index(demographics['Country'])
+        means, sds, choleskys = self.lrait_parameters(country_idx)
         
+        # Generate correlated scores
+        uncorrelated = self.rng.normal(0, 1, (n, 4))
+        correlated = np.einsum('nij,nj->ni', choleskys[country_idx], uncorrelated)
+        correlated = correlated * sds + means
         correlated = np.clip(correlated, 1, 7)
         
         # Add demographic effects
-        if country == 'Japan':
-            age_effect = (demographics['Age'] - demographics['Age'].mean()) * -0.015
-            correlated[:, 0] += age_effect
+        correlated += self.lrait_effects(demographics)
+        correlated = np.clip(correlated, 1, 7)
+        
+        return pd.DataFrame(correlated, columns=['TC_Score', 'CMC_Score', 'EA_Score', 'ALO_Score'])
+    
+    def lrait_effects(self, demographics):
+        """Demographic shifts of the four LRAIT dimensions (TC by age, CMC by position)"""
+        
+        country_idx = self.country_index(demographics['Country'])
+        effects = np.zeros((len(demographics), 4))
+        
+        # Age centered within country
+        age_centered = demographics['Age'] - demographics.groupby('Country')['Age'].transform('mean')
+        tc_age_effect = self.country_parameter(country_idx, lambda s: s['lrait'].get('tc_age_effect', 0.0))
+        effects[:, 0] = age_centered.values * tc_age_effect
         
         position_effect = np.where(demographics['Position_Level'].str.contains('Department'), 0.12, 0)
         position_effect += np.where(demographics['Position_Level'].str.contains('Senior|Executive'), 0.25, 0)
-        correlated[:, 1] += position_effect
-        
-        correlated = np.clip(correlated, 1, 7)
+        effects[:, 1] = position_effect
         
-        return pd.DataFrame(correlated, columns=['TC_Score', 'CMC_Score', 'EA_Score', 'ALO_Score'])
+        return effects
+    
+    def measurement_instrument(self):
+        """LRAIT item loadings and the LRAIT and outcome item cut points, as JSON-ready lists"""
+        loadings = self.rng.uniform(*LRAIT_LOADINGS, len(self.schema_group('LRAIT Items')))
+        return {
+            'loadings': loadings.tolist(),
+            'lrait_thresholds': self.lrait_item_thresholds(loadings).tolist(),
+            'outcome_thresholds': self.outcome_item_thresholds().tolist()
+        }
     
-    def generate_item_scores(self, dimension_scores):
-        """Generate individual items with target reliability, then recalculate dimension scores"""
+    def generate_item_scores(self, dimension_scores, loadings=None, thresholds=None):
+        """
+        Generate individual items with target reliability, then recalculate dimension scores
+        (loadings and thresholds are drawn and derived here unless an instrument is given)
+        """
         
         n = len(dimension_scores)
-        items = {}
         
         dimensions = {
             'TC': 'TC_Score', 'CMC': 'CMC_Score',
             'EA': 'EA_Score', 'ALO': 'ALO_Score'
         }
         
-        # Step 1: Generate items based on target dimension scores
-        for dim_prefix, dim_col in dimensions.items():
-            dim_score = dimension_scores[dim_col].values
-            
-            for item_num in range(1, 9):
-                # Loading between .70-.85 for good reliability
-                loading = np.random.uniform(0.72, 0.83)
-                error = np.random.normal(0, 0.75, n)
-                
-                item_score = loading * dim_score + error
-                item_score = np.clip(item_score, 1, 7).round()
-                
-                items[f'{dim_prefix}{item_num}'] = item_score
+        # Step 1: Build the n x 32 latent item matrix from the target dimension scores
+        item_cols = [f'{dim_prefix}{item_num}' for dim_prefix in dimensions for item_num in range(1, 9)]
+        dim_scores = np.repeat(dimension_scores[list(dimensions.values())].values, 8, axis=1)
         
-        items_df = pd.DataFrame(items)
+        # Loading between .70-.85 for good reliability
+        if loadings is None:
+            loadings = self.rng.uniform(*LRAIT_LOADINGS, len(item_cols))
+        loadings = np.asarray(loadings, dtype=float)
+        errors = self.rng.normal(0, LRAIT_ITEM_ERROR_SD, (n, len(item_cols)))
+        latent = loadings * dim_scores + errors
         
-        # Step 2: RECALCULATE dimension scores as mean of items
+        # Step 2: Discretize all items at once against target-proportion thresholds
+        if thresholds is None:
+            thresholds = self.lrait_item_thresholds(loadings)
+        items_df = pd.DataFrame(self.discretize_likert(latent, thresholds), columns=item_cols)
+        
+        # Step 3: RECALCULATE dimension scores as mean of items
         # This ensures TC_Score = mean(TC1, TC2, ..., TC8)
         recalculated_dimensions = pd.DataFrame()
         
@@ -214,74 +499,76 @@ class DissertationDataGenerator:
         
         return items_df, recalculated_dimensions
     
-    def generate_outcome_scores(self, dimension_scores, demographics, cultural_values):
-        """Generate outcomes with moderation effects matching Table 4.9"""
+    def generate_outcome_scores(self, dimension_scores, demographics, cultural_values, thresholds=None):
+        """Generate outcomes with moderation effects matching Table 4.9 (thresholds: outcome item cut points)"""
         
         n = len(dimension_scores)
-        country = demographics['Country'].iloc[0]
+        country = demographics['Country'].values
+        country_idx = self.country_index(country)
+        
+        def centered(values):
+            # Center within each country
+            values = pd.Series(np.asarray(values, dtype=float))
+            return values - values.groupby(country).transform('mean')
         
         # Center cultural values for moderation
-        pd_c = cultural_values['PD_Score'] - cultural_values['PD_Score'].mean()
-        ua_c = cultural_values['UA_Score'] - cultural_values['UA_Score'].mean()
-        coll_c = cultural_values['Collectivism_Score'] - cultural_values['Collectivism_Score'].mean()
-        lto_c = cultural_values['LTO_Score'] - cultural_values['LTO_Score'].mean()
+        pd_c = centered(cultural_values['PD_Score'])
+        ua_c = centered(cultural_values['UA_Score'])
+        coll_c = centered(cultural_values['Collectivism_Score'])
+        lto_c = centered(cultural_values['LTO_Score'])
         
         # Center LRAIT dimensions
-        tc_c = dimension_scores['TC_Score'] - dimension_scores['TC_Score'].mean()
-        cmc_c = dimension_scores['CMC_Score'] - dimension_scores['CMC_Score'].mean()
-        ea_c = dimension_scores['EA_Score'] - dimension_scores['EA_Score'].mean()
-        alo_c = dimension_scores['ALO_Score'] - dimension_scores['ALO_Score'].mean()
+        tc_c = centered(dimension_scores['TC_Score'])
+        cmc_c = centered(dimension_scores['CMC_Score'])
+        ea_c = centered(dimension_scores['EA_Score'])
+        alo_c = centered(dimension_scores['ALO_Score'])
         
         # Base regression coefficients from Table 4.7
         outcome_score = (
             1.2 +
-            0.26 * dimension_scores['TC_Score'] +
-            0.33 * dimension_scores['CMC_Score'] +
-            0.17 * dimension_scores['EA_Score'] +
-            0.26 * dimension_scores['ALO_Score']
+            0.26 * dimension_scores['TC_Score'].values +
+            0.33 * dimension_scores['CMC_Score'].values +
+            0.17 * dimension_scores['EA_Score'].values +
+            0.26 * dimension_scores['ALO_Score'].values
         )
         
-        # ADD MODERATION EFFECTS (Table 4.9)
+        # ADD MODERATION EFFECTS (Table 4.9 defaults in INTERACTION_EFFECTS)
+        effects = self.interaction_effects
         # 1. TC × PD: β = -.16 (negative moderation)
-        outcome_score += -0.16 * tc_c * pd_c
+        outcome_score += effects['TC_x_PD'] * (tc_c * pd_c).values
         
         # 2. CMC × UA: β = .19 (positive moderation)
-        outcome_score += 0.19 * cmc_c * ua_c
+        outcome_score += effects['CMC_x_UA'] * (cmc_c * ua_c).values
         
         # 3. EA × Coll: β = .14 (positive moderation)
-        outcome_score += 0.14 * ea_c * coll_c
+        outcome_score += effects['EA_x_Coll'] * (ea_c * coll_c).values
         
         # 4. ALO × LTO: β = .17 (positive moderation)
-        outcome_score += 0.17 * alo_c * lto_c
+        outcome_score += effects['ALO_x_LTO'] * (alo_c * lto_c).values
         
         # Position effects
         position_effect = np.where(demographics['Position_Level'].str.contains('Department'), 0.25, 0)
         position_effect += np.where(demographics['Position_Level'].str.contains('Senior|Executive'), 0.50, 0)
         outcome_score += position_effect
         
-        outcome_score += np.random.normal(0, 0.30, n)
+        outcome_score += self.rng.normal(0, 0.30, n)
         outcome_score = np.clip(outcome_score, 1, 7)
         
         # Country differences from Table 4.6
-        country_boost = 0.20 if country == 'Vietnam' else 0
+        country_boost = self.country_parameter(country_idx, lambda s: s.get('outcome_boost', 0.0))
         
         # Generate three outcome types with different patterns
-        oi_base = outcome_score + np.random.normal(country_boost, 0.28, n)
-        sa_base = outcome_score - 0.35 + np.random.normal(country_boost, 0.30, n)
-        ol_base = outcome_score + 0.10 + np.random.normal(country_boost + 0.25, 0.27, n)
+        bases = [outcome_score + subscale['shift'] + self.rng.normal(country_boost, subscale['sd'], n)
+                 for subscale in OUTCOME_SUBSCALES.values()]
         
-        oi_base = np.clip(oi_base, 1, 7)
-        sa_base = np.clip(sa_base, 1, 7)
-        ol_base = np.clip(ol_base, 1, 7)
+        # Generate outcome items based on base scores (n x 12 latent matrix)
+        outcome_cols = [f'{prefix}{i}' for prefix in OUTCOME_SUBSCALES for i in range(1, 5)]
+        bases = np.repeat(np.column_stack(bases), 4, axis=1)
+        latent = bases + self.rng.normal(0, OUTCOME_ITEM_ERROR_SD, (n, len(outcome_cols)))
         
-        # Generate outcome items based on base scores
-        outcome_items = {}
-        for i in range(1, 5):
-            outcome_items[f'OI{i}'] = np.clip(oi_base + np.random.normal(0, 0.35, n), 1, 7).round()
-            outcome_items[f'SA{i}'] = np.clip(sa_base + np.random.normal(0, 0.35, n), 1, 7).round()
-            outcome_items[f'OL{i}'] = np.clip(ol_base + np.random.normal(0, 0.35, n), 1, 7).round()
-        
-        outcome_df = pd.DataFrame(outcome_items)
+        if thresholds is None:
+            thresholds = self.outcome_item_thresholds()
+        outcome_df = pd.DataFrame(self.discretize_likert(latent, thresholds), columns=outcome_cols)
         
         # RECALCULATE outcome scores as mean of items
         outcome_df['OI_Score'] = outcome_df[[f'OI{i}' for i in range(1, 5)]].mean(axis=1).round(2)
@@ -297,28 +584,25 @@ class DissertationDataGenerator:
         """Generate cultural values for moderation analysis"""
         
         n = len(demographics)
-        country = demographics['Country'].iloc[0]
+        country_idx = self.country_index(demographics['Country'])
         
-        if country == 'Japan':
-            pd_mean, ua_mean = 4.2, 5.8
-            coll_mean, lto_mean = 5.1, 6.2
-        else:  # Vietnam
-            pd_mean, ua_mean = 5.0, 4.0
-            coll_mean, lto_mean = 5.8, 5.5
+        def cultural_mean(dim):
+            return self.country_parameter(country_idx, lambda s: s['cultural_means'][dim])
         
         # Use larger SDs for more variation (needed for moderation detection)
-        pd_scores = np.clip(np.random.normal(pd_mean, 1.3, n), 1, 7)
-        ua_scores = np.clip(np.random.normal(ua_mean, 1.2, n), 1, 7)
-        coll_scores = np.clip(np.random.normal(coll_mean, 1.1, n), 1, 7)
-        lto_scores = np.clip(np.random.normal(lto_mean, 1.2, n), 1, 7)
+        sds = self.shared['cultural_sds']
+        pd_scores = np.clip(self.rng.normal(cultural_mean('PD'), sds['PD']), 1, 7)
+        ua_scores = np.clip(self.rng.normal(cultural_mean('UA'), sds['UA']), 1, 7)
+        coll_scores = np.clip(self.rng.normal(cultural_mean('Collectivism'), sds['Collectivism']), 1, 7)
+        lto_scores = np.clip(self.rng.normal(cultural_mean('LTO'), sds['LTO']), 1, 7)
         
         # Generate items based on dimension scores
         cultural_items = {}
         for i in range(1, 4):
-            cultural_items[f'PD{i}'] = np.clip(pd_scores + np.random.normal(0, 0.5, n), 1, 7).round()
-            cultural_items[f'UA{i}'] = np.clip(ua_scores + np.random.normal(0, 0.5, n), 1, 7).round()
-            cultural_items[f'IC{i}'] = np.clip(coll_scores + np.random.normal(0, 0.5, n), 1, 7).round()
-            cultural_items[f'LTO{i}'] = np.clip(lto_scores + np.random.normal(0, 0.5, n), 1, 7).round()
+            cultural_items[f'PD{i}'] = np.clip(pd_scores + self.rng.normal(0, 0.5, n), 1, 7).round()
+            cultural_items[f'UA{i}'] = np.clip(ua_scores + self.rng.normal(0, 0.5, n), 1, 7).round()
+            cultural_items[f'IC{i}'] = np.clip(coll_scores + self.rng.normal(0, 0.5, n), 1, 7).round()
+            cultural_items[f'LTO{i}'] = np.clip(lto_scores + self.rng.normal(0, 0.5, n), 1, 7).round()
         
         cultural_df = pd.DataFrame(cultural_items)
         
@@ -330,22 +614,386 @@ class DissertationDataGenerator:
         
         return cultural_df
     
-    def generate_complete_dataset(self, output_dir='research_data'):
-        """Generate all datasets"""
+    # ------------------------------------------------------------------
+    # CALIBRATION MODE: hit target statistics by construction
+    # ------------------------------------------------------------------
+    
+    def default_calibration_targets(self):
+        """Calibration targets assembled from the registry (dissertation Tables 4.2-4.13)"""
         
-        print("="*70)
-        print("GENERATING DISSERTATION-MATCHED DATA")
-        print("="*70)
+        shared = self.shared.get('calibration', {})
+        targets = {}
         
-        os.makedirs(output_dir, exist_ok=True)
+        for country, spec in self.countries.items():
+            if 'calibration' not in spec:
+                continue
+            
+            quantitative = spec['quantitative']
+            targets[country] = {
+                'means': spec['lrait']['means'],
+                'sds': spec['lrait']['sds'],
+                'correlation': spec.get('lrait_correlation', self.shared['lrait_correlation']),
+                'control_betas': shared.get('control_betas', {}),
+                'interactions': shared.get('interactions', {}),
+                'margins': {
+                    'Gender': {'Male': quantitative['male_pct'], 'Female': 1 - quantitative['male_pct']},
+                    'Position_Level': quantitative['position'],
+                    'Industry': spec['industry']
+                }
+            }
+            targets[country].update(spec['calibration'])
         
-        # Generate quantitative data
-        print("\n1. Generating quantitative survey data...")
-        datasets = []
+        return targets
+    
+    def whiten(self, draws):
+        """Center draws and re-whiten them so their sample covariance is exactly the identity"""
+        centered = draws - draws.mean(axis=0)
+        L = np.linalg.cholesky(np.cov(centered, rowvar=False))
+        return np.linalg.solve(L, centered.T).T
+    
+    def largest_remainder(self, probs, n):
+        """Round n * probs to integer counts that sum exactly to n"""
+        raw = np.asarray(probs, dtype=float) / np.sum(probs) * n
+        counts = np.floor(raw).astype(int)
+        shortfall = n - counts.sum()
+        counts[np.argsort(-(raw - counts), kind='stable')[:shortfall]] += 1
+        return counts
+    
+    def fit_categorical_margins(self, demographics, margins, max_iter=100, tol=1e-8):
+        """
+        Iterative proportional fitting of the joint categorical table to target margins,
+        then integerize and reassign as few rows as possible
+        """
+        
+        n = len(demographics)
+        cols = list(margins.keys())
+        levels = [list(margins[col].keys()) for col in cols]
+        target_counts = [self.largest_remainder(list(margins[col].values()), n) for col in cols]
+        
+        codes = np.column_stack([
+            pd.Categorical(demographics[col], categories=lv).codes for col, lv in zip(cols, levels)
+        ])
+        shape = tuple(len(lv) for lv in levels)
+        
+        # Seed with the observed joint table (smoothed so empty cells can receive mass)
+        observed = np.zeros(shape)
+        valid = (codes >= 0).all(axis=1)
+        np.add.at(observed, tuple(codes[valid].T), 1)
+        table = observed + 0.5
+        
+        # Step 1: IPF over all margins
+        for _ in range(max_iter):
+            for axis, target in enumerate(target_counts):
+                other = tuple(a for a in range(len(cols)) if a != axis)
+                current = table.sum(axis=other)
+                expand = [1] * len(cols)
+                expand[axis] = -1
+                table *= (target / current).reshape(expand)
+            worst = max(
+                np.abs(table.sum(axis=tuple(a for a in range(len(cols)) if a != axis)) - target).max()
+                for axis, target in enumerate(target_counts)
+            )
+            if worst < tol:
+                break
+        
+        # Step 2: integerize cells while keeping every margin exact
+        fitted = np.floor(table).astype(int)
+        deficits = [
+            target - fitted.sum(axis=tuple(a for a in range(len(cols)) if a != axis))
+            for axis, target in enumerate(target_counts)
+        ]
+        order = np.argsort(-(table - fitted).ravel(), kind='stable')
+        for _ in range(2):
+            for flat in order:
+                cell = np.unravel_index(flat, shape)
+                if all(deficits[a][cell[a]] > 0 for a in range(len(cols))):
+                    fitted[cell] += 1
+                    for a in range(len(cols)):
+                        deficits[a][cell[a]] -= 1
+        
+        # Step 3: keep rows already in a cell with spare capacity, move the rest
+        cell_ids = np.full(n, -1)
+        cell_ids[valid] = np.ravel_multi_index(tuple(codes[valid].T), shape)
+        rank = pd.Series(cell_ids).groupby(cell_ids).cumcount().values
+        capacity = fitted.ravel()
+        keep = (cell_ids >= 0) & (rank < capacity[np.maximum(cell_ids, 0)])
+        
+        kept_counts = np.bincount(cell_ids[keep], minlength=capacity.size)
+        free_slots = np.repeat(np.arange(capacity.size), np.maximum(capacity - kept_counts, 0))
+        self.rng.shuffle(free_slots)
+        
+        new_ids = cell_ids.copy()
+        moved = np.flatnonzero(~keep)
+        new_ids[moved[:len(free_slots)]] = free_slots[:len(moved)]
+        
+        new_codes = np.unravel_index(new_ids, shape)
+        fitted_demographics = demographics.copy()
+        for col, lv, col_codes in zip(cols, levels, new_codes):
+            fitted_demographics[col] = np.asarray(lv, dtype=object)[col_codes]
+        
+        return fitted_demographics
+    
+    def build_calibrated_items(self, base_draws, error_draws, means, sds, correlation, alphas):
+        """Turn whitened draws into 1-7 Likert items whose composites have the requested moments"""
+        
+        k = 8
+        dims = ['TC', 'CMC', 'EA', 'ALO']
+        alphas = np.clip(alphas, 0.05, 0.99)
         
-        for country, n in [('Japan', self.japan_quant_n), ('Vietnam', self.vietnam_quant_n)]:
-            demographics = self.generate_demographics(country, n, is_qualitative=False)
+        # Parallel items: alpha = k*rho / (1 + (k-1)*rho)
+        rho = alphas / (k - (k - 1) * alphas)
+        true_sd = sds / np.sqrt(1 + (1 - rho) / (rho * k))
+        error_sd = true_sd * np.sqrt((1 - rho) / rho)
+        
+        # Composite correlations are attenuated by reliability
+        true_corr = correlation / np.sqrt(np.outer(alphas, alphas))
+        np.fill_diagonal(true_corr, 1.0)
+        eigvals, eigvecs = np.linalg.eigh(true_corr)
+        if eigvals.min() < 1e-6:
+            true_corr = eigvecs @ np.diag(np.maximum(eigvals, 1e-6)) @ eigvecs.T
+            d = np.sqrt(np.diag(true_corr))
+            true_corr = true_corr / np.outer(d, d)
+        
+        true_scores = base_draws @ np.linalg.cholesky(true_corr).T * true_sd + means
+        
+        items = {}
+        for d_idx, dim in enumerate(dims):
+            errors = error_draws[:, d_idx * k:(d_idx + 1) * k] * error_sd[d_idx]
+            item_block = np.clip(np.round(true_scores[:, [d_idx]] + errors), 1, 7)
+            for item_num in range(k):
+                items[f'{dim}{item_num + 1}'] = item_block[:, item_num]
+        
+        items_df = pd.DataFrame(items)
+        dimension_scores = pd.DataFrame({
+            f'{dim}_Score': items_df[[f'{dim}{i}' for i in range(1, k + 1)]].mean(axis=1)
+            for dim in dims
+        })
+        return items_df, dimension_scores
+    
+    def generate_calibrated_items(self, demographics, targets):
+        """Generate LRAIT items whose composite means, SDs, correlations and alphas meet targets"""
+        
+        n = len(demographics)
+        dims = ['TC', 'CMC', 'EA', 'ALO']
+        tol = self.calibration_tolerance
+        
+        target_means = np.array([targets['means'][d] for d in dims])
+        target_sds = np.array([targets['sds'][d] for d in dims])
+        target_corr = np.array(targets['correlation'], dtype=float)
+        target_alphas = np.array([targets['alphas'][d] for d in dims])
+        
+        # Raw draws carry the demographic effects, then are jointly re-whitened so the
+        # four true scores and 32 item errors are exactly uncorrelated in the sample
+        raw = self.rng.normal(0, 1, (n, 4 + 32))
+        age_z = (demographics['Age'] - demographics['Age'].mean()) / demographics['Age'].std()
+        raw[:, 0] += -0.15 * age_z.values
+        raw[:, 1] += np.where(demographics['Position_Level'].str.contains('Department'), 0.15, 0)
+        raw[:, 1] += np.where(demographics['Position_Level'].str.contains('Senior|Executive'), 0.30, 0)
+        whitened = self.whiten(raw)
+        base_draws, error_draws = whitened[:, :4], whitened[:, 4:]
+        
+        # Refine the latent targets on the SAME draws to absorb Likert rounding and clipping
+        means, sds = target_means.copy(), target_sds.copy()
+        corr, alphas = target_corr.copy(), target_alphas.copy()
+        
+        for _ in range(self.calibration_iterations):
+            items_df, dimension_scores = self.build_calibrated_items(
+                base_draws, error_draws, means, sds, corr, alphas
+            )
+            achieved = self.lrait_statistics(items_df, dimension_scores)
             
+            mean_gap = target_means - achieved['means']
+            sd_ratio = target_sds / achieved['sds']
+            corr_gap = target_corr - achieved['correlation']
+            alpha_gap = target_alphas - achieved['alphas']
+            
+            if (np.abs(mean_gap).max() < tol['mean'] and np.abs(target_sds - achieved['sds']).max() < tol['sd']
+                    and np.abs(corr_gap).max() < tol['corr'] and np.abs(alpha_gap).max() < tol['alpha']):
+                break
+            
+            means = means + mean_gap
+            sds = sds * sd_ratio
+            corr = corr + corr_gap
+            alphas = alphas + alpha_gap
+        
+        return items_df, dimension_scores
+    
+    def lrait_statistics(self, items_df, dimension_scores):
+        """Composite means, SDs, correlations and Cronbach's alphas of the LRAIT block"""
+        
+        dims = ['TC', 'CMC', 'EA', 'ALO']
+        alphas = []
+        for dim in dims:
+            block = items_df[[f'{dim}{i}' for i in range(1, 9)]].values
+            total_var = block.sum(axis=1).var(ddof=1)
+            alphas.append(8 / 7 * (1 - block.var(axis=0, ddof=1).sum() / total_var))
+        
+        scores = dimension_scores[[f'{dim}_Score' for dim in dims]].values
+        return {
+            'means': scores.mean(axis=0),
+            'sds': scores.std(axis=0, ddof=1),
+            'correlation': np.corrcoef(scores, rowvar=False),
+            'alphas': np.array(alphas)
+        }
+    
+    def regression_design(self, dimension_scores, demographics):
+        """Step 2 design of the hierarchical regression (controls + readiness dimensions)"""
+        return pd.DataFrame({
+            'Age': demographics['Age'].values,
+            'Gender_Male': (demographics['Gender'] == 'Male').astype(int).values,
+            'Position_Dept': (demographics['Position_Level'] == 'Department Head').astype(int).values,
+            'Position_Senior': (demographics['Position_Level'] == 'Senior Executive').astype(int).values,
+            'Org_Size_Numeric': demographics['Org_Size_Numeric'].values,
+            'TC': dimension_scores['TC_Score'].values,
+            'CMC': dimension_scores['CMC_Score'].values,
+            'EA': dimension_scores['EA_Score'].values,
+            'ALO': dimension_scores['ALO_Score'].values
+        })
+    
+    def standardized_betas(self, design, y):
+        """Standardized OLS coefficients of y on the design"""
+        Z = ((design - design.mean()) / design.std()).values
+        y_std = (y - y.mean()) / y.std()
+        coefs, _, _, _ = np.linalg.lstsq(np.column_stack([np.ones(len(Z)), Z]), y_std, rcond=None)
+        return pd.Series(coefs[1:], index=design.columns)
+    
+    def build_calibrated_outcomes(self, y_std, subscale_noise, item_noise, mean, sd, offsets):
+        """Turn a standardized latent outcome into OI/SA/OL items whose overall mean equals the latent"""
+        
+        overall = mean + sd * y_std
+        
+        # Row-centered deviations so mean(OI, SA, OL) == overall before rounding
+        offset_vec = np.array([offsets['OI'], offsets['SA'], offsets['OL']])
+        deviations = subscale_noise + (offset_vec - offset_vec.mean())
+        deviations = deviations - deviations.mean(axis=1, keepdims=True)
+        
+        outcome_items = {}
+        for s_idx, prefix in enumerate(['OI', 'SA', 'OL']):
+            base = overall + deviations[:, s_idx]
+            noise = item_noise[:, s_idx * 4:(s_idx + 1) * 4]
+            noise = noise - noise.mean(axis=1, keepdims=True)
+            block = np.clip(np.round(base[:, None] + noise), 1, 7)
+            for i in range(4):
+                outcome_items[f'{prefix}{i + 1}'] = block[:, i]
+        
+        outcome_df = pd.DataFrame(outcome_items)
+        outcome_df['OI_Score'] = outcome_df[[f'OI{i}' for i in range(1, 5)]].mean(axis=1).round(2)
+        outcome_df['SA_Score'] = outcome_df[[f'SA{i}' for i in range(1, 5)]].mean(axis=1).round(2)
+        outcome_df['OL_Score'] = outcome_df[[f'OL{i}' for i in range(1, 5)]].mean(axis=1).round(2)
+        outcome_df['Overall_Success'] = outcome_df[['OI_Score', 'SA_Score', 'OL_Score']].mean(axis=1).round(2)
+        
+        return outcome_df
+    
+    def generate_calibrated_outcomes(self, dimension_scores, demographics, cultural_values, targets):
+        """Generate outcomes whose Step 2 standardized betas, mean and SD meet targets"""
+        
+        n = len(dimension_scores)
+        tol = self.calibration_tolerance
+        
+        design = self.regression_design(dimension_scores, demographics)
+        Z = ((design - design.mean()) / design.std()).values
+        C = np.corrcoef(Z, rowvar=False)
+        
+        target_betas = pd.Series(targets['control_betas']).reindex(design.columns).fillna(0)
+        for dim, beta in targets['betas'].items():
+            target_betas[dim] = beta
+        target_betas = target_betas.values
+        
+        # Moderation terms and random noise, made exactly orthogonal to the Step 2 design
+        def centered(values):
+            return values - values.mean()
+        
+        interactions = targets.get('interactions', {})
+        moderation = (
+            interactions.get('TC_x_PD', 0) * centered(design['TC'].values) * centered(cultural_values['PD_Score'].values) +
+            interactions.get('CMC_x_UA', 0) * centered(design['CMC'].values) * centered(cultural_values['UA_Score'].values) +
+            interactions.get('EA_x_Coll', 0) * centered(design['EA'].values) * centered(cultural_values['Collectivism_Score'].values) +
+            interactions.get('ALO_x_LTO', 0) * centered(design['ALO'].values) * centered(cultural_values['LTO_Score'].values)
+        ) / targets['outcome_sd']
+        residual = moderation + self.rng.normal(0, 0.5, n)
+        
+        X = np.column_stack([np.ones(n), Z])
+        residual = residual - X @ np.linalg.lstsq(X, residual, rcond=None)[0]
+        residual = residual / residual.std(ddof=1)
+        
+        subscale_noise = self.rng.normal(0, 0.28, (n, 3))
+        item_noise = self.rng.normal(0, 0.35, (n, 12))
+        
+        betas = target_betas.copy()
+        mean, sd = targets['outcome_mean'], targets['outcome_sd']
+        
+        for _ in range(self.calibration_iterations):
+            # Var(y_std) = 1  ->  residual variance is 1 - b'Cb
+            explained = float(betas @ C @ betas)
+            y_std = Z @ betas + residual * np.sqrt(max(1 - explained, 0.01))
+            y_std = (y_std - y_std.mean()) / y_std.std(ddof=1)
+            
+            outcome_df = self.build_calibrated_outcomes(
+                y_std, subscale_noise, item_noise, mean, sd, targets['outcome_offsets']
+            )
+            
+            y = outcome_df['Overall_Success']
+            achieved = self.standardized_betas(design, y).values
+            beta_gap = target_betas - achieved
+            mean_gap = targets['outcome_mean'] - y.mean()
+            sd_ratio = targets['outcome_sd'] / y.std()
+            
+            if (np.abs(beta_gap).max() < tol['beta'] and abs(mean_gap) < tol['mean']
+                    and abs(targets['outcome_sd'] - y.std()) < tol['sd']):
+                break
+            
+            betas = betas + beta_gap
+            mean = mean + mean_gap
+            sd = sd * sd_ratio
+        
+        return outcome_df
+    
+    def calibration_summary(self, country_data, targets):
+        """Compare achieved statistics with calibration targets for one country"""
+        
+        dims = ['TC', 'CMC', 'EA', 'ALO']
+        items_df = country_data[[f'{dim}{i}' for dim in dims for i in range(1, 9)]]
+        dimension_scores = country_data[[f'{dim}_Score' for dim in dims]]
+        achieved = self.lrait_statistics(items_df, dimension_scores)
+        
+        design = self.regression_design(dimension_scores, country_data)
+        betas = self.standardized_betas(design, country_data['Overall_Success'])
+        
+        target_corr = np.array(targets['correlation'])
+        iu = np.triu_indices(4, k=1)
+        
+        summary = {
+            'max_abs_mean_error': float(np.abs(achieved['means'] - [targets['means'][d] for d in dims]).max()),
+            'max_abs_sd_error': float(np.abs(achieved['sds'] - [targets['sds'][d] for d in dims]).max()),
+            'max_abs_corr_error': float(np.abs(achieved['correlation'] - target_corr)[iu].max()),
+            'max_abs_alpha_error': float(np.abs(achieved['alphas'] - [targets['alphas'][d] for d in dims]).max()),
+            'max_abs_beta_error': float(max(abs(betas[d] - targets['betas'][d]) for d in dims)),
+            'outcome_mean_error': float(country_data['Overall_Success'].mean() - targets['outcome_mean']),
+            'outcome_sd_error': float(country_data['Overall_Success'].std() - targets['outcome_sd'])
+        }
+        
+        tol = self.calibration_tolerance
+        summary['within_tolerance'] = bool(
+            summary['max_abs_mean_error'] < tol['mean'] and summary['max_abs_sd_error'] < tol['sd']
+            and summary['max_abs_corr_error'] < tol['corr'] and summary['max_abs_alpha_error'] < tol['alpha']
+            and summary['max_abs_beta_error'] < tol['beta']
+        )
+        return summary
+    
+    def generate_survey_panel(self, country_sizes=None, first_ids=None):
+        """
+        Generate the quantitative panel for every registry country in one vectorized pass
+        (first_ids: first participant number per country, see generate_participant_ids)
+        """
+        
+        if country_sizes is None:
+            country_sizes = {country: spec['quant_n'] for country, spec in self.countries.items()}
+        
+        demographics = self.generate_demographics(country_sizes, is_qualitative=False)
+        
+        if self.calibration_targets:
+            quant_data = self.generate_calibrated_panel(demographics)
+        else:
             # Generate initial dimension scores (targets)
             target_dimension_scores = self.generate_lrait_scores(demographics)
             
@@ -356,144 +1004,715 @@ class DissertationDataGenerator:
             cultural_values = self.generate_cultural_values(demographics)
             outcome_scores = self.generate_outcome_scores(dimension_scores, demographics, cultural_values)
             
-            country_data = pd.concat([
+            quant_data = pd.concat([
                 demographics.reset_index(drop=True),
                 dimension_scores.reset_index(drop=True),
                 item_scores.reset_index(drop=True),
                 outcome_scores.reset_index(drop=True),
                 cultural_values.reset_index(drop=True)
             ], axis=1)
-            
-            base_date = datetime(2025, 9, 1)
-            country_data['Survey_Date'] = [
-                (base_date + timedelta(days=np.random.randint(0, 120))).strftime('%Y-%m-%d')
-                for _ in range(n)
-            ]
-            
-            datasets.append(country_data)
         
-        quant_data = pd.concat(datasets, ignore_index=True)
+        if self.careless:
+            quant_data = self.inject_careless(quant_data)
+        
+        if self.missingness:
+            quant_data = self.inject_missingness(quant_data)
+        
+        base_date = pd.Timestamp(2025, 9, 1)
+        day_offsets = pd.to_timedelta(self.rng.randint(0, 120, len(quant_data)), unit='D')
+        quant_data['Survey_Date'] = (base_date + day_offsets).strftime('%Y-%m-%d')
         
         # Add participant IDs at the beginning
-        participant_ids = []
-        for idx, row in quant_data.iterrows():
-            country_code = 'JP' if row['Country'] == 'Japan' else 'VN'
-            sequence = idx + 1 if row['Country'] == 'Japan' else idx - self.japan_quant_n + 1
-            participant_ids.append(self.generate_participant_id(country_code, sequence, 'QUANT'))
+        quant_data.insert(0, 'Participant_ID', self.generate_participant_ids(quant_data['Country'], 'QUANT', first_ids))
         
-        quant_data.insert(0, 'Participant_ID', participant_ids)
+        return quant_data
+    
+    # ------------------------------------------------------------------
+    # MISSINGNESS: item nonresponse under MCAR, MAR or MNAR
+    # ------------------------------------------------------------------
+    
+    def logistic_intercepts(self, linear, rate, max_iter=50, tol=1e-10):
+        """Per-column intercepts giving a mean response-model probability of rate (vectorized Newton)"""
+        intercepts = np.full(linear.shape[1], np.log(rate / (1 - rate)))
+        for _ in range(max_iter):
+            prob = expit(intercepts + linear)
+            step = (prob.mean(axis=0) - rate) / np.maximum((prob * (1 - prob)).mean(axis=0), 1e-12)
+            intercepts -= step
+            if np.abs(step).max() < tol:
+                break
+        return intercepts
+    
+    def missingness_linear(self, panel, values, mechanism, strength, mar_weights):
+        """
+        Linear predictor of the missingness logit for every cell of the item block.
+        MCAR: constant. MAR: a standardized demographic index (observed covariates).
+        MNAR: the item's own standardized value (low responses are skipped more).
+        """
+        
+        n, p = values.shape
+        if mechanism == 'MCAR':
+            return np.zeros((n, p))
+        
+        if mechanism == 'MAR':
+            covariates = {
+                'Age': panel['Age'].values.astype(float),
+                'Gender_Male': (panel['Gender'] == 'Male').values.astype(float),
+                'Position_Dept': (panel['Position_Level'] == 'Department Head').values.astype(float),
+                'Position_Senior': (panel['Position_Level'] == 'Senior Executive').values.astype(float)
+            }
+            index = sum(weight * covariates[name] for name, weight in mar_weights.items())
+            index = (index - index.mean()) / (index.std() or 1.0)
+            return np.repeat(strength * index[:, None], p, axis=1)
         
-        # REORGANIZE COLUMNS IN SPECIFIED ORDER
-        column_order = [
-            # 1. ID and Demographics
-            'Participant_ID', 'Country', 'Age', 'Gender', 'Position_Level', 
-            'Tenure_Years', 'Education', 'Industry', 'Org_Size_Category', 'Org_Size_Numeric',
+        z = (values - values.mean(axis=0)) / np.where(values.std(axis=0) > 0, values.std(axis=0), 1.0)
+        return -strength * z
+    
+    def composite_rules(self):
+        """Composite columns and their items, in schema order"""
+        return [(rule['column'], rule['items']) for rule in self.schema['rules'] if rule['rule'] == 'composite']
+    
+    def rescore_composites(self, panel, min_items=0.5):
+        """
+        Recompute every composite in place from its items: the mean of answered items
+        while at least min_items of the scale is answered, otherwise NaN
+        (LRAIT scores unrounded, others to 2 decimals). Composites of other composites
+        (Overall_Success) are then the mean of the rescored subscales, as when generated.
+        """
+        unrounded = set(self.schema_group('LRAIT Scores'))
+        rules = self.composite_rules()
+        composites = {column for column, _ in rules}
+        
+        # Item scales first (schema order), then the composites of composites
+        for column, scale_items in sorted(rules, key=lambda rule: set(rule[1]) <= composites):
+            if set(scale_items) <= composites:
+                score = panel[scale_items].mean(axis=1)
+            else:
+                answered = panel[scale_items].notna().mean(axis=1)
+                score = panel[scale_items].mean(axis=1).where(answered >= min_items)
+            panel[column] = score if column in unrounded else score.round(2)
+    
+    def inject_missingness(self, panel):
+        """
+        Mask item responses with a vectorized logistic response model (self.missingness)
+        and rescore every composite from the answered items: the mean of answered
+        items while at least min_items of the scale is answered, otherwise NaN.
+        """
+        
+        config = self.missingness
+        items = [col for block in config['blocks'] for col in self.schema_group(block)]
+        values = panel[items].values.astype(float)
+        
+        linear = self.missingness_linear(panel, values, config['mechanism'], config['strength'],
+                                         config['mar_weights'])
+        intercepts = self.logistic_intercepts(linear, config['rate'])
+        mask = self.rng.random(values.shape) < expit(intercepts + linear)
+        
+        panel = panel.copy()
+        panel[items] = np.where(mask, np.nan, values)
+        self.rescore_composites(panel, config['min_items'])
+        self.missingness_report = self.missingness_summary(panel)
+        return panel
+    
+    def missingness_summary(self, panel):
+        """Realized item nonresponse of a panel (masked cells are the only missing items)"""
+        
+        config = self.missingness
+        items = [col for block in config['blocks'] for col in self.schema_group(block)]
+        mask = panel[items].isna().values
+        return {
+            'mechanism': config['mechanism'],
+            'target_rate': config['rate'],
+            'realized_rate': float(mask.mean()),
+            'by_block': {block: float(panel[self.schema_group(block)].isna().values.mean())
+                         for block in config['blocks']},
+            'rows_with_missing_items': int(mask.any(axis=1).sum()),
+            'code': config['code']
+        }
+    
+    def inject_careless(self, panel):
+        """
+        Replace the item responses of a random share of respondents by careless
+        patterns (self.careless) and rescore their composites. The pattern of every
+        row ('' for attentive respondents) is kept in self.careless_types.
+        """
+        
+        config = self.careless
+        blocks = [self.schema_group(block) for block in config['blocks']]
+        items = [col for block in blocks for col in block]
+        n = len(panel)
+        
+        # Careless respondents and their pattern, drawn in one pass
+        types = list(config['types'])
+        weights = np.array([config['types'][name] for name in types], dtype=float)
+        careless = self.rng.random(n) < config['rate']
+        pattern = self.rng.choice(len(types), size=n, p=weights / weights.sum())
+        row_types = np.where(careless, np.asarray(types, dtype=object)[pattern], '')
+        
+        values = panel[items].values.copy()
+        likert = next(rule for rule in self.schema['rules'] if rule['rule'] == 'likert')
+        low, high = likert['min'], likert['max']
+        
+        if 'straightline' in types:
+            # One answer per respondent and item block
+            block_ids = np.repeat(np.arange(len(blocks)), [len(block) for block in blocks])
+            block_answers = self.rng.randint(low, high + 1, size=(n, len(blocks)))
+            rows = row_types == 'straightline'
+            values[rows] = block_answers[rows][:, block_ids]
+        
+        if 'random' in types:
+            rows = row_types == 'random'
+            values[rows] = self.rng.randint(low, high + 1, size=(rows.sum(), len(items)))
+        
+        panel = panel.copy()
+        panel[items] = values
+        self.rescore_composites(panel)
+        self.careless_types = row_types
+        return panel
+    
+    def with_missing_code(self, panel):
+        """Copy of the panel with missing item responses written as the sentinel code"""
+        panel = panel.copy()
+        items = [col for block in self.missingness['blocks'] for col in self.schema_group(block)]
+        panel[items] = panel[items].fillna(self.missingness['code'])
+        return panel
+    
+    def link_keys(self, qual_ids, quant_ids):
+        """Masked keys shared by linked interview and survey records (the 2_link.py scheme)"""
+        return [f"LK_{hashlib.sha256(f'{qual_id}|{quant_id}'.encode()).hexdigest()[:12].upper()}"
+                for qual_id, quant_id in zip(qual_ids, quant_ids)]
+    
+    def sample_overlap(self, quant_data, overlap_sizes):
+        """
+        Stratified draw of the survey respondents who are also interviewed.
+        Each country's overlap is allocated to interview positions by its qualitative
+        position distribution, and every country x position stratum is filled without
+        replacement from compatible survey rows by random priority.
+        Returns (survey row positions, interview position of each).
+        """
+        
+        country = quant_data['Country'].values
+        level = quant_data['Position_Level'].values
+        priority = self.rng.random(len(quant_data))
+        taken = np.zeros(len(quant_data), dtype=bool)
+        rows, positions = [], []
+        
+        for country_name, n_overlap in overlap_sizes.items():
+            distribution = self.countries[country_name]['qualitative']['position']
+            counts = self.largest_remainder(list(distribution.values()), n_overlap)
             
-            # 2. LRAIT Dimension Scores
-            'TC_Score', 'CMC_Score', 'EA_Score', 'ALO_Score',
+            for position, k in zip(distribution, counts):
+                eligible = np.flatnonzero((country == country_name) & ~taken &
+                                          np.isin(level, INTERVIEW_POSITION_SOURCES[position]))
+                if k > len(eligible):
+                    raise ValueError(f"Only {len(eligible)} {country_name} survey respondents can fill "
+                                     f"{k} overlapping '{position}' interviews")
+                if k < len(eligible):
+                    eligible = eligible[np.argpartition(priority[eligible], k)[:k]]
+                taken[eligible] = True
+                rows.append(eligible)
+                positions.append(np.full(k, position, dtype=object))
+        
+        return np.concatenate(rows), np.concatenate(positions)
+    
+    def generate_interview_cohort(self, quant_data, qual_sizes=None):
+        """
+        Generate the qualitative (interview) cohort in one vectorized pass.
+        overlap_pct of each country's interviewees are survey respondents drawn by
+        stratified sampling: their demographics are copied and both records get a
+        Survey_Link_Key. The remaining interviewees are new participants.
+        Returns (interview metadata, link keys indexed by survey Participant_ID).
+        """
+        
+        if qual_sizes is None:
+            qual_sizes = {country: spec['qual_n'] for country, spec in self.countries.items()}
+        overlap_sizes = {country: int(round(self.overlap_pct * n)) for country, n in qual_sizes.items()}
+        
+        # Overlapping interviewees: copied from their survey records
+        rows, positions = self.sample_overlap(quant_data, overlap_sizes)
+        linked = quant_data.iloc[rows]
+        overlap = pd.DataFrame({
+            'Country': linked['Country'].values,
+            'Position': positions,
+            'Industry': linked['Industry'].values,
+            'Age': linked['Age'].values,
+            'Gender': linked['Gender'].values
+        })
+        
+        # New interviewees
+        new_sizes = {country: n - overlap_sizes[country] for country, n in qual_sizes.items()}
+        demographics = self.generate_demographics(new_sizes, is_qualitative=True)
+        fresh = demographics[['Country', 'Position_Level', 'Industry', 'Age', 'Gender']].rename(
+            columns={'Position_Level': 'Position'})
+        
+        # Shuffle overlapping and new interviewees together within each country
+        cohort = pd.concat([overlap, fresh], ignore_index=True)
+        survey_ids = np.concatenate([linked['Participant_ID'].values, np.full(len(fresh), None, dtype=object)])
+        order = np.lexsort((self.rng.random(len(cohort)), self.country_index(cohort['Country'])))
+        cohort = cohort.iloc[order].reset_index(drop=True)
+        survey_ids = survey_ids[order]
+        
+        n = len(cohort)
+        interview_ids = np.asarray(self.generate_participant_ids(cohort['Country'], 'QUAL'), dtype=object)
+        base_date = pd.Timestamp(2025, 9, 1)
+        day_offsets = pd.to_timedelta(self.rng.randint(0, 90, n), unit='D')
+        
+        is_linked = pd.notna(survey_ids)
+        link_keys = np.full(n, None, dtype=object)
+        link_keys[is_linked] = self.link_keys(interview_ids[is_linked], survey_ids[is_linked])
+        
+        qual_data = pd.DataFrame({
+            'Interview_ID': interview_ids,
+            'Country': cohort['Country'].values,
+            'Interview_Date': (base_date + day_offsets).strftime('%Y-%m-%d'),
+            'Position': cohort['Position'].values,
+            'Industry': cohort['Industry'].values,
+            'Age': cohort['Age'].values,
+            'Gender': cohort['Gender'].values,
+            'Interview_Duration_Min': self.rng.randint(55, 95, n),
+            'AI_Experience_Years': self.rng.randint(1, 6, n) + self.rng.choice([0, 0.5], n),
+            'Survey_Link_Key': link_keys
+        })
+        
+        return qual_data, pd.Series(link_keys[is_linked], index=survey_ids[is_linked], name='Survey_Link_Key')
+    
+    def generate_calibrated_panel(self, demographics):
+        """Calibration mode: exact margins, moments, alphas and betas by construction, per country"""
+        
+        datasets = []
+        
+        for country, country_demographics in demographics.groupby('Country', sort=False):
+            targets = self.calibration_targets.get(country)
+            if targets is None:
+                raise ValueError(f"No calibration targets for '{country}'")
             
-            # 3. LRAIT Items
-            'TC1', 'TC2', 'TC3', 'TC4', 'TC5', 'TC6', 'TC7', 'TC8',
-            'CMC1', 'CMC2', 'CMC3', 'CMC4', 'CMC5', 'CMC6', 'CMC7', 'CMC8',
-            'EA1', 'EA2', 'EA3', 'EA4', 'EA5', 'EA6', 'EA7', 'EA8',
-            'ALO1', 'ALO2', 'ALO3', 'ALO4', 'ALO5', 'ALO6', 'ALO7', 'ALO8',
+            country_demographics = country_demographics.reset_index(drop=True)
+            if 'margins' in targets:
+                country_demographics = self.fit_categorical_margins(country_demographics, targets['margins'])
+            item_scores, dimension_scores = self.generate_calibrated_items(country_demographics, targets)
+            cultural_values = self.generate_cultural_values(country_demographics)
+            outcome_scores = self.generate_calibrated_outcomes(
+                dimension_scores, country_demographics, cultural_values, targets
+            )
             
-            # 4. Outcome Scores
-            'OI_Score', 'SA_Score', 'OL_Score', 'Overall_Success',
+            country_data = pd.concat([
+                country_demographics, dimension_scores, item_scores, outcome_scores, cultural_values
+            ], axis=1)
+            
+            self.calibration_report[country] = self.calibration_summary(country_data, targets)
+            report = self.calibration_report[country]
+            status = "✓" if report['within_tolerance'] else "⚠"
+            print(f"   {status} {country} calibrated: |Δmean| ≤ {report['max_abs_mean_error']:.3f}, "
+                  f"|Δr| ≤ {report['max_abs_corr_error']:.3f}, |Δα| ≤ {report['max_abs_alpha_error']:.3f}, "
+                  f"|Δβ| ≤ {report['max_abs_beta_error']:.3f}")
             
-            # 5. Outcome Items
-            'OI1', 'OI2', 'OI3', 'OI4',
-            'SA1', 'SA2', 'SA3', 'SA4',
-            'OL1', 'OL2', 'OL3', 'OL4',
+            datasets.append(country_data)
+        
+        return pd.concat(datasets, ignore_index=True)
+    
+    # ------------------------------------------------------------------
+    # LONGITUDINAL PANEL: quarterly waves appended to a wave store
+    # ------------------------------------------------------------------
+    
+    def load_wave_manifest(self, store_dir):
+        """Manifest of a wave or shard store (None if the store has not been started)"""
+        path = os.path.join(store_dir, 'manifest.json')
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r') as f:
+            return json.load(f)
+    
+    def save_wave_manifest(self, store_dir, manifest):
+        """Replace the manifest atomically so an interrupted append leaves the store readable"""
+        path = os.path.join(store_dir, 'manifest.json')
+        with open(path + '.tmp', 'w') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(path + '.tmp', path)
+    
+    def write_wave_table(self, df, path, file_format):
+        """Write one store table (Parquet needs pyarrow or fastparquet)"""
+        if file_format == 'parquet':
+            df.to_parquet(path, index=False)
+        else:
+            df.to_csv(path, index=False)
+    
+    def read_wave_table(self, path, file_format):
+        """Read one store table"""
+        if file_format == 'parquet':
+            return pd.read_parquet(path)
+        return pd.read_csv(path)
+    
+    def generate_panel_participants(self, country_sizes=None):
+        """Wave-invariant participant records: baseline demographics and cultural values"""
+        
+        if country_sizes is None:
+            country_sizes = {country: spec['quant_n'] for country, spec in self.countries.items()}
+        
+        demographics = self.generate_demographics(country_sizes, is_qualitative=False)
+        cultural_values = self.generate_cultural_values(demographics)
+        
+        participants = pd.concat([demographics, cultural_values], axis=1)
+        participants.insert(0, 'Participant_ID', self.generate_participant_ids(participants['Country'], 'QUANT'))
+        return participants
+    
+    def generate_wave(self, participants, wave, state, manifest):
+        """
+        Generate one survey wave for every participant.
+        
+        LRAIT scores follow an AR(1) around each participant's expected profile:
+        deviation_t = phi * deviation_(t-1) + sqrt(1 - phi^2) * innovation, so the
+        cross-sectional distribution is the same in every wave while scores stay
+        autocorrelated within person. Returns the wave data and the new latent state.
+        """
+        
+        n = len(participants)
+        years = (wave - 1) * manifest['interval_days'] / 365.25
+        
+        demographic_cols = ['Country', 'Age', 'Gender', 'Position_Level', 'Tenure_Years',
+                            'Education', 'Industry', 'Org_Size_Category', 'Org_Size_Numeric']
+        demographics = participants[demographic_cols].copy()
+        demographics['Age'] = demographics['Age'] + int(years)
+        demographics['Tenure_Years'] = (demographics['Tenure_Years'] + years).round(1)
+        
+        cultural_values = participants[self.schema_group('Cultural Scores') + self.schema_group('Cultural Items')]
+        
+        # Expected LRAIT profile this wave (country means, demographic effects, optional trend)
+        country_idx = self.country_index(demographics['Country'])
+        means, sds, choleskys = self.lrait_parameters(country_idx)
+        expected = means + self.lrait_effects(demographics) + manifest['trend'] * (wave - 1)
+        
+        if state is None:
+            latent = self.generate_lrait_scores(demographics).values
+        else:
+            phi = manifest['autocorrelation']
+            innovation = np.einsum('nij,nj->ni', choleskys[country_idx], self.rng.normal(0, 1, (n, 4))) * sds
+            latent = expected + phi * state + np.sqrt(1 - phi ** 2) * innovation
+        
+        target_dimension_scores = pd.DataFrame(
+            np.clip(latent, 1, 7), columns=['TC_Score', 'CMC_Score', 'EA_Score', 'ALO_Score']
+        )
+        # Every wave is measured with the store's instrument, so item changes are true change
+        instrument = manifest['instrument']
+        item_scores, dimension_scores = self.generate_item_scores(
+            target_dimension_scores, instrument['loadings'], np.array(instrument['lrait_thresholds'])
+        )
+        outcome_scores = self.generate_outcome_scores(dimension_scores, demographics, cultural_values,
+                                                      np.array(instrument['outcome_thresholds']))
+        
+        wave_data = pd.concat([
+            participants[['Participant_ID']],
+            demographics,
+            dimension_scores,
+            item_scores,
+            outcome_scores,
+            cultural_values
+        ], axis=1)
+        
+        base_date = pd.Timestamp(manifest['base_date']) + pd.Timedelta(days=(wave - 1) * manifest['interval_days'])
+        day_offsets = pd.to_timedelta(self.rng.randint(0, 30, n), unit='D')
+        wave_data['Survey_Date'] = (base_date + day_offsets).strftime('%Y-%m-%d')
+        wave_data.insert(1, 'Wave', wave)
+        
+        return wave_data[['Participant_ID', 'Wave'] + self.survey_columns[1:]], latent - expected
+    
+    def generate_panel_waves(self, n_waves=4, store_dir='research_data/panel_waves', country_sizes=None,
+                             autocorrelation=0.7, trend=0.0, interval_days=91, seed=42, file_format='csv'):
+        """
+        Append n_waves quarterly waves to a longitudinal store (one file per wave).
+        
+        The first call creates the participant file and wave 1; later calls continue
+        from the last stored latent state. Each wave draws from its own stream seeded
+        by (seed, wave), so earlier waves are never regenerated and a store built in
+        several appends is identical to one built in a single call. Item loadings and
+        Likert thresholds are drawn once per store and kept in the manifest.
+        """
+        
+        os.makedirs(store_dir, exist_ok=True)
+        manifest = self.load_wave_manifest(store_dir)
+        
+        if manifest is None:
+            extension = 'parquet' if file_format == 'parquet' else 'csv'
+            manifest = {
+                'seed': seed,
+                'autocorrelation': autocorrelation,
+                'trend': trend,
+                'instrument': None,
+                'interval_days': interval_days,
+                'base_date': '2025-09-01',
+                'format': file_format,
+                'participants': f'participants.{extension}',
+                'n_participants': 0,
+                'waves': []
+            }
+        else:
+            # The store's own parameters win so appended waves continue the same process
+            print(f"   Appending to existing store {store_dir} ({len(manifest['waves'])} waves)")
+        
+        extension = manifest['participants'].rsplit('.', 1)[-1]
+        previous_rng = self.rng
+        
+        try:
+            if manifest.get('instrument') is None:
+                # Own stream, so the participant draws do not depend on the instrument
+                # (stores started without one get it for the waves they append)
+                self.rng = np.random.RandomState([manifest['seed'], 0, 1])
+                manifest['instrument'] = self.measurement_instrument()
+                self.save_wave_manifest(store_dir, manifest)
             
-            # 6. Cultural Value Scores
-            'PD_Score', 'UA_Score', 'Collectivism_Score', 'LTO_Score',
+            participants_path = os.path.join(store_dir, manifest['participants'])
+            if not os.path.exists(participants_path):
+                self.rng = np.random.RandomState([manifest['seed'], 0])
+                participants = self.generate_panel_participants(country_sizes)
+                self.write_wave_table(participants, participants_path, manifest['format'])
+                manifest['n_participants'] = len(participants)
+                self.save_wave_manifest(store_dir, manifest)
+            else:
+                participants = self.read_wave_table(participants_path, manifest['format'])
             
-            # 7. Cultural Value Items
-            'PD1', 'PD2', 'PD3',
-            'UA1', 'UA2', 'UA3',
-            'IC1', 'IC2', 'IC3',
-            'LTO1', 'LTO2', 'LTO3',
+            state = None
+            if manifest['waves']:
+                state = np.load(os.path.join(store_dir, manifest['waves'][-1]['state']))
             
-            # 8. Survey Date
-            'Survey_Date'
-        ]
+            for _ in range(n_waves):
+                wave = len(manifest['waves']) + 1
+                self.rng = np.random.RandomState([manifest['seed'], wave])
+                wave_data, state = self.generate_wave(participants, wave, state, manifest)
+                
+                entry = {
+                    'wave': wave,
+                    'file': f'wave_{wave:03d}.{extension}',
+                    'state': f'wave_{wave:03d}_state.npy',
+                    'rows': len(wave_data),
+                    'first_date': wave_data['Survey_Date'].min(),
+                    'last_date': wave_data['Survey_Date'].max()
+                }
+                self.write_wave_table(wave_data, os.path.join(store_dir, entry['file']), manifest['format'])
+                np.save(os.path.join(store_dir, entry['state']), state)
+                
+                # Record the wave only after its files are complete
+                manifest['waves'].append(entry)
+                self.save_wave_manifest(store_dir, manifest)
+                print(f"   ✓ Wave {wave}: {len(wave_data)} participants ({entry['first_date']} to {entry['last_date']})")
+        finally:
+            self.rng = previous_rng
+        
+        return manifest
+    
+    def load_panel_waves(self, store_dir='research_data/panel_waves', waves=None):
+        """Stack stored waves (all, or the listed wave numbers) into one long-format frame"""
         
-        # Reorder columns
-        quant_data = quant_data[column_order]
+        manifest = self.load_wave_manifest(store_dir)
+        if manifest is None:
+            raise FileNotFoundError(f"No wave store at {store_dir}")
         
-        # Generate qualitative data
-        print("2. Generating qualitative interview data...")
-        qual_data_list = []
-        base_date = datetime(2025, 9, 1)
+        entries = [entry for entry in manifest['waves'] if waves is None or entry['wave'] in waves]
+        return pd.concat(
+            [self.read_wave_table(os.path.join(store_dir, entry['file']), manifest['format']) for entry in entries],
+            ignore_index=True
+        )
+    
+    def shard_plan(self, country_sizes, num_shards, block_size=SHARD_BLOCK_SIZE):
+        """
+        Split the panel into blocks of at most block_size respondents (countries in
+        registry order) and give each shard a contiguous run of blocks with about
+        the same number of rows. Returns one list of blocks per shard.
+        """
+        
+        blocks = []
+        for country in self.countries:
+            n = country_sizes.get(country, 0)
+            for block, start in enumerate(range(0, n, block_size)):
+                blocks.append({'country': country, 'block': block, 'first': start + 1,
+                               'rows': min(block_size, n - start)})
+        
+        if not 1 <= num_shards <= len(blocks):
+            raise ValueError(f"num_shards must be between 1 and the number of blocks ({len(blocks)})")
+        
+        # A block belongs to the shard its first row falls in when rows are split evenly
+        rows = np.array([block['rows'] for block in blocks])
+        starts = np.concatenate([[0], np.cumsum(rows)[:-1]])
+        owners = np.minimum(starts * num_shards // rows.sum(), num_shards - 1)
+        return [[block for block, owner in zip(blocks, owners) if owner == shard] for shard in range(num_shards)]
+    
+    def generate_survey_block(self, block, seed):
+        """One block of a sharded panel from its own (seed, country, block) stream"""
+        country_position = list(self.countries).index(block['country'])
+        self.rng = np.random.RandomState([seed, country_position, block['block']])
+        return self.generate_survey_panel({block['country']: block['rows']}, {block['country']: block['first']})
+    
+    def generate_block_panel(self, blocks, seed):
+        """
+        Survey rows of a run of plan blocks in block order, each block from its own
+        stream (self.rng is restored afterwards). Careless-responder labels and the
+        missingness report cover all the blocks, not just the last one.
+        """
+        
+        previous_rng = self.rng
+        parts, careless_types = [], []
+        try:
+            for block in blocks:
+                parts.append(self.generate_survey_block(block, seed))
+                if self.careless_types is not None:
+                    careless_types.append(self.careless_types)
+        finally:
+            self.rng = previous_rng
+        
+        panel = pd.concat(parts, ignore_index=True)[self.survey_columns]
+        if careless_types:
+            self.careless_types = np.concatenate(careless_types)
+        if self.missingness:
+            self.missingness_report = self.missingness_summary(panel)
+        return panel
+    
+    def careless_responders(self, panel):
+        """Participant IDs of the simulated careless responders by pattern (None without that stage)"""
+        if self.careless_types is None:
+            return None
+        return {
+            'rate': self.careless['rate'],
+            **{name: panel['Participant_ID'].values[self.careless_types == name].tolist()
+               for name in self.careless['types']}
+        }
+    
+    def generate_survey_shards(self, num_shards, shard_index=None, store_dir='research_data/survey_shards',
+                               country_sizes=None, seed=42, block_size=SHARD_BLOCK_SIZE, file_format='csv'):
+        """
+        Generate one shard (shard_index) or every shard of a survey panel split over
+        num_shards nodes. Participant IDs and random streams come from the block plan,
+        not the node, so the shards concatenated in order equal a single-node run
+        (num_shards=1, or generate_complete_dataset with block_seed=seed) byte for byte.
+        The default generate_complete_dataset draws from one global stream and gives a
+        different panel. Every node writes the same manifest, which lists all shards
+        for the analyzers; the careless responders of each shard are merged into it.
+        """
+        
+        if self.calibration_targets:
+            raise ValueError("Calibrated panels are fitted to the whole sample and cannot be sharded")
+        if country_sizes is None:
+            country_sizes = {country: spec['quant_n'] for country, spec in self.countries.items()}
+        
+        plan = self.shard_plan(country_sizes, num_shards, block_size)
+        extension = 'parquet' if file_format == 'parquet' else 'csv'
+        
+        shards = []
+        for index, blocks in enumerate(plan):
+            # First and last participant number per country (blocks of a country are contiguous)
+            ids = {}
+            for block in blocks:
+                first = ids.get(block['country'], [block['first']])[0]
+                ids[block['country']] = [first, block['first'] + block['rows'] - 1]
+            shards.append({
+                'shard_index': index,
+                'file': f'survey_shard_{index:04d}_of_{num_shards:04d}.{extension}',
+                'rows': int(sum(block['rows'] for block in blocks)),
+                'participant_ids': ids,
+                'blocks': [[block['country'], block['block']] for block in blocks]
+            })
+        
+        manifest = {
+            'seed': seed,
+            'num_shards': num_shards,
+            'block_size': block_size,
+            'country_sizes': country_sizes,
+            'format': file_format,
+            'columns': self.survey_columns,
+            'missingness': self.missingness,
+            'careless': self.careless,
+            'n_rows': int(sum(country_sizes.values())),
+            'shards': shards
+        }
         
-        for country, n in [('Japan', self.japan_qual_n), ('Vietnam', self.vietnam_qual_n)]:
-            country_code = 'JP' if country == 'Japan' else 'VN'
-            demographics = self.generate_demographics(country, n, is_qualitative=True)
-            
-            for i in range(n):
-                qual_data_list.append({
-                    'Interview_ID': self.generate_participant_id(country_code, i+1, 'QUAL'),
-                    'Country': country,
-                    'Interview_Date': (base_date + timedelta(days=np.random.randint(0, 90))).strftime('%Y-%m-%d'),
-                    'Position': demographics.iloc[i]['Position_Level'],
-                    'Industry': demographics.iloc[i]['Industry'],
-                    'Age': demographics.iloc[i]['Age'],
-                    'Gender': demographics.iloc[i]['Gender'],
-                    'Interview_Duration_Min': np.random.randint(55, 95),
-                    'AI_Experience_Years': np.random.randint(1, 6) + np.random.choice([0, 0.5])
-                })
-        
-        qual_data = pd.DataFrame(qual_data_list)
+        # Careless ground truth of shards written by other nodes into the same store
+        manifest_file = os.path.join(store_dir, 'manifest.json')
+        if shard_index is not None and os.path.exists(manifest_file):
+            with open(manifest_file, 'r') as f:
+                existing = json.load(f)
+            if all(existing.get(key) == manifest[key] for key in ['seed', 'num_shards', 'block_size', 'country_sizes']):
+                for shard, previous in zip(shards, existing['shards']):
+                    if 'careless_responders' in previous:
+                        shard['careless_responders'] = previous['careless_responders']
+        
+        os.makedirs(store_dir, exist_ok=True)
+        for index in range(num_shards) if shard_index is None else [shard_index]:
+            shard = self.generate_block_panel(plan[index], seed)
+            if self.careless_types is not None:
+                shards[index]['careless_responders'] = self.careless_responders(shard)
+            if self.missingness and self.missingness['code'] is not None:
+                shard = self.with_missing_code(shard)
+            self.write_wave_table(shard, os.path.join(store_dir, shards[index]['file']), file_format)
+            print(f"   ✓ Shard {index + 1}/{num_shards}: {len(shard)} respondents -> {shards[index]['file']}")
+        
+        self.save_wave_manifest(store_dir, manifest)
+        return manifest
+    
+    def generate_complete_dataset(self, output_dir='research_data', country_sizes=None, block_seed=None):
+        """
+        Generate all datasets (survey sizes from the registry unless country_sizes is given).
+        With block_seed the survey panel is drawn block by block like generate_survey_shards,
+        so it equals the concatenated shards of a sharded run with seed=block_seed.
+        """
+        
+        print("="*70)
+        print("GENERATING DISSERTATION-MATCHED DATA")
+        print("="*70)
+        
+        os.makedirs(output_dir, exist_ok=True)
+        
+        # Generate quantitative data
+        print("\n1. Generating quantitative survey data...")
+        if block_seed is not None:
+            if self.calibration_targets:
+                raise ValueError("Calibrated panels are fitted to the whole sample and cannot use block streams")
+            sizes = country_sizes or {country: spec['quant_n'] for country, spec in self.countries.items()}
+            quant_data = self.generate_block_panel(self.shard_plan(sizes, 1)[0], block_seed)
+        else:
+            quant_data = self.generate_survey_panel(country_sizes)
+        
+        # REORGANIZE COLUMNS IN SPECIFIED ORDER
+        quant_data = quant_data[self.survey_columns]
+        
+        # Generate qualitative data (overlap_pct of interviewees are drawn from the survey panel)
+        print("2. Generating qualitative interview data...")
+        qual_data, survey_link_keys = self.generate_interview_cohort(quant_data)
+        quant_data['Survey_Link_Key'] = quant_data['Participant_ID'].map(survey_link_keys)
+        print(f"   ✓ {len(survey_link_keys)} of {len(qual_data)} interviewees linked to survey respondents")
         
         # Save datasets
         print("\n3. Saving datasets...")
-        quant_data.to_csv(f'{output_dir}/survey_data_complete.csv', index=False)
+        survey_output = quant_data
+        if self.missingness and self.missingness['code'] is not None:
+            survey_output = self.with_missing_code(quant_data)
+        survey_output.to_csv(f'{output_dir}/survey_data_complete.csv', index=False)
         qual_data.to_csv(f'{output_dir}/interview_metadata.csv', index=False)
         
+        # True links of the overlapping interviewees (same layout as 2_link.py writes)
+        linked = qual_data.dropna(subset=['Survey_Link_Key'])
+        survey_ids = pd.Series(survey_link_keys.index, index=survey_link_keys.values)
+        linkage = {
+            qual_id: {'quant_id': survey_ids[link_key], 'link_key': link_key}
+            for qual_id, link_key in zip(linked['Interview_ID'], linked['Survey_Link_Key'])
+        }
+        with open(f'{output_dir}/participant_linkage_masked.json', 'w') as f:
+            json.dump(linkage, f, indent=2)
+        
         print(f"   ✓ Saved survey data: {quant_data.shape}")
         print(f"   ✓ Saved interview data: {qual_data.shape}")
+        print(f"   ✓ Saved participant linkage: {len(linkage)} links")
         
         # Verify column order
         print("\n4. Verifying column order...")
-        expected_order = [
-            'Participant_ID', 'Country', 'Age', 'Gender', 'Position_Level', 
-            'Tenure_Years', 'Education', 'Industry', 'Org_Size_Category', 'Org_Size_Numeric',
-            'TC_Score', 'CMC_Score', 'EA_Score', 'ALO_Score',
-            'TC1', 'TC2', 'TC3', 'TC4', 'TC5', 'TC6', 'TC7', 'TC8',
-            'CMC1', 'CMC2', 'CMC3', 'CMC4', 'CMC5', 'CMC6', 'CMC7', 'CMC8',
-            'EA1', 'EA2', 'EA3', 'EA4', 'EA5', 'EA6', 'EA7', 'EA8',
-            'ALO1', 'ALO2', 'ALO3', 'ALO4', 'ALO5', 'ALO6', 'ALO7', 'ALO8',
-            'OI_Score', 'SA_Score', 'OL_Score', 'Overall_Success',
-            'OI1', 'OI2', 'OI3', 'OI4',
-            'SA1', 'SA2', 'SA3', 'SA4',
-            'OL1', 'OL2', 'OL3', 'OL4',
-            'PD_Score', 'UA_Score', 'Collectivism_Score', 'LTO_Score',
-            'PD1', 'PD2', 'PD3',
-            'UA1', 'UA2', 'UA3',
-            'IC1', 'IC2', 'IC3',
-            'LTO1', 'LTO2', 'LTO3',
-            'Survey_Date'
-        ]
-        
         actual_columns = list(quant_data.columns)
-        if actual_columns == expected_order:
-            print("   ✓ Column order is CORRECT!")
+        if actual_columns[:len(self.survey_columns)] == self.survey_columns:
+            print("   ✓ Column order matches the survey schema!")
             print(f"   ✓ Total columns: {len(actual_columns)}")
             print("\n   Column structure:")
-            print("      1. ID & Demographics (10 cols)")
-            print("      2. LRAIT Scores (4 cols)")
-            print("      3. LRAIT Items (32 cols)")
-            print("      4. Outcome Scores (4 cols)")
-            print("      5. Outcome Items (12 cols)")
-            print("      6. Cultural Scores (4 cols)")
-            print("      7. Cultural Items (12 cols)")
-            print("      8. Survey Date (1 col)")
+            for i, group in enumerate(self.schema['groups'], 1):
+                n_cols = len(group['columns'])
+                print(f"      {i}. {group['name']} ({n_cols} col{'s' if n_cols > 1 else ''})")
             print(f"      Total: {len(actual_columns)} columns")
         else:
             print("   ✗ WARNING: Column order mismatch!")
             print("   Expected first 20 columns:")
-            for i, col in enumerate(expected_order[:20], 1):
+            for i, col in enumerate(self.survey_columns[:20], 1):
                 actual = actual_columns[i-1] if i <= len(actual_columns) else "MISSING"
                 match = "✓" if col == actual else "✗"
                 print(f"      {match} {i:2d}. {col:25s} (got: {actual})")
@@ -504,8 +1723,16 @@ class DissertationDataGenerator:
             'generation_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
             'data_matches': 'Dissertation Tables 4.1-4.9',
             'quantitative_n': len(quant_data),
-            'qualitative_n': len(qual_data)
+            'qualitative_n': len(qual_data),
+            'overlap_n': len(survey_link_keys)
         }
+        if self.calibration_report:
+            dictionary['calibration'] = self.calibration_report
+        if self.missingness_report:
+            dictionary['missing_data'] = self.missingness_report
+        if self.careless_types is not None:
+            # Ground truth for evaluating careless-response screening
+            dictionary['careless_responders'] = self.careless_responders(quant_data)
         
         with open(f'{output_dir}/data_dictionary.json', 'w') as f:
             json.dump(dictionary, f, indent=2)
@@ -520,10 +1747,55 @@ class DissertationDataGenerator:
 
 # Main execution
 if __name__ == "__main__":
-    generator = DissertationDataGenerator()
-    quant_data, qual_data = generator.generate_complete_dataset()
+    # Item nonresponse: --missing MCAR|MAR|MNAR [rate] [--missing-code -99]
+    missingness = None
+    if '--missing' in sys.argv:
+        args = sys.argv[sys.argv.index('--missing') + 1:] + ['']
+        missingness = {'mechanism': args[0].upper()}
+        if args[1].replace('.', '', 1).isdigit():
+            missingness['rate'] = float(args[1])
+        if '--missing-code' in sys.argv:
+            missingness['code'] = float(sys.argv[sys.argv.index('--missing-code') + 1])
+    
+    # Careless responders: --careless [rate]
+    careless = None
+    if '--careless' in sys.argv:
+        args = sys.argv[sys.argv.index('--careless') + 1:] + ['']
+        careless = {'rate': float(args[0])} if args[0].replace('.', '', 1).isdigit() else {}
+    
+    generator = DissertationDataGenerator(calibrate='--calibrate' in sys.argv, missingness=missingness,
+                                          careless=careless)
+    
+    country_sizes = None
+    if '--n-per-country' in sys.argv:
+        n = int(sys.argv[sys.argv.index('--n-per-country') + 1])
+        country_sizes = {country: n for country in generator.countries}
+    
+    # Per-block random streams for the single-file run: --block-seed S
+    # (the default single-file panel comes from one global stream and differs from the shards)
+    block_seed = int(sys.argv[sys.argv.index('--block-seed') + 1]) if '--block-seed' in sys.argv else None
+    
+    if '--num-shards' in sys.argv:
+        # Sharded mode: --num-shards N [--shard-index i] [--n-per-country n] [--block-seed S]
+        # writes research_data/survey_shards (all shards when no index is given); the shards
+        # concatenated equal the single-file run with --block-seed S, not the default run
+        num_shards = int(sys.argv[sys.argv.index('--num-shards') + 1])
+        shard_index = int(sys.argv[sys.argv.index('--shard-index') + 1]) if '--shard-index' in sys.argv else None
+        manifest = generator.generate_survey_shards(num_shards, shard_index, country_sizes=country_sizes,
+                                                    seed=42 if block_seed is None else block_seed)
+        print(f"\nShard store: {manifest['n_rows']} respondents in {manifest['num_shards']} shards")
+        sys.exit(0)
+    
+    if '--waves' in sys.argv:
+        # Longitudinal mode: append quarterly waves to research_data/panel_waves
+        n_waves = int(sys.argv[sys.argv.index('--waves') + 1])
+        manifest = generator.generate_panel_waves(n_waves)
+        print(f"\nPanel store: {manifest['n_participants']} participants x {len(manifest['waves'])} waves")
+        sys.exit(0)
+    
+    quant_data, qual_data = generator.generate_complete_dataset(country_sizes=country_sizes, block_seed=block_seed)
     
     print("\nQuick verification:")
-    print(f"Japan sample: n={len(quant_data[quant_data['Country']=='Japan'])}")
-    print(f"Vietnam sample: n={len(quant_data[quant_data['Country']=='Vietnam'])}")
+    for country, count in quant_data['Country'].value_counts(sort=False).items():
+        print(f"{country} sample: n={count}")
     print(f"Total interviews: n={len(qual_data)}")
\ No newline at end of file
@@ -0,0 +1,238 @@
+"""
+Participant Linkage Script
+Links interview participants to survey respondents by demographics:
+blocks on Country + Gender + Industry, scores candidates by age and
+position, and assigns matches with the Hungarian algorithm per block
+"""
+
+import pandas as pd
+import numpy as np
+from scipy.optimize import linear_sum_assignment
+import hashlib
+import json
+import os
+import sys
+
+BLOCK_COLUMNS = ['Country', 'Gender', 'Industry']
+
+# Interview position labels and the survey position levels they correspond to
+POSITION_EQUIVALENTS = {
+    'Senior Leader': {'Senior Executive', 'Department Head'},
+    'Mid-level Leader': {'Department Head', 'Team Leader'}
+}
+
+INFEASIBLE = 1e6
+
+
+def make_link_key(qual_id, quant_id):
+    """Masked key shared by a linked interview and survey record"""
+    digest = hashlib.sha256(f'{qual_id}|{quant_id}'.encode()).hexdigest()
+    return f'LK_{digest[:12].upper()}'
+
+
+def position_compatibility(qual_position, cell_position):
+    """Boolean matrix: interview position i is compatible with survey position j"""
+    qual_levels, qual_codes = np.unique(np.asarray(qual_position, dtype=str), return_inverse=True)
+    cell_levels, cell_codes = np.unique(np.asarray(cell_position, dtype=str), return_inverse=True)
+    table = np.array([
+        [q == c or c in POSITION_EQUIVALENTS.get(q, ()) for c in cell_levels] for q in qual_levels
+    ])
+    return table[qual_codes[:, None], cell_codes[None, :]]
+
+
+def score_pairs(qual_age, qual_position, cell_age, cell_position, max_age_diff=0, position_weight=0.5):
+    """
+    Score every interview x survey-cell pair of a block at once.
+    Age agreement scores 1 and decays linearly with the gap; a compatible position
+    adds position_weight. Pairs further apart than max_age_diff are infeasible (-inf).
+    """
+    age_gap = np.abs(np.asarray(qual_age, dtype=float)[:, None] - np.asarray(cell_age, dtype=float)[None, :])
+    score = 1 - age_gap / (max_age_diff + 1)
+    score = score + position_weight * position_compatibility(qual_position, cell_position)
+    score[age_gap > max_age_diff] = -np.inf
+    return score
+
+
+def link_block(qual_block, survey_block, max_age_diff=0, position_weight=0.5):
+    """
+    Optimal one-to-one assignment within a block: the most links possible, and the
+    highest total score among those.
+    
+    Survey records with the same Age and Position_Level score identically, so they are
+    collapsed into cells and the assignment runs once on interviews x cell slots (a cell
+    offers as many slots as it has records, but never more than the interviews that can
+    reach it). The cost matrix therefore grows with interviews x reachable slots.
+    """
+    
+    cells = survey_block.groupby(['Age', 'Position_Level'], sort=True)
+    counts = cells.size()
+    members = cells.indices
+    member_lists = [members[key] for key in counts.index]
+    cell_age = counts.index.get_level_values(0).values
+    cell_position = counts.index.get_level_values(1).values
+    
+    score = score_pairs(qual_block['Age'].values, qual_block['Position'].values, cell_age, cell_position,
+                        max_age_diff, position_weight)
+    reachable = np.isfinite(score).sum(axis=0)
+    slot_cells = np.repeat(np.arange(len(counts)), np.minimum(counts.values, reachable))
+    if len(slot_cells) == 0:
+        return pd.DataFrame(columns=['qual_row', 'quant_row', 'match_score'])
+    
+    # Infeasible pairs cost more than any set of feasible links can gain, so the
+    # solver first maximizes the number of links, then their score
+    cost = -score[:, slot_cells]
+    cost[~np.isfinite(cost)] = INFEASIBLE
+    row_ind, col_ind = linear_sum_assignment(cost)
+    feasible = cost[row_ind, col_ind] < INFEASIBLE
+    row_ind, col_ind = row_ind[feasible], col_ind[feasible]
+    
+    # The k-th interview assigned to a cell takes that cell's k-th record
+    assigned_cells = slot_cells[col_ind]
+    rank = pd.Series(assigned_cells).groupby(assigned_cells).cumcount().values
+    records = np.array([member_lists[cell][k] for cell, k in zip(assigned_cells, rank)], dtype=int)
+    
+    return pd.DataFrame({
+        'qual_row': row_ind,
+        'quant_row': records,
+        'match_score': score[row_ind, assigned_cells]
+    })
+
+
+def link_records(interview_data, survey_data, max_age_diff=0, position_weight=0.5):
+    """
+    Link interview participants to survey respondents.
+    Only pairs sharing Country, Gender and Industry are ever compared.
+    Returns one row per link: Interview_ID, Participant_ID, match_score, link_key.
+    """
+    
+    qual_blocks = interview_data.groupby(BLOCK_COLUMNS, sort=False).indices
+    survey_blocks = survey_data.groupby(BLOCK_COLUMNS, sort=False).indices
+    
+    links = []
+    for key, qual_rows in qual_blocks.items():
+        survey_rows = survey_blocks.get(key)
+        if survey_rows is None:
+            continue
+        
+        block_links = link_block(interview_data.iloc[qual_rows], survey_data.iloc[survey_rows],
+                                 max_age_diff, position_weight)
+        links.append(pd.DataFrame({
+            'Interview_ID': interview_data['Interview_ID'].values[qual_rows[block_links['qual_row'].values.astype(int)]],
+            'Participant_ID': survey_data['Participant_ID'].values[survey_rows[block_links['quant_row'].values.astype(int)]],
+            'match_score': block_links['match_score'].values.astype(float)
+        }))
+    
+    if links:
+        links = pd.concat(links, ignore_index=True).sort_values('Interview_ID', ignore_index=True)
+    else:
+        links = pd.DataFrame(columns=['Interview_ID', 'Participant_ID', 'match_score'])
+    links['link_key'] = [make_link_key(q, s) for q, s in zip(links['Interview_ID'], links['Participant_ID'])]
+    
+    return links
+
+
+def recorded_links(interview_data, survey_data):
+    """Links already present as Survey_Link_Key values shared by both files"""
+    
+    if 'Survey_Link_Key' not in interview_data.columns or 'Survey_Link_Key' not in survey_data.columns:
+        return pd.DataFrame(columns=['Interview_ID', 'Participant_ID', 'match_score', 'link_key'])
+    
+    qual = interview_data.loc[interview_data['Survey_Link_Key'].notna(), ['Interview_ID', 'Survey_Link_Key']]
+    quant = survey_data.loc[survey_data['Survey_Link_Key'].notna(), ['Participant_ID', 'Survey_Link_Key']]
+    links = qual.merge(quant, on='Survey_Link_Key').rename(columns={'Survey_Link_Key': 'link_key'})
+    links['match_score'] = np.nan
+    return links[['Interview_ID', 'Participant_ID', 'match_score', 'link_key']]
+
+
+def link_participants(data_dir='research_data', max_age_diff=0, position_weight=0.5, output_dir=None, overwrite=False):
+    """
+    Link interview_metadata.csv to survey_data_complete.csv and write both files with
+    a Survey_Link_Key column, plus participant_linkage_masked.json, to output_dir
+    (default: <data_dir>/linkage). Links already recorded in the files (e.g. the
+    generator's true overlap keys) are kept, and only the remaining interviews and
+    survey rows are matched. The inputs are replaced only with overwrite=True.
+    
+    With the default max_age_diff=0 only same-age pairs are feasible, so scores just
+    rank position compatibility. Larger values allow age gaps, but the resulting
+    links fail 2_verify.py, which requires linked records to agree on Age exactly.
+    """
+    
+    if output_dir is None:
+        output_dir = data_dir if overwrite else f'{data_dir}/linkage'
+    if os.path.abspath(output_dir) == os.path.abspath(data_dir) and not overwrite:
+        raise ValueError(f"Writing into {data_dir} replaces the input files - pass overwrite=True (--overwrite)")
+    
+    print("="*80)
+    print("PARTICIPANT LINKAGE")
+    print("="*80)
+    
+    # Load data
+    print("\nLoading data...")
+    survey_data = pd.read_csv(f'{data_dir}/survey_data_complete.csv')
+    interview_data = pd.read_csv(f'{data_dir}/interview_metadata.csv')
+    
+    print(f"✓ Loaded {len(survey_data)} survey responses")
+    print(f"✓ Loaded {len(interview_data)} interviews")
+    
+    # Keep recorded links; match only the records without one
+    recorded = recorded_links(interview_data, survey_data)
+    if len(recorded):
+        print(f"✓ Kept {len(recorded)} recorded links (Survey_Link_Key)")
+    unlinked_qual = interview_data[~interview_data['Interview_ID'].isin(recorded['Interview_ID'])]
+    unlinked_quant = survey_data[~survey_data['Participant_ID'].isin(recorded['Participant_ID'])]
+    
+    # Link
+    print(f"\nLinking (blocks: {' + '.join(BLOCK_COLUMNS)}, max age difference: {max_age_diff})...")
+    matched = link_records(unlinked_qual.reset_index(drop=True), unlinked_quant.reset_index(drop=True),
+                           max_age_diff, position_weight)
+    links = pd.concat([recorded, matched], ignore_index=True).sort_values('Interview_ID', ignore_index=True)
+    
+    linkage = {
+        qual_id: {'quant_id': quant_id, 'link_key': link_key,
+                  'match_score': None if pd.isna(score) else round(score, 3),
+                  'source': 'recorded' if pd.isna(score) else 'matched'}
+        for qual_id, quant_id, link_key, score in zip(
+            links['Interview_ID'], links['Participant_ID'], links['link_key'], links['match_score'])
+    }
+    
+    os.makedirs(output_dir, exist_ok=True)
+    with open(f'{output_dir}/participant_linkage_masked.json', 'w') as f:
+        json.dump(linkage, f, indent=2)
+    
+    interview_data['Survey_Link_Key'] = interview_data['Interview_ID'].map(
+        links.set_index('Interview_ID')['link_key'])
+    survey_data['Survey_Link_Key'] = survey_data['Participant_ID'].map(
+        links.set_index('Participant_ID')['link_key'])
+    interview_data.to_csv(f'{output_dir}/interview_metadata.csv', index=False)
+    survey_data.to_csv(f'{output_dir}/survey_data_complete.csv', index=False)
+    
+    # Summary
+    print("\n" + "="*80)
+    print("LINKAGE RESULTS")
+    print("="*80)
+    
+    linked_countries = interview_data.loc[interview_data['Survey_Link_Key'].notna(), 'Country']
+    print(f"\nLinked participants by country:")
+    for country, count in linked_countries.value_counts(sort=False).items():
+        print(f"  {country}: {count}")
+    print(f"  Total: {len(links)} of {len(interview_data)} interviews "
+          f"({len(recorded)} recorded, {len(matched)} matched)")
+    
+    if len(matched):
+        print(f"\nMean match score: {matched['match_score'].mean():.3f}")
+    print(f"\n✓ Saved {output_dir}/participant_linkage_masked.json")
+    print(f"✓ Saved interview_metadata.csv and survey_data_complete.csv with Survey_Link_Key in {output_dir}/")
+    
+    print("\n" + "="*80)
+    
+    return links
+
+
+if __name__ == "__main__":
+    # python 2_link.py [--output-dir=research_data/linkage] [--overwrite]
+    #                  [--max-age-diff=0] [--position-weight=0.5]
+    # (--max-age-diff above 0 produces links that fail 2_verify.py's exact age check)
+    options = dict(arg[2:].split('=', 1) for arg in sys.argv[1:] if arg.startswith('--') and '=' in arg)
+    link_participants(max_age_diff=int(options.get('max-age-diff', 0)),
+                      position_weight=float(options.get('position-weight', 0.5)),
+                      output_dir=options.get('output-dir'), overwrite='--overwrite' in sys.argv)
@@ -5,8 +5,55 @@ have matching demographic characteristics
 """
 
 import pandas as pd
+import numpy as np
 import json
 
+MATCH_ATTRIBUTES = ['Age', 'Gender', 'Industry', 'Country']
+
+
+def load_linkage(data_dir='research_data'):
+    """Load participant_linkage_masked.json as a table (Interview_ID, Participant_ID, link_key)"""
+    
+    with open(f'{data_dir}/participant_linkage_masked.json', 'r') as f:
+        linkage = json.load(f)
+    
+    return pd.DataFrame({
+        'Interview_ID': list(linkage.keys()),
+        'Participant_ID': [link_info['quant_id'] for link_info in linkage.values()],
+        'link_key': [link_info['link_key'] for link_info in linkage.values()]
+    })
+
+
+def build_linkage_table(survey_data, interview_data, linkage):
+    """
+    Join every link to its interview and survey record in one indexed merge and
+    compare the linked attributes column-wise
+    """
+    
+    compare_cols = MATCH_ATTRIBUTES + ['Survey_Link_Key']
+    
+    def indexed(data, id_col):
+        # First record per ID (as the row-by-row lookup used), with absent columns as NaN
+        data = data.drop_duplicates(id_col).set_index(id_col)
+        return data.reindex(columns=compare_cols).assign(found=True)
+    
+    linked = linkage.join(indexed(interview_data, 'Interview_ID').add_suffix('_qual'), on='Interview_ID')
+    linked = linked.join(indexed(survey_data, 'Participant_ID').add_suffix('_quant'), on='Participant_ID')
+    
+    linked['qual_found'] = linked.pop('found_qual').notna()
+    linked['quant_found'] = linked.pop('found_quant').notna()
+    
+    for attr in MATCH_ATTRIBUTES:
+        linked[f'{attr.lower()}_match'] = (linked[f'{attr}_qual'] == linked[f'{attr}_quant']).values
+    linked['link_key_match'] = ((linked['Survey_Link_Key_qual'] == linked['link_key']) &
+                                (linked['Survey_Link_Key_quant'] == linked['link_key'])).values
+    
+    match_cols = [f'{attr.lower()}_match' for attr in MATCH_ATTRIBUTES] + ['link_key_match']
+    linked['all_match'] = linked['qual_found'] & linked['quant_found'] & linked[match_cols].all(axis=1)
+    
+    return linked
+
+
 def verify_demographic_matching(data_dir='research_data'):
     """
     Verify that all linked participants have matching demographics
@@ -20,68 +67,32 @@ def verify_demographic_matching(data_dir='research_data'):
     print("\nLoading data...")
     survey_data = pd.read_csv(f'{data_dir}/survey_data_complete.csv')
     interview_data = pd.read_csv(f'{data_dir}/interview_metadata.csv')
-    
-    with open(f'{data_dir}/participant_linkage_masked.json', 'r') as f:
-        linkage = json.load(f)
+    linkage = load_linkage(data_dir)
     
     print(f"✓ Loaded {len(survey_data)} survey responses")
     print(f"✓ Loaded {len(interview_data)} interviews")
     print(f"✓ Found {len(linkage)} linked participants")
     
-    # Verify each linked participant
+    # Verify all linked participants at once
     print("\n" + "="*80)
     print("DETAILED VERIFICATION")
     print("="*80)
     
-    all_match = True
-    mismatches = []
+    linked = build_linkage_table(survey_data, interview_data, linkage)
     
-    for qual_id, link_info in linkage.items():
-        quant_id = link_info['quant_id']
-        link_key = link_info['link_key']
-        
-        # Get records
-        qual_record = interview_data[interview_data['Interview_ID'] == qual_id]
-        quant_record = survey_data[survey_data['Participant_ID'] == quant_id]
-        
-        if len(qual_record) == 0:
-            print(f"✗ ERROR: Qual ID {qual_id} not found in interview data")
-            all_match = False
-            continue
-            
-        if len(quant_record) == 0:
-            print(f"✗ ERROR: Quant ID {quant_id} not found in survey data")
-            all_match = False
-            continue
-        
-        qual_record = qual_record.iloc[0]
-        quant_record = quant_record.iloc[0]
-        
-        # Check demographics
-        age_match = qual_record['Age'] == quant_record['Age']
-        gender_match = qual_record['Gender'] == quant_record['Gender']
-        industry_match = qual_record['Industry'] == quant_record['Industry']
-        country_match = qual_record['Country'] == quant_record['Country']
-        link_key_match = (qual_record['Survey_Link_Key'] == link_key and 
-                         quant_record['Survey_Link_Key'] == link_key)
-        
-        if not all([age_match, gender_match, industry_match, country_match, link_key_match]):
-            all_match = False
-            mismatches.append({
-                'qual_id': qual_id,
-                'quant_id': quant_id,
-                'age_match': age_match,
-                'gender_match': gender_match,
-                'industry_match': industry_match,
-                'country_match': country_match,
-                'link_key_match': link_key_match,
-                'qual_age': qual_record['Age'],
-                'quant_age': quant_record['Age'],
-                'qual_gender': qual_record['Gender'],
-                'quant_gender': quant_record['Gender'],
-                'qual_industry': qual_record['Industry'],
-                'quant_industry': quant_record['Industry']
-            })
+    for qual_id in linked.loc[~linked['qual_found'], 'Interview_ID'].head(10):
+        print(f"✗ ERROR: Qual ID {qual_id} not found in interview data")
+    for quant_id in linked.loc[~linked['quant_found'], 'Participant_ID'].head(10):
+        print(f"✗ ERROR: Quant ID {quant_id} not found in survey data")
+    
+    found = linked['qual_found'] & linked['quant_found']
+    mismatches = linked[found & ~linked['all_match']].rename(columns={
+        'Interview_ID': 'qual_id', 'Participant_ID': 'quant_id',
+        'Age_qual': 'qual_age', 'Age_quant': 'quant_age',
+        'Gender_qual': 'qual_gender', 'Gender_quant': 'quant_gender',
+        'Industry_qual': 'qual_industry', 'Industry_quant': 'quant_industry'
+    })
+    all_match = bool(linked['all_match'].all())
     
     # Report results
     print("\n" + "="*80)
@@ -100,8 +111,15 @@ def verify_demographic_matching(data_dir='research_data'):
     else:
         print(f"\n✗✗✗ FAILURE! ✗✗✗")
         print(f"Found {len(mismatches)} mismatches out of {len(linkage)} linked participants")
+        if (~found).any():
+            print(f"Found {int((~found).sum())} links whose records are missing")
+        
+        print("\nMismatches by attribute:")
+        for attr in MATCH_ATTRIBUTES + ['Link_Key']:
+            print(f"  {attr}: {int((~mismatches[f'{attr.lower()}_match']).sum())}")
+        
         print("\nMismatch details:")
-        for mismatch in mismatches[:10]:  # Show first 10
+        for mismatch in mismatches.head(10).to_dict('records'):  # Show first 10
             print(f"\n  Qual ID: {mismatch['qual_id']}")
             print(f"  Quant ID: {mismatch['quant_id']}")
             if not mismatch['age_match']:
@@ -116,21 +134,14 @@ def verify_demographic_matching(data_dir='research_data'):
     print("EXAMPLE MATCHED PARTICIPANTS")
     print("="*80)
     
-    for i, (qual_id, link_info) in enumerate(list(linkage.items())[:5]):
-        quant_id = link_info['quant_id']
+    for i, record in enumerate(linked[found].head(5).to_dict('records')):
+        print(f"\n{i+1}. Link Key: {record['link_key']}")
+        print(f"   Interview ({record['Interview_ID']}):")
+        print(f"     Age: {record['Age_qual']}, Gender: {record['Gender_qual']}, Industry: {record['Industry_qual']}, Country: {record['Country_qual']}")
+        print(f"   Survey ({record['Participant_ID']}):")
+        print(f"     Age: {record['Age_quant']}, Gender: {record['Gender_quant']}, Industry: {record['Industry_quant']}, Country: {record['Country_quant']}")
         
-        qual_record = interview_data[interview_data['Interview_ID'] == qual_id].iloc[0]
-        quant_record = survey_data[survey_data['Participant_ID'] == quant_id].iloc[0]
-        
-        print(f"\n{i+1}. Link Key: {link_info['link_key']}")
-        print(f"   Interview ({qual_id}):")
-        print(f"     Age: {qual_record['Age']}, Gender: {qual_record['Gender']}, Industry: {qual_record['Industry']}, Country: {qual_record['Country']}")
-        print(f"   Survey ({quant_id}):")
-        print(f"     Age: {quant_record['Age']}, Gender: {quant_record['Gender']}, Industry: {quant_record['Industry']}, Country: {quant_record['Country']}")
-        
-        if (qual_record['Age'] == quant_record['Age'] and 
-            qual_record['Gender'] == quant_record['Gender'] and 
-            qual_record['Industry'] == quant_record['Industry']):
+        if record['age_match'] and record['gender_match'] and record['industry_match']:
             print(f"   Status: ✓ MATCH")
         else:
             print(f"   Status: ✗ MISMATCH")
@@ -140,13 +151,12 @@ def verify_demographic_matching(data_dir='research_data'):
     print("SUMMARY STATISTICS")
     print("="*80)
     
-    # Count by country
-    japan_links = sum(1 for k in linkage.keys() if k.startswith('JP'))
-    vietnam_links = sum(1 for k in linkage.keys() if k.startswith('VN'))
+    # Count by country (ID prefix)
+    links_by_country = linkage['Interview_ID'].str.split('_').str[0].value_counts(sort=False)
     
     print(f"\nLinked participants by country:")
-    print(f"  Japan: {japan_links}")
-    print(f"  Vietnam: {vietnam_links}")
+    for country_code, count in links_by_country.items():
+        print(f"  {country_code}: {count}")
     print(f"  Total: {len(linkage)}")
     
     # Overlap percentage
@@ -166,9 +176,10 @@ def generate_detailed_report(data_dir='research_data', output_file='demographic_
     
     survey_data = pd.read_csv(f'{data_dir}/survey_data_complete.csv')
     interview_data = pd.read_csv(f'{data_dir}/interview_metadata.csv')
+    linkage = load_linkage(data_dir)
     
-    with open(f'{data_dir}/participant_linkage_masked.json', 'r') as f:
-        linkage = json.load(f)
+    linked = build_linkage_table(survey_data, interview_data, linkage)
+    linked = linked[linked['qual_found'] & linked['quant_found']].sort_values('Interview_ID')
     
     lines = []
     lines.append("="*80)
@@ -188,21 +199,18 @@ def generate_detailed_report(data_dir='research_data', output_file='demographic_
     lines.append(f"{'Qual ID':<15} {'Quant ID':<17} {'Age':<6} {'Gender':<8} {'Industry':<20} {'Country':<10} {'Match':<8}")
     lines.append("-"*80)
     
-    for qual_id, link_info in sorted(linkage.items()):
-        quant_id = link_info['quant_id']
-        
-        qual_record = interview_data[interview_data['Interview_ID'] == qual_id].iloc[0]
-        quant_record = survey_data[survey_data['Participant_ID'] == quant_id].iloc[0]
-        
-        age_match = "✓" if qual_record['Age'] == quant_record['Age'] else "✗"
-        gender_match = "✓" if qual_record['Gender'] == quant_record['Gender'] else "✗"
-        industry_match = "✓" if qual_record['Industry'] == quant_record['Industry'] else "✗"
-        country_match = "✓" if qual_record['Country'] == quant_record['Country'] else "✗"
-        
-        all_match = "✓" if (age_match == "✓" and gender_match == "✓" and 
-                            industry_match == "✓" and country_match == "✓") else "✗"
-        
-        lines.append(f"{qual_id:<15} {quant_id:<17} {age_match:<6} {gender_match:<8} {industry_match:<20} {country_match:<10} {all_match:<8}")
+    def mark(matches):
+        return np.where(matches, "✓", "✗")
+    
+    demographics_match = linked[['age_match', 'gender_match', 'industry_match', 'country_match']].all(axis=1)
+    rows = zip(linked['Interview_ID'], linked['Participant_ID'],
+               mark(linked['age_match']), mark(linked['gender_match']),
+               mark(linked['industry_match']), mark(linked['country_match']), mark(demographics_match))
+    
+    lines.extend(
+        f"{qual_id:<15} {quant_id:<17} {age_match:<6} {gender_match:<8} {industry_match:<20} {country_match:<10} {all_match:<8}"
+        for qual_id, quant_id, age_match, gender_match, industry_match, country_match, all_match in rows
+    )
     
     lines.append("")
     lines.append("="*80)
@@ -9,42 +9,135 @@ All calculations are from real data - NO HARDCODED VALUES
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from scipy import stats
-from scipy.stats import ttest_ind, pearsonr
-import statsmodels.api as sm
-from statsmodels.multivariate.manova import MANOVA
-from factor_analyzer import FactorAnalyzer, calculate_bartlett_sphericity, calculate_kmo
 import warnings
 import json
 import os
+import sys
+import io
+import copy
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from types import SimpleNamespace
+from results_store import ResultsStore, file_hash, git_commit, flatten_results
+from report_tables import Table, Cell, significance_stars, write_tables
+from step_profiler import StepProfiler, profiled
+from lazy_imports import LazyModule
 warnings.filterwarnings('ignore')
 
-# Set style for plots
-sns.set_style("whitegrid")
-plt.rcParams['figure.figsize'] = (10, 6)
-plt.rcParams['font.size'] = 10
+
+def plot_style(module):
+    """Set style for plots (once pyplot or seaborn is first used)"""
+    import matplotlib.pyplot
+    import seaborn
+    seaborn.set_style("whitegrid")
+    matplotlib.pyplot.rcParams['figure.figsize'] = (10, 6)
+    matplotlib.pyplot.rcParams['font.size'] = 10
+
+
+# Heavy libraries load on first use by the step that needs them, so a run of a
+# few steps (e.g. descriptives or reliability) starts without them
+plt = LazyModule('matplotlib.pyplot', setup=plot_style)
+sns = LazyModule('seaborn', setup=plot_style)
+stats = LazyModule('scipy.stats')
+sparse = LazyModule('scipy.sparse')
+sm = LazyModule('statsmodels.api')
+manova = LazyModule('statsmodels.multivariate.manova')
+factor_analyzer = LazyModule('factor_analyzer')
+careless_screening = LazyModule('careless_screening')
+robust_outliers = LazyModule('robust_outliers')
+
+# LRAIT dimensions and their items
+LRAIT_ITEMS = {
+    'TC': [f'TC{i}' for i in range(1, 9)],
+    'CMC': [f'CMC{i}' for i in range(1, 9)],
+    'EA': [f'EA{i}' for i in range(1, 9)],
+    'ALO': [f'ALO{i}' for i in range(1, 9)]
+}
+
+# Display names of the LRAIT dimensions in tables
+DIMENSION_NAMES = {
+    'TC': 'Technological Competence',
+    'CMC': 'Change Management Capability',
+    'EA': 'Ethical Awareness',
+    'ALO': 'Adaptive Learning Orientation'
+}
+
+# Variables of the robust (FAST-MCD) outlier screen, fitted per country
+ROBUST_VARIABLES = ['TC_Score', 'CMC_Score', 'EA_Score', 'ALO_Score', 'OI_Score', 'SA_Score', 'OL_Score']
+
+# Item composition of every composite score (LRAIT, outcomes, cultural values)
+SCALE_ITEMS = {
+    **{f'{dim}_Score': items for dim, items in LRAIT_ITEMS.items()},
+    'OI_Score': [f'OI{i}' for i in range(1, 5)],
+    'SA_Score': [f'SA{i}' for i in range(1, 5)],
+    'OL_Score': [f'OL{i}' for i in range(1, 5)],
+    'PD_Score': [f'PD{i}' for i in range(1, 4)],
+    'UA_Score': [f'UA{i}' for i in range(1, 4)],
+    'Collectivism_Score': [f'IC{i}' for i in range(1, 4)],
+    'LTO_Score': [f'LTO{i}' for i in range(1, 4)]
+}
+
+# Composites scored from other composites: the mean of the available subscale scores,
+# as the generator scores Overall_Success
+DERIVED_SCALES = {
+    'Overall_Success': ['OI_Score', 'SA_Score', 'OL_Score']
+}
+
+
+def data_rows(analyzer):
+    """Rows in the analysis data (the rows a profiled step processes)"""
+    return len(analyzer.df)
 
 class ComprehensiveAnalyzer:
     """
     Comprehensive statistical analysis for AI leadership readiness study
     """
     
-    def __init__(self, data_dir='research_data'):
+    def __init__(self, data_dir='research_data', repair_composites=False, missing='fiml', imputations=20,
+                 screen=None, outliers=None, profiler=None):
         self.data_dir = data_dir
-        self.load_data()
+        self.repair_composites = repair_composites
+        # Number of multiple imputations run when items are missing (0 disables)
+        self.imputations = imputations
+        # Missing-data handling for item moments: 'fiml' (EM), 'pairwise' or 'listwise'
+        if missing not in ('fiml', 'pairwise', 'listwise'):
+            raise ValueError(f"Unknown missing-data method: {missing}")
+        self.missing_method = missing
+        # Careless-response screening before the analyses: None, 'flag' or 'exclude'
+        if screen not in (None, 'flag', 'exclude'):
+            raise ValueError(f"Unknown screening action: {screen}")
+        self.screen = screen
+        # Robust multivariate outliers: None, 'flag' (Robust_D2 / Robust_Outlier columns)
+        # or 'exclude' (also left out of factor analysis and the regression models)
+        if outliers not in (None, 'flag', 'exclude'):
+            raise ValueError(f"Unknown outlier action: {outliers}")
+        self.outliers = outliers
+        # Optional StepProfiler; every decorated step is timed into its trace
+        self.profiler = profiler
         self.results = {}
-        
+        self.load_data()
+    
+    @profiled()
     def load_data(self):
         """Load datasets from CSV files"""
         print("="*70)
         print("LOADING DATA")
         print("="*70)
         
+        # One-factor solutions cached per (dimension, subgroup); reset on every load
+        self._factor_cache = {}
+        self._moment_cache = {}
+        
         try:
-            self.df = pd.read_csv(f'{self.data_dir}/survey_data_complete.csv')
-            self.qual_data = pd.read_csv(f'{self.data_dir}/interview_metadata.csv')
+            survey_files = self.survey_files()
+            data_files = survey_files + [f'{self.data_dir}/interview_metadata.csv']
+            na_values = self.missing_codes()
+            self.df = pd.concat([pd.read_parquet(path) if path.endswith('.parquet') else
+                                 pd.read_csv(path, na_values=na_values) for path in survey_files], ignore_index=True)
+            self.qual_data = pd.read_csv(data_files[-1])
+            # Identifies the input data of a run in the results store
+            self.data_hash = file_hash(data_files)
             
             print(f"✓ Loaded survey data: {self.df.shape}")
             print(f"✓ Loaded interview data: {self.qual_data.shape}")
@@ -56,6 +149,43 @@ class ComprehensiveAnalyzer:
             print(f"  - Japan: {len(self.japan_df)}")
             print(f"  - Vietnam: {len(self.vietnam_df)}")
             
+            # Composite scores must equal the mean of their items
+            flags = self.check_composites(repair=self.repair_composites)
+            report = self.results['composite_check']
+            if report['rows_flagged'] == 0:
+                print(f"✓ Composite scores consistent with items ({len(flags.columns)} scales)")
+            else:
+                action = "repaired" if report['repaired'] else "flagged (pass repair_composites=True to fix)"
+                print(f"⚠ {report['rows_flagged']} rows with composites diverging from items: {action}")
+                for scale, count in report['by_scale'].items():
+                    if count:
+                        print(f"    - {scale}: {count}")
+            
+            # Item nonresponse
+            lrait_cols = [item for items in LRAIT_ITEMS.values() for item in items]
+            missing_rate = self.df[lrait_cols].isna().values.mean()
+            if missing_rate > 0:
+                print(f"  - LRAIT item nonresponse: {missing_rate:.1%} (handled by {self.missing_method})")
+            
+            # Careless responding (longstring, IRV, even-odd, Mahalanobis)
+            if self.screen:
+                report = self.screen_careless_responses()
+                if report['flagged'] == 0:
+                    print(f"✓ No careless respondents flagged")
+                else:
+                    action = "excluded" if self.screen == 'exclude' else "flagged"
+                    indices = ", ".join(f"{index}: {count}" for index, count in report['by_index'].items())
+                    print(f"⚠ {report['flagged']} careless respondents {action} ({indices})")
+                    if 'recall' in report:
+                        print(f"    - known careless responders detected: {report['recall']:.0%}")
+            
+            # Robust multivariate outliers per country (FAST-MCD)
+            if self.outliers:
+                report = self.robust_outlier_screening()
+                action = "excluded from EFA and regression models" if self.outliers == 'exclude' else "flagged"
+                for country, summary in report['by_country'].items():
+                    print(f"  - {country}: {summary['outliers']} robust outliers {action}")
+            
             # Verify required columns exist
             required_cols = ['TC_Score', 'CMC_Score', 'EA_Score', 'ALO_Score', 
                            'OI_Score', 'SA_Score', 'OL_Score', 'Overall_Success']
@@ -64,26 +194,438 @@ class ComprehensiveAnalyzer:
                 print(f"\n⚠ WARNING: Missing columns: {missing}")
             else:
                 print(f"\n✓ All required columns present")
-                
+        
         except FileNotFoundError as e:
             print(f"❌ ERROR: Could not find data files in '{self.data_dir}/'")
             print(f"   Please ensure survey_data_complete.csv and interview_metadata.csv are in that directory")
             raise
+    
+    def survey_files(self):
+        """
+        Survey data files: survey_data_complete.csv, or else every shard listed in the
+        survey_shards manifest written by the generator's sharded mode (in shard order)
+        """
+        
+        survey_file = f'{self.data_dir}/survey_data_complete.csv'
+        manifest_file = f'{self.data_dir}/survey_shards/manifest.json'
+        self.shard_manifest = None
+        if os.path.exists(survey_file) or not os.path.exists(manifest_file):
+            return [survey_file]
+        
+        with open(manifest_file, 'r') as f:
+            self.shard_manifest = json.load(f)
+        manifest = self.shard_manifest
+        
+        shard_dir = os.path.dirname(manifest_file)
+        files = [os.path.join(shard_dir, shard['file']) for shard in manifest['shards']]
+        absent = [path for path in files if not os.path.exists(path)]
+        if absent:
+            raise FileNotFoundError(f"{len(absent)} of {len(files)} survey shards not generated yet: {absent[:3]}")
+        print(f"✓ Reading {len(files)} survey shards ({manifest['n_rows']} respondents)")
+        return files
+    
+    def data_dictionary(self):
+        """The generator's data_dictionary.json ({} when absent or unreadable)"""
+        try:
+            with open(f'{self.data_dir}/data_dictionary.json', 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def missing_codes(self):
+        """Sentinel codes for missing item responses recorded in data_dictionary.json or the shard manifest"""
+        if self.shard_manifest is not None:
+            code = (self.shard_manifest.get('missingness') or {}).get('code')
+        else:
+            code = self.data_dictionary().get('missing_data', {}).get('code')
+        if code is None:
+            return None
+        return [code, int(code)] if float(code).is_integer() else [code]
+    
+    @profiled(rows=data_rows)
+    def screen_careless_responses(self):
+        """
+        Careless-response indices for every respondent over all item scales (see
+        careless_screening). With screen='exclude' the flagged rows are dropped
+        before any analysis. When the data dictionary lists the generator's careless
+        responders, the share of them flagged is reported as recall.
+        """
+        
+        scales = {scale: items for scale, items in SCALE_ITEMS.items()
+                  if all(item in self.df.columns for item in items)}
+        screen = careless_screening.screen_responses(self.df, scales)
+        ids = self.df['Participant_ID'].values if 'Participant_ID' in self.df.columns else self.df.index.values
+        report = careless_screening.screening_summary(screen, ids)
+        report['action'] = self.screen
+        
+        if self.shard_manifest is not None:
+            # Sharded panels keep the ground truth per shard in the manifest
+            known = {}
+            for shard in self.shard_manifest['shards']:
+                for key, values in shard.get('careless_responders', {}).items():
+                    if isinstance(values, list):
+                        known.setdefault(key, []).extend(values)
+        else:
+            known = self.data_dictionary().get('careless_responders')
+        if known:
+            known_ids = {row_id for key, values in known.items() if isinstance(values, list) for row_id in values}
+            if known_ids:
+                report['recall'] = float(np.isin(list(known_ids), ids[screen['careless'].values]).mean())
+        
+        self.careless_screen = screen
+        if self.screen == 'exclude' and report['flagged']:
+            self.df = self.df[~screen['careless'].values].reset_index(drop=True)
+            self.japan_df = self.df[self.df['Country'] == 'Japan'].copy()
+            self.vietnam_df = self.df[self.df['Country'] == 'Vietnam'].copy()
         
+        self.results['careless_screening'] = report
+        return report
+    
+    @profiled(rows=data_rows)
+    def robust_outlier_screening(self):
+        """
+        FAST-MCD robust distances of ROBUST_VARIABLES within each country (see
+        robust_outliers). The squared distance and the outlier flag are added to the
+        data as Robust_D2 and Robust_Outlier, so every analysis can use them.
+        """
+        
+        screen, by_country = robust_outliers.robust_distances(self.df, ROBUST_VARIABLES, by='Country')
+        self.df['Robust_D2'] = screen['robust_d2'].values
+        self.df['Robust_Outlier'] = screen['robust_outlier'].values
+        self.japan_df = self.df[self.df['Country'] == 'Japan'].copy()
+        self.vietnam_df = self.df[self.df['Country'] == 'Vietnam'].copy()
+        
+        flagged = self.df['Robust_Outlier'].values
+        ids = self.df['Participant_ID'].values if 'Participant_ID' in self.df.columns else self.df.index.values
+        self.results['robust_outliers'] = {
+            'variables': ROBUST_VARIABLES,
+            'action': self.outliers,
+            'flagged': int(flagged.sum()),
+            'by_country': by_country,
+            'sample_rows': [str(row_id) for row_id in ids[flagged][:10]]
+        }
+        return self.results['robust_outliers']
+    
+    def model_data(self):
+        """Rows used by the factor analysis and regression models (robust outliers dropped when excluded)"""
+        if self.outliers == 'exclude' and 'Robust_Outlier' in self.df.columns:
+            return self.df[~self.df['Robust_Outlier'].astype(bool)]
+        return self.df
+    
+    def model_subgroup(self, data):
+        """Cache key of the combined-sample model rows ('Overall (robust)' once outliers are dropped)"""
+        return 'Overall' if data is self.df else 'Overall (robust)'
+    
+    def scale_weight_matrix(self, scales, items):
+        """Sparse item x scale matrix: each scale averages its items with equal weights"""
+        
+        item_pos = {item: i for i, item in enumerate(items)}
+        rows, cols, weights = [], [], []
+        for s, scale in enumerate(scales):
+            for item in SCALE_ITEMS[scale]:
+                rows.append(item_pos[item])
+                cols.append(s)
+                weights.append(1 / len(SCALE_ITEMS[scale]))
+        
+        return sparse.csr_matrix((weights, (rows, cols)), shape=(len(items), len(scales)))
+    
+    def recompute_composites(self, data=None, min_items=0.5):
+        """
+        Recompute every composite present in the data from its items in one sparse multiply.
+        Missing items are skipped (mean of answered items) while at least min_items of a
+        scale's weight is answered; otherwise the composite is NaN. DERIVED_SCALES are then
+        averaged from the recomputed subscales.
+        """
+        
+        if data is None:
+            data = self.df
+        
+        scales = [scale for scale, items in SCALE_ITEMS.items()
+                  if scale in data.columns and all(item in data.columns for item in items)]
+        items = list(dict.fromkeys(item for scale in scales for item in SCALE_ITEMS[scale]))
+        W = self.scale_weight_matrix(scales, items)
+        
+        X = data[items].values.astype(float)
+        answered = ~np.isnan(X)
+        weighted = np.where(answered, X, 0) @ W
+        coverage = answered.astype(float) @ W
+        
+        with np.errstate(invalid='ignore', divide='ignore'):
+            # (tolerance: e.g. six weights of 1/12 sum to just under 0.5)
+            scores = np.where(coverage >= min_items - 1e-9, weighted / coverage, np.nan)
+        
+        scores = pd.DataFrame(scores, columns=scales, index=data.index)
+        for scale, parts in DERIVED_SCALES.items():
+            if scale in data.columns and all(part in scores.columns for part in parts):
+                scores[scale] = scores[parts].mean(axis=1)
+        return scores
+    
+    def check_composites(self, data=None, tolerance=0.006, repair=False):
+        """
+        Flag rows whose stored composites differ from the mean of their items by more
+        than tolerance (the stored outcome and cultural scores are rounded to 2 decimals).
+        DERIVED_SCALES are checked against the mean of the stored subscales, or of the
+        recomputed ones where a subscale itself diverged. With repair=True the
+        divergent values are replaced by the recomputed ones.
+        """
+        
+        if data is None:
+            data = self.df
+        
+        recomputed = self.recompute_composites(data)
+        
+        def diverges(stored, expected):
+            with np.errstate(invalid='ignore'):
+                return (np.abs(stored - expected) > tolerance) | (np.isnan(stored) != np.isnan(expected))
+        
+        # Subscales first, so a derived score is expected from the subscales as they stand after repair
+        derived = [scale for scale in DERIVED_SCALES if scale in recomputed.columns]
+        for scale in derived:
+            parts = DERIVED_SCALES[scale]
+            stored_parts = data[parts].values.astype(float)
+            repaired_parts = np.where(diverges(stored_parts, recomputed[parts].values), recomputed[parts].values, stored_parts)
+            with warnings.catch_warnings():
+                # Rows without any subscale score give NaN
+                warnings.simplefilter('ignore', RuntimeWarning)
+                recomputed[scale] = np.nanmean(repaired_parts, axis=1)
+        
+        stored = data[recomputed.columns].values.astype(float)
+        diverged = diverges(stored, recomputed.values)
+        flags = pd.DataFrame(diverged, columns=recomputed.columns, index=data.index)
+        
+        rows_flagged = flags.any(axis=1)
+        flagged_ids = data.loc[rows_flagged, 'Participant_ID'] if 'Participant_ID' in data.columns else flags.index[rows_flagged]
+        sample = [str(row_id) for row_id in flagged_ids[:10]]
+        
+        if repair and rows_flagged.any():
+            data[recomputed.columns] = np.where(diverged, recomputed.values, stored)
+            if data is self.df:
+                self.japan_df = self.df[self.df['Country'] == 'Japan'].copy()
+                self.vietnam_df = self.df[self.df['Country'] == 'Vietnam'].copy()
+        
+        self.results['composite_check'] = {
+            'rows_flagged': int(rows_flagged.sum()),
+            'by_scale': {scale: int(count) for scale, count in flags.sum().items()},
+            'sample_rows': sample,
+            'tolerance': tolerance,
+            'repaired': bool(repair and rows_flagged.any())
+        }
+        
+        return flags
+    
+    def pairwise_moments(self, X, chunk_size=100000):
+        """
+        Pairwise-complete means and covariances accumulated from sufficient statistics.
+        Entry (j, k) uses exactly the rows where both j and k are observed, for the
+        means as well as the cross-products, so every correlation equals the Pearson
+        correlation of that pair's complete cases. Returns (mean, cov, corr, n_pairs).
+        """
+        
+        X = np.asarray(X, dtype=float)
+        p = X.shape[1]
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            shift = np.nan_to_num(np.nanmean(X, axis=0))
+        
+        N = np.zeros((p, p))
+        S = np.zeros((p, p))
+        Q = np.zeros((p, p))
+        C = np.zeros((p, p))
+        for start in range(0, len(X), chunk_size):
+            block = X[start:start + chunk_size] - shift
+            M = (~np.isnan(block)).astype(float)
+            X0 = np.where(M > 0, block, 0)
+            N += M.T @ M
+            S += X0.T @ M          # S[j, k] = sum of x_j over rows where j and k are observed
+            Q += (X0 ** 2).T @ M
+            C += X0.T @ X0
+        
+        with np.errstate(invalid='ignore', divide='ignore'):
+            cov = (C - S * S.T / N) / (N - 1)
+            var = (Q - S ** 2 / N) / (N - 1)
+            corr = cov / np.sqrt(var * var.T)
+            mean = np.diag(S) / np.diag(N) + shift
+        np.fill_diagonal(corr, 1.0)
+        
+        return mean, cov, corr, N
+    
+    @staticmethod
+    def missing_pattern_groups(observed):
+        """
+        Group the rows of an observed-value mask by missingness pattern, and the patterns
+        by how many items they miss. Returns one (missing item indices per pattern,
+        rows, each row's pattern within the group) tuple per number of missing items.
+        """
+        
+        patterns, inverse = np.unique(observed, axis=0, return_inverse=True)
+        inverse = inverse.ravel()
+        n_missing = (~patterns).sum(axis=1)
+        
+        groups = []
+        for k in np.unique(n_missing[n_missing > 0]):
+            pattern_ids = np.flatnonzero(n_missing == k)
+            local = np.full(len(patterns), -1)
+            local[pattern_ids] = np.arange(len(pattern_ids))
+            rows = np.flatnonzero(local[inverse] >= 0)
+            miss_idx = np.nonzero(~patterns[pattern_ids])[1].reshape(len(pattern_ids), k)
+            groups.append((miss_idx, rows, local[inverse[rows]]))
+        
+        return groups
+    
+    @staticmethod
+    def conditional_expectation(X, observed, groups, mu, sigma):
+        """
+        Fill missing values with their conditional means under N(mu, sigma), working
+        from the precision matrix P: x_m | x_o has covariance inv(P_mm) and mean
+        mu_m - inv(P_mm) P_mo (x_o - mu_o). The small inversions run as one batched
+        call per group of patterns. Returns (filled, conditional covariance per group).
+        """
+        
+        precision = np.linalg.pinv(sigma)
+        H = np.where(observed, X - mu, 0) @ precision
+        filled = np.where(observed, X, mu)
+        cond_covs = []
+        
+        for miss_idx, rows, row_pattern in groups:
+            cond_cov = np.linalg.inv(precision[miss_idx[:, :, None], miss_idx[:, None, :]])
+            row_idx = miss_idx[row_pattern]
+            shift = np.einsum('rij,rj->ri', cond_cov[row_pattern], H[rows[:, None], row_idx])
+            filled[rows[:, None], row_idx] = mu[row_idx] - shift
+            cond_covs.append(cond_cov)
+        
+        return filled, cond_covs
+    
+    @staticmethod
+    def em_moments(X, tol=1e-6, max_iter=500):
+        """
+        Maximum-likelihood (FIML) mean and covariance of a multivariate normal with
+        missing values, by EM. Each E-step handles all rows of a missingness pattern
+        at once (see conditional_expectation). Returns (mean, cov, n, iterations).
+        """
+        
+        X = np.asarray(X, dtype=float)
+        observed = ~np.isnan(X)
+        keep = observed.any(axis=1)
+        X, observed = X[keep], observed[keep]
+        n, p = X.shape
+        if n <= p:
+            # Too few rows for a non-singular covariance (the E-step needs its inverse)
+            return np.full(p, np.nan), np.full((p, p), np.nan), n, 0
+        
+        groups = ComprehensiveAnalyzer.missing_pattern_groups(observed)
+        mu = np.nanmean(X, axis=0)
+        sigma = np.diag(np.nanvar(X, axis=0))
+        
+        for iteration in range(1, max_iter + 1):
+            filled, cond_covs = ComprehensiveAnalyzer.conditional_expectation(X, observed, groups, mu, sigma)
+            
+            correction = np.zeros((p, p))
+            for (miss_idx, _, row_pattern), cond_cov in zip(groups, cond_covs):
+                counts = np.bincount(row_pattern, minlength=len(miss_idx))
+                np.add.at(correction, (miss_idx[:, :, None], miss_idx[:, None, :]),
+                          cond_cov * counts[:, None, None])
+            
+            new_mu = filled.mean(axis=0)
+            new_sigma = (filled.T @ filled + correction) / n - np.outer(new_mu, new_mu)
+            converged = max(np.max(np.abs(new_mu - mu)), np.max(np.abs(new_sigma - sigma))) < tol
+            mu, sigma = new_mu, new_sigma
+            if converged:
+                break
+        
+        return mu, sigma, n, iteration
+    
+    def item_moments(self, data, columns, subgroup=None):
+        """
+        Means, covariance (n - 1 scaling) and effective n of columns under the
+        analyzer's missing-data method. Cached per subgroup when one is given.
+        """
+        
+        key = (tuple(columns), subgroup, self.missing_method)
+        if subgroup is not None and key in self._moment_cache:
+            return self._moment_cache[key]
+        
+        X = data[list(columns)].values.astype(float)
+        
+        if self.missing_method == 'listwise':
+            X = X[~np.isnan(X).any(axis=1)]
+            n = len(X)
+            mean = X.mean(axis=0) if n else np.full(X.shape[1], np.nan)
+            cov = np.cov(X, rowvar=False, ddof=1).reshape(X.shape[1], X.shape[1]) if n > 1 else np.full((X.shape[1],) * 2, np.nan)
+        elif self.missing_method == 'pairwise':
+            mean, cov, _, N = self.pairwise_moments(X)
+            n = int(N.min())
+        else:
+            mean, sigma, n, _ = self.em_moments(X)
+            cov = sigma * n / (n - 1) if n > 1 else np.full_like(sigma, np.nan)
+        
+        moments = (mean, cov, n)
+        if subgroup is not None:
+            self._moment_cache[key] = moments
+        return moments
+    
+    def correlation_matrix(self, data, columns, subgroup=None):
+        """Correlation matrix and effective n of columns under the missing-data method"""
+        
+        if self.missing_method == 'pairwise':
+            _, _, corr, N = self.pairwise_moments(data[list(columns)].values)
+            return corr, int(N.min())
+        
+        _, cov, n = self.item_moments(data, columns, subgroup)
+        sd = np.sqrt(np.diag(cov))
+        return cov / np.outer(sd, sd), n
+    
+    def fit_ols(self, data, y, x_cols):
+        """
+        OLS of y on x_cols with an intercept. Complete data (or the listwise method)
+        goes through statsmodels; otherwise the coefficients and standard errors are
+        computed from the missing-data moments of [y] + x_cols. Either way the result
+        exposes params, bse, tvalues, pvalues (Series incl. 'const'), rsquared and nobs.
+        """
+        
+        columns = [y] + list(x_cols)
+        if self.missing_method == 'listwise' or not data[columns].isna().values.any():
+            return sm.OLS(data[y], sm.add_constant(data[list(x_cols)], has_constant='add'), missing='drop').fit()
+        
+        mean, cov, n = self.item_moments(data, columns)
+        k = len(x_cols)
+        Sxx, sxy, syy = cov[1:, 1:], cov[1:, 0], cov[0, 0]
+        
+        b = np.linalg.solve(Sxx, sxy)
+        b0 = mean[0] - mean[1:] @ b
+        df_resid = n - k - 1
+        sigma2 = (syy - sxy @ b) * (n - 1) / df_resid
+        cov_b = sigma2 * np.linalg.inv(Sxx) / (n - 1)
+        se_b0 = np.sqrt(sigma2 / n + mean[1:] @ cov_b @ mean[1:])
+        
+        index = ['const'] + list(x_cols)
+        params = pd.Series(np.r_[b0, b], index=index)
+        bse = pd.Series(np.r_[se_b0, np.sqrt(np.diag(cov_b))], index=index)
+        tvalues = params / bse
+        
+        return SimpleNamespace(
+            params=params,
+            bse=bse,
+            tvalues=tvalues,
+            pvalues=pd.Series(2 * stats.t.sf(np.abs(tvalues), df_resid), index=index),
+            rsquared=float(sxy @ b / syy),
+            nobs=n,
+            df_resid=df_resid
+        )
+    
     def cronbach_alpha(self, items):
-        """Calculate Cronbach's alpha from actual data"""
-        items_array = items.dropna().values
-        if len(items_array) == 0:
+        """Calculate Cronbach's alpha from the item covariance matrix"""
+        
+        _, cov, n = self.item_moments(items, items.columns)
+        if n < 2:
             return np.nan
-            
-        n_items = items_array.shape[1]
-        item_vars = items_array.var(axis=0, ddof=1)
-        total_var = items_array.sum(axis=1).var(ddof=1)
+        
+        n_items = cov.shape[0]
+        total_var = cov.sum()
         
         if total_var == 0:
             return np.nan
-            
-        alpha = (n_items / (n_items - 1)) * (1 - item_vars.sum() / total_var)
+        
+        alpha = (n_items / (n_items - 1)) * (1 - np.trace(cov) / total_var)
         return alpha
     
     def composite_reliability(self, loadings):
@@ -99,6 +641,133 @@ class ComprehensiveAnalyzer:
         ave = squared_loadings.mean()
         return ave
     
+    def _principal_axis(self, R, h2, tol=1e-6, max_iter=500):
+        """Iterated principal axis extraction of a single factor from a correlation matrix"""
+        R_reduced = R.copy()
+        
+        for iteration in range(1, max_iter + 1):
+            np.fill_diagonal(R_reduced, h2)
+            eigvals, eigvecs = np.linalg.eigh(R_reduced)
+            loadings = eigvecs[:, -1] * np.sqrt(max(eigvals[-1], 0))
+            new_h2 = np.clip(loadings ** 2, 0.005, 0.995)
+            
+            converged = np.max(np.abs(new_h2 - h2)) < tol
+            h2 = new_h2
+            if converged:
+                break
+        
+        # Orient the factor so that loadings are positive
+        if loadings.sum() < 0:
+            loadings = -loadings
+        
+        return loadings, iteration
+    
+    def one_factor_solution(self, dim_name, data=None, subgroup='Overall'):
+        """Fit (or fetch from cache) a one-factor model for one LRAIT dimension in one subgroup"""
+        
+        key = (dim_name, subgroup)
+        if key in self._factor_cache:
+            return self._factor_cache[key]
+        
+        if data is None:
+            data = self.df
+        
+        items = LRAIT_ITEMS[dim_name]
+        R, n = self.correlation_matrix(data, items, subgroup)
+        
+        if n <= len(items) + 1:
+            solution = {'loadings': pd.Series(np.nan, index=items), 'R': None,
+                        'n': n, 'iterations': 0}
+            self._factor_cache[key] = solution
+            return solution
+        
+        # Warm start from the overall solution of the same dimension when available,
+        # otherwise from squared multiple correlations
+        warm = self._factor_cache.get((dim_name, 'Overall'))
+        if warm is not None and warm['R'] is not None:
+            h2 = warm['loadings'].values ** 2
+        else:
+            h2 = 1 - 1 / np.diag(np.linalg.pinv(R))
+        
+        loadings, iterations = self._principal_axis(R, np.clip(h2, 0.005, 0.995))
+        
+        solution = {
+            'loadings': pd.Series(loadings, index=items),
+            'R': R,
+            'n': n,
+            'iterations': iterations
+        }
+        self._factor_cache[key] = solution
+        return solution
+    
+    def factor_loadings(self, dim_name, data=None, subgroup='Overall'):
+        """Standardized one-factor loadings for a dimension"""
+        return self.one_factor_solution(dim_name, data, subgroup)['loadings']
+    
+    def mcdonald_omega(self, loadings):
+        """Calculate McDonald's omega total from standardized one-factor loadings"""
+        common = loadings.sum() ** 2
+        unique = (1 - loadings ** 2).sum()
+        return common / (common + unique)
+    
+    def omega_hierarchical(self, data=None, subgroup='Overall'):
+        """
+        Calculate omega-hierarchical from a Schmid-Leiman bifactor solution
+        (general readiness factor + TC/CMC/EA/ALO group factors)
+        """
+        
+        if data is None:
+            data = self.df
+        
+        dims = list(LRAIT_ITEMS.keys())
+        solutions = {dim: self.one_factor_solution(dim, data, subgroup) for dim in dims}
+        
+        if any(sol['R'] is None for sol in solutions.values()):
+            return {dim: {'omega_h': np.nan, 'omega_hs': np.nan} for dim in dims + ['LRAIT']}
+        
+        all_items = [item for dim in dims for item in LRAIT_ITEMS[dim]]
+        R, n = self.correlation_matrix(data, all_items, subgroup)
+        if n <= len(all_items) + 1 or not np.isfinite(R).all():
+            return {dim: {'omega_h': np.nan, 'omega_hs': np.nan} for dim in dims + ['LRAIT']}
+        
+        # Factor correlations: off-diagonal blocks of R equal phi_jk * lambda_j lambda_k'
+        # under the congeneric model, so phi_jk = sum(R_jk) / (sum(lambda_j) * sum(lambda_k))
+        blocks = [slice(8 * k, 8 * (k + 1)) for k in range(len(dims))]
+        lambda_sums = np.array([solutions[dim]['loadings'].sum() for dim in dims])
+        phi = np.eye(len(dims))
+        for j in range(len(dims)):
+            for k in range(j + 1, len(dims)):
+                phi[j, k] = phi[k, j] = R[blocks[j], blocks[k]].sum() / (lambda_sums[j] * lambda_sums[k])
+        phi = np.clip(phi, -0.999, 0.999)
+        np.fill_diagonal(phi, 1.0)
+        
+        # Second-order loadings of the group factors on the general factor
+        gamma, _ = self._principal_axis(phi, np.clip(1 - 1 / np.diag(np.linalg.pinv(phi)), 0.005, 0.995))
+        gamma = np.clip(gamma, 0, 0.999)
+        
+        omega_results = {}
+        general_all = []
+        
+        for k, dim in enumerate(dims):
+            loadings = solutions[dim]['loadings'].values
+            general = loadings * gamma[k]
+            group = loadings * np.sqrt(1 - gamma[k] ** 2)
+            general_all.append(general)
+            
+            subscale_var = R[blocks[k], blocks[k]].sum()
+            omega_results[dim] = {
+                'omega_h': float(general.sum() ** 2 / subscale_var),
+                'omega_hs': float(group.sum() ** 2 / subscale_var),
+                'general_loading': float(gamma[k])
+            }
+        
+        general_all = np.concatenate(general_all)
+        omega_results['LRAIT'] = {
+            'omega_h': float(general_all.sum() ** 2 / R.sum())
+        }
+        
+        return omega_results
+    
     def cohens_d(self, group1, group2):
         """Calculate Cohen's d effect size"""
         n1, n2 = len(group1), len(group2)
@@ -106,6 +775,7 @@ class ComprehensiveAnalyzer:
         pooled_std = np.sqrt(((n1-1)*var1 + (n2-1)*var2) / (n1+n2-2))
         return (group1.mean() - group2.mean()) / pooled_std
     
+    @profiled(rows=data_rows)
     def run_all_analyses(self):
         """Execute all statistical analyses"""
         
@@ -148,8 +818,13 @@ class ComprehensiveAnalyzer:
         print("\n9. Relative Importance Analysis...")
         self.dominance_analysis()
         
-        # 10. Generate outputs
-        print("\n10. Generating tables and figures...")
+        # 10. Multiple imputation (only when items are missing)
+        if self.imputations:
+            print("\n10. Multiple Imputation...")
+            self.multiple_imputation(m=self.imputations)
+        
+        # 11. Generate outputs
+        print("\n11. Generating tables and figures...")
         self.generate_outputs()
         
         print("\n" + "="*70)
@@ -158,6 +833,7 @@ class ComprehensiveAnalyzer:
         
         return self.results
     
+    @profiled(rows=data_rows)
     def descriptive_statistics(self):
         """Calculate descriptive statistics from actual data"""
         
@@ -195,12 +871,43 @@ class ComprehensiveAnalyzer:
                 }
             }
         
+        # Total sample, in the same layout as the countries
+        desc_results['Total'] = {
+            'n': len(self.df),
+            'age_mean': float(self.df['Age'].mean()),
+            'age_sd': float(self.df['Age'].std()),
+            'gender_male_pct': float((self.df['Gender'] == 'Male').mean() * 100),
+            'tenure_mean': float(self.df['Tenure_Years'].mean()),
+            'tenure_sd': float(self.df['Tenure_Years'].std()),
+            'position': self.df['Position_Level'].value_counts(normalize=True).to_dict(),
+            'industry': self.df['Industry'].value_counts(normalize=True).to_dict()
+        }
+        
         self.results['descriptive_stats'] = desc_results
         
+        # Interview (qualitative) sample
+        qual_results = {}
+        for group, qual_df in [('Japan', self.qual_data[self.qual_data['Country'] == 'Japan']),
+                               ('Vietnam', self.qual_data[self.qual_data['Country'] == 'Vietnam']),
+                               ('Total', self.qual_data)]:
+            qual_results[group] = {
+                'n': len(qual_df),
+                'age_mean': float(qual_df['Age'].mean()),
+                'gender_male_pct': float((qual_df['Gender'] == 'Male').mean() * 100),
+                'position_pct': {pos: float((qual_df['Position'] == pos).mean() * 100)
+                                 for pos in ['Senior Leader', 'Mid-level Leader']},
+                'industry_count': {ind: int(count) for ind, count in qual_df['Industry'].value_counts().items()},
+                'ai_experience_mean': float(qual_df['AI_Experience_Years'].mean()),
+                'duration_mean': float(qual_df['Interview_Duration_Min'].mean())
+            }
+        
+        self.results['qualitative_sample'] = qual_results
+        
         print("✓ Calculated descriptive statistics from actual data")
         print(f"  Japan: n={desc_results['Japan']['n']}, Age M={desc_results['Japan']['age_mean']:.1f}")
         print(f"  Vietnam: n={desc_results['Vietnam']['n']}, Age M={desc_results['Vietnam']['age_mean']:.1f}")
     
+    @profiled(rows=data_rows)
     def reliability_analysis(self):
         """Calculate Cronbach's alpha from actual data"""
         
@@ -233,7 +940,45 @@ class ComprehensiveAnalyzer:
         print("✓ Calculated Cronbach's alpha from actual data")
         for dim, res in reliability_results.items():
             print(f"  {dim}: α = {res['cronbach_alpha_overall']:.3f} (Japan: {res['cronbach_alpha_japan']:.3f}, Vietnam: {res['cronbach_alpha_vietnam']:.3f})")
+        
+        self.omega_analysis()
+    
+    @profiled(rows=data_rows)
+    def omega_analysis(self):
+        """Calculate McDonald's omega and omega-hierarchical for every country and industry cell"""
+        
+        # Overall first so that subgroup fits are warm-started from it
+        subgroups = [('Overall', self.df)]
+        for country, country_df in self.df.groupby('Country'):
+            subgroups.append((country, country_df))
+        for (country, industry), cell_df in self.df.groupby(['Country', 'Industry']):
+            subgroups.append((f'{country} | {industry}', cell_df))
+        
+        omega_results = {}
+        
+        for subgroup, data in subgroups:
+            hierarchical = self.omega_hierarchical(data, subgroup)
+            
+            cell = {'n': int(len(data))}
+            for dim_name in LRAIT_ITEMS:
+                loadings = self.factor_loadings(dim_name, data, subgroup)
+                cell[dim_name] = {
+                    'omega': float(self.mcdonald_omega(loadings)),
+                    'omega_h': hierarchical[dim_name]['omega_h'],
+                    'omega_hs': hierarchical[dim_name]['omega_hs']
+                }
+            cell['LRAIT_omega_h'] = hierarchical['LRAIT']['omega_h']
+            omega_results[subgroup] = cell
+        
+        self.results['omega'] = omega_results
+        
+        overall = omega_results['Overall']
+        print(f"✓ Calculated McDonald's ω and ω-hierarchical for {len(omega_results)} subgroups")
+        for dim_name in LRAIT_ITEMS:
+            print(f"  {dim_name}: ω = {overall[dim_name]['omega']:.3f}, ω_h = {overall[dim_name]['omega_h']:.3f}")
+        print(f"  LRAIT total: ω_h = {overall['LRAIT_omega_h']:.3f}")
     
+    @profiled(rows=data_rows)
     def exploratory_factor_analysis(self):
         """Perform EFA on actual data"""
         
@@ -242,14 +987,22 @@ class ComprehensiveAnalyzer:
         for prefix in ['TC', 'CMC', 'EA', 'ALO']:
             lrait_items.extend([f'{prefix}{i}' for i in range(1, 9)])
         
-        X = self.df[lrait_items].dropna()
+        # Item correlations under the missing-data method
+        data = self.model_data()
+        R, n = self.correlation_matrix(data, lrait_items, self.model_subgroup(data))
         
         # KMO and Bartlett's test
-        kmo_all, kmo_model = calculate_kmo(X)
-        chi_square, p_value = calculate_bartlett_sphericity(X)
-        
-        # Perform EFA with 4 factors
-        fa = FactorAnalyzer(n_factors=4, rotation='promax', method='principal')
+        kmo_all, kmo_model = self.kmo_from_corr(R)
+        chi_square, p_value = self.bartlett_from_corr(R, n)
+        
+        # Perform EFA with 4 factors. The principal method only accepts raw data, so with
+        # item nonresponse it is fit on rows whose correlation matrix is exactly R
+        X = data[lrait_items]
+        if self.missing_method == 'listwise' or not X.isna().values.any():
+            X = X.dropna()
+        else:
+            X = self.rows_with_correlation(R)
+        fa = factor_analyzer.FactorAnalyzer(n_factors=4, rotation='promax', method='principal')
         fa.fit(X)
         
         loadings = pd.DataFrame(
@@ -273,6 +1026,39 @@ class ComprehensiveAnalyzer:
         print(f"✓ EFA complete: KMO = {kmo_model:.3f}, χ² = {chi_square:.2f}, p < .001")
         print(f"  Variance explained: {variance[1].sum():.1%}")
     
+    def rows_with_correlation(self, R):
+        """2p x p matrix with column means 0 whose correlation matrix equals R"""
+        
+        eigvals, eigvecs = np.linalg.eigh(R)
+        half = np.sqrt(np.clip(eigvals, 0, None))[:, None] * eigvecs.T
+        return np.vstack([half, -half])
+    
+    def kmo_from_corr(self, R):
+        """Kaiser-Meyer-Olkin measure (per item, overall) from a correlation matrix"""
+        
+        precision = np.linalg.pinv(R)
+        d = np.sqrt(np.diag(precision))
+        partial = -precision / np.outer(d, d)
+        
+        r2 = R ** 2
+        partial2 = partial ** 2
+        np.fill_diagonal(r2, 0)
+        np.fill_diagonal(partial2, 0)
+        
+        kmo_per_item = r2.sum(axis=0) / (r2.sum(axis=0) + partial2.sum(axis=0))
+        kmo_total = r2.sum() / (r2.sum() + partial2.sum())
+        return kmo_per_item, kmo_total
+    
+    def bartlett_from_corr(self, R, n):
+        """Bartlett's test of sphericity from a correlation matrix and sample size"""
+        
+        p = R.shape[0]
+        _, logdet = np.linalg.slogdet(R)
+        chi_square = -logdet * (n - 1 - (2 * p + 5) / 6)
+        degrees_of_freedom = p * (p - 1) / 2
+        return chi_square, stats.chi2.sf(chi_square, degrees_of_freedom)
+    
+    @profiled(rows=data_rows)
     def confirmatory_factor_analysis(self):
         """Perform CFA-like analysis on actual data"""
         
@@ -284,10 +1070,11 @@ class ComprehensiveAnalyzer:
         }
         
         cfa_results = {}
+        data = self.model_data()
         
         for dim_name, items in dimensions.items():
-            # Calculate loadings as correlations with dimension score
-            loadings = self.df[items].corrwith(self.df[f'{dim_name}_Score'])
+            # Standardized loadings from the one-factor solution (model rows, as in the EFA)
+            loadings = self.factor_loadings(dim_name, data, self.model_subgroup(data))
             
             cr = self.composite_reliability(loadings)
             ave = self.average_variance_extracted(loadings)
@@ -297,7 +1084,8 @@ class ComprehensiveAnalyzer:
                 'loadings_min': float(loadings.min()),
                 'loadings_max': float(loadings.max()),
                 'composite_reliability': float(cr),
-                'ave': float(ave)
+                'ave': float(ave),
+                'loadings': {item: float(loading) for item, loading in loadings.items()}
             }
         
         self.results['cfa'] = {
@@ -308,6 +1096,7 @@ class ComprehensiveAnalyzer:
         for dim, res in cfa_results.items():
             print(f"  {dim}: CR = {res['composite_reliability']:.3f}, AVE = {res['ave']:.3f}")
     
+    @profiled(rows=data_rows)
     def country_comparisons(self):
         """Perform t-tests and MANOVA from actual data"""
         
@@ -317,10 +1106,10 @@ class ComprehensiveAnalyzer:
         ttest_results = {}
         
         for dim in dimensions:
-            japan_scores = self.japan_df[dim].values
-            vietnam_scores = self.vietnam_df[dim].values
+            japan_scores = self.japan_df[dim].dropna().values
+            vietnam_scores = self.vietnam_df[dim].dropna().values
             
-            t_stat, p_val = ttest_ind(japan_scores, vietnam_scores)
+            t_stat, p_val = stats.ttest_ind(japan_scores, vietnam_scores)
             cohens_d = self.cohens_d(pd.Series(japan_scores), pd.Series(vietnam_scores))
             
             ttest_results[dim] = {
@@ -333,10 +1122,26 @@ class ComprehensiveAnalyzer:
                 'cohens_d': float(cohens_d)
             }
         
+        # Outcome t-tests
+        outcome_results = {}
+        for outcome in ['OI_Score', 'SA_Score', 'OL_Score']:
+            japan_scores = self.japan_df[outcome].dropna()
+            vietnam_scores = self.vietnam_df[outcome].dropna()
+            t_stat, p_val = stats.ttest_ind(japan_scores, vietnam_scores)
+            
+            outcome_results[outcome] = {
+                'japan_mean': float(japan_scores.mean()),
+                'japan_sd': float(japan_scores.std()),
+                'vietnam_mean': float(vietnam_scores.mean()),
+                'vietnam_sd': float(vietnam_scores.std()),
+                't_statistic': float(t_stat),
+                'p_value': float(p_val)
+            }
+        
         # MANOVA
         try:
             manova_formula = 'TC_Score + CMC_Score + EA_Score + ALO_Score ~ Country'
-            manova_model = MANOVA.from_formula(manova_formula, data=self.df)
+            manova_model = manova.MANOVA.from_formula(manova_formula, data=self.df)
             manova_results_obj = manova_model.mv_test()
             manova_summary = str(manova_results_obj)
         except:
@@ -344,6 +1149,7 @@ class ComprehensiveAnalyzer:
         
         self.results['country_comparisons'] = {
             'ttests': ttest_results,
+            'outcome_ttests': outcome_results,
             'manova': manova_summary
         }
         
@@ -353,35 +1159,52 @@ class ComprehensiveAnalyzer:
             p = ttest_results[dim]['p_value']
             print(f"  {dim}: d = {d:.2f}, p = {p:.4f}")
     
+    @profiled(rows=data_rows)
     def correlation_analysis(self):
         """Calculate correlations from actual data"""
         
         dimensions = ['TC_Score', 'CMC_Score', 'EA_Score', 'ALO_Score']
         
-        corr_matrix = self.df[dimensions].corr()
+        corr_matrix, _ = self.correlation_matrix(self.df, dimensions)
+        corr_matrix = pd.DataFrame(corr_matrix, index=dimensions, columns=dimensions)
         
-        # Calculate square root of AVE
+        # Calculate square root of AVE (from the CFA's model rows)
         ave_values = {}
+        data = self.model_data()
         for dim in ['TC_Score', 'CMC_Score', 'EA_Score', 'ALO_Score']:
-            dim_prefix = dim.replace('_Score', '')
-            items = [f'{dim_prefix}{i}' for i in range(1, 9)]
-            loadings = self.df[items].corrwith(self.df[dim])
+            loadings = self.factor_loadings(dim.replace('_Score', ''), data, self.model_subgroup(data))
             ave = self.average_variance_extracted(loadings)
             ave_values[dim] = float(np.sqrt(ave))
         
+        # All study variables: pairwise-complete correlations and their p-values
+        study_vars = ['Age', 'Tenure_Years'] + dimensions + [
+            'OI_Score', 'SA_Score', 'OL_Score', 'Overall_Success',
+            'PD_Score', 'UA_Score', 'Collectivism_Score', 'LTO_Score'
+        ]
+        _, _, study_corr, n_pairs = self.pairwise_moments(self.df[study_vars].values)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t_stat = study_corr * np.sqrt((n_pairs - 2) / (1 - study_corr ** 2))
+        study_p = 2 * stats.t.sf(np.abs(t_stat), n_pairs - 2)
+        np.fill_diagonal(study_p, 0.0)
+        
         self.results['correlations'] = {
             'correlation_matrix': corr_matrix.to_dict(),
-            'sqrt_ave': ave_values
+            'sqrt_ave': ave_values,
+            'study_variables': {
+                'correlation_matrix': pd.DataFrame(study_corr, index=study_vars, columns=study_vars).to_dict(),
+                'p_values': pd.DataFrame(study_p, index=study_vars, columns=study_vars).to_dict()
+            }
         }
         
         print("✓ Correlation analysis complete from actual data")
         print(f"  Correlation range: {corr_matrix.values[np.triu_indices_from(corr_matrix.values, k=1)].min():.2f} to {corr_matrix.values[np.triu_indices_from(corr_matrix.values, k=1)].max():.2f}")
     
+    @profiled(rows=data_rows)
     def hierarchical_regression(self):
         """Perform hierarchical regression from actual data"""
         
         # Prepare data
-        df_reg = self.df.copy()
+        df_reg = self.model_data().copy()
         
         # Encode categorical variables
         df_reg['Gender_Male'] = (df_reg['Gender'] == 'Male').astype(int)
@@ -397,34 +1220,40 @@ class ComprehensiveAnalyzer:
             
             # Step 1: Controls only
             control_vars = ['Age', 'Gender_Male', 'Position_Dept', 'Position_Senior', 'Org_Size_Numeric']
-            X1 = dataset[control_vars].copy()
-            X1 = sm.add_constant(X1)
             y = dataset['Overall_Success']
             
-            model1 = sm.OLS(y, X1).fit()
+            model1 = self.fit_ols(dataset, 'Overall_Success', control_vars)
             
             # Step 2: Add readiness dimensions
             readiness_vars = ['TC_Score', 'CMC_Score', 'EA_Score', 'ALO_Score']
-            X2 = dataset[control_vars + readiness_vars].copy()
-            X2 = sm.add_constant(X2)
-            
-            model2 = sm.OLS(y, X2).fit()
+            model2 = self.fit_ols(dataset, 'Overall_Success', control_vars + readiness_vars)
             
             # Calculate R² change
             r2_change = model2.rsquared - model1.rsquared
             
             # Extract standardized coefficients
             X2_std = dataset[control_vars + readiness_vars].copy()
-            y_std = (y - y.mean()) / y.std()
-            for col in X2_std.columns:
+            X2_std['Overall_Success'] = (y - y.mean()) / y.std()
+            for col in control_vars + readiness_vars:
                 X2_std[col] = (X2_std[col] - X2_std[col].mean()) / X2_std[col].std()
-            X2_std = sm.add_constant(X2_std)
-            model2_std = sm.OLS(y_std, X2_std).fit()
+            model1_std = self.fit_ols(X2_std, 'Overall_Success', control_vars)
+            model2_std = self.fit_ols(X2_std, 'Overall_Success', control_vars + readiness_vars)
+            
+            # F tests of each step's R² and of the R² change
+            n_obs, k1, k2 = float(model2.nobs), len(control_vars), len(control_vars) + len(readiness_vars)
+            f_model1 = (model1.rsquared / k1) / ((1 - model1.rsquared) / (n_obs - k1 - 1))
+            f_model2 = (model2.rsquared / k2) / ((1 - model2.rsquared) / (n_obs - k2 - 1))
+            f_change = (r2_change / (k2 - k1)) / ((1 - model2.rsquared) / (n_obs - k2 - 1))
             
             regression_results[dataset_name] = {
                 'model1_r2': float(model1.rsquared),
                 'model2_r2': float(model2.rsquared),
                 'r2_change': float(r2_change),
+                'model1_p': float(stats.f.sf(f_model1, k1, n_obs - k1 - 1)),
+                'model2_p': float(stats.f.sf(f_model2, k2, n_obs - k2 - 1)),
+                'r2_change_p': float(stats.f.sf(f_change, k2 - k1, n_obs - k2 - 1)),
+                'control_coefficients': {var: float(model1_std.params[var]) for var in control_vars},
+                'control_p_values': {var: float(model1.pvalues[var]) for var in control_vars},
                 'coefficients': {
                     'TC': float(model2_std.params['TC_Score']),
                     'CMC': float(model2_std.params['CMC_Score']),
@@ -454,10 +1283,11 @@ class ComprehensiveAnalyzer:
         for dim, coef in regression_results['Combined']['coefficients'].items():
             print(f"    {dim}: β = {coef:.3f}")
     
+    @profiled(rows=data_rows)
     def moderation_analysis(self):
         """Test moderation effects from actual data"""
         
-        df_mod = self.df.copy()
+        df_mod = self.model_data().copy()
         
         # Center variables
         df_mod['TC_c'] = df_mod['TC_Score'] - df_mod['TC_Score'].mean()
@@ -487,11 +1317,7 @@ class ComprehensiveAnalyzer:
         ]
         
         for predictor, moderator, interaction, mod_name in interactions:
-            X = df_mod[[predictor, moderator, interaction]].copy()
-            X = sm.add_constant(X)
-            y = df_mod['Overall_Success']
-            
-            model = sm.OLS(y, X).fit()
+            model = self.fit_ols(df_mod, 'Overall_Success', [predictor, moderator, interaction])
             
             # Calculate simple slopes at +1 SD and -1 SD of moderator
             mod_std = df_mod[moderator].std()
@@ -525,17 +1351,15 @@ class ComprehensiveAnalyzer:
                 print(f"    Simple slope at high {mod_name}: {results['simple_slope_high']:.2f}")
                 print(f"    Simple slope at low {mod_name}: {results['simple_slope_low']:.2f}")
     
+    @profiled(rows=data_rows)
     def dominance_analysis(self):
         """Calculate relative importance from actual data"""
         
-        df_dom = self.df.copy()
+        df_dom = self.model_data().copy()
         predictors = ['TC_Score', 'CMC_Score', 'EA_Score', 'ALO_Score']
-        y = df_dom['Overall_Success']
         
         # Full model R²
-        X_full = df_dom[predictors].copy()
-        X_full = sm.add_constant(X_full)
-        model_full = sm.OLS(y, X_full).fit()
+        model_full = self.fit_ols(df_dom, 'Overall_Success', predictors)
         total_r2 = model_full.rsquared
         
         # Calculate individual contributions using sequential R²
@@ -545,9 +1369,7 @@ class ComprehensiveAnalyzer:
             other_preds = [p for p in predictors if p != pred]
             
             # Model without this predictor
-            X_without = df_dom[other_preds].copy()
-            X_without = sm.add_constant(X_without)
-            model_without = sm.OLS(y, X_without).fit()
+            model_without = self.fit_ols(df_dom, 'Overall_Success', other_preds)
             r2_without = model_without.rsquared
             
             # Contribution is the difference
@@ -568,6 +1390,214 @@ class ComprehensiveAnalyzer:
         for pred, imp in sorted_imp:
             print(f"  {pred}: {imp:.1f}%")
     
+    def pool_rubin(self, estimates, variances, df_com=None):
+        """
+        Pool one estimate across imputations with Rubin's rules. Degrees of freedom use
+        the Barnard-Rubin small-sample adjustment when the complete-data df is known.
+        """
+        
+        q = np.asarray(estimates, dtype=float)
+        u = np.asarray(variances, dtype=float)
+        m = len(q)
+        
+        q_bar = q.mean()
+        within = u.mean()
+        between = q.var(ddof=1)
+        total = within + (1 + 1 / m) * between
+        
+        # Proportion of variance due to nonresponse, and relative increase in variance
+        lam = (1 + 1 / m) * between / total
+        r = (1 + 1 / m) * between / within
+        
+        inv_df = lam ** 2 / (m - 1)
+        if df_com is not None:
+            df_obs = (df_com + 1) / (df_com + 3) * df_com * (1 - lam)
+            inv_df += 1 / df_obs
+        df = 1 / inv_df if inv_df > 0 else np.inf
+        
+        t_stat = q_bar / np.sqrt(total)
+        return {
+            'estimate': float(q_bar),
+            'se': float(np.sqrt(total)),
+            't': float(t_stat),
+            'df': float(df),
+            'p_value': float(2 * stats.t.sf(np.abs(t_stat), df)),
+            'fmi': float((r + 2 / (df + 3)) / (r + 1)),
+            'within_var': float(within),
+            'between_var': float(between)
+        }
+    
+    def _analyzer_for(self, data):
+        """Shallow copy of this analyzer over another dataset, with fresh results and caches"""
+        
+        clone = copy.copy(self)
+        clone.df = data
+        clone.japan_df = data[data['Country'] == 'Japan'].copy()
+        clone.vietnam_df = data[data['Country'] == 'Vietnam'].copy()
+        clone.results = {}
+        clone._factor_cache = {}
+        clone._moment_cache = {}
+        return clone
+    
+    @profiled(rows=data_rows)
+    def multiple_imputation(self, m=20, workers=None, seed=42, round_items=True):
+        """
+        Multiple imputation of missing Likert items under a joint multivariate normal
+        model (all scale items plus age, tenure, organization size and country,
+        gender and position dummies). The M imputations run in worker processes that
+        read the data matrix from shared memory; each one reruns the country
+        comparisons, hierarchical regression and moderation analysis, and the
+        estimates are pooled with Rubin's rules.
+        """
+        
+        items = list(dict.fromkeys(item for scale_items in SCALE_ITEMS.values() for item in scale_items))
+        items = [item for item in items if item in self.df.columns]
+        missing_rate = float(self.df[items].isna().values.mean())
+        
+        if missing_rate == 0:
+            print("✓ No missing items - multiple imputation not needed")
+            return None
+        
+        covariates = pd.get_dummies(self.df[['Country', 'Gender', 'Position_Level']], drop_first=True, dtype=float)
+        model_data = pd.concat([self.df[items + ['Age', 'Tenure_Years', 'Org_Size_Numeric']], covariates], axis=1)
+        X = model_data.values.astype(float)
+        missing = np.isnan(X)
+        
+        # Likert items are bounded 1-7 (and integer when round_items); covariates are free
+        lower = np.full(X.shape[1], -np.inf)
+        upper = np.full(X.shape[1], np.inf)
+        lower[:len(items)], upper[:len(items)] = 1, 7
+        integer = np.zeros(X.shape[1], dtype=bool)
+        integer[:len(items)] = round_items
+        
+        workers = workers or min(m, os.cpu_count() or 1)
+        shm = shared_memory.SharedMemory(create=True, size=X.nbytes)
+        try:
+            np.ndarray(X.shape, dtype=float, buffer=shm.buf)[:] = X
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                draws = list(pool.map(draw_imputation, [shm.name] * m, [X.shape] * m,
+                                      [[seed, i] for i in range(m)],
+                                      [lower] * m, [upper] * m, [integer] * m))
+        finally:
+            shm.close()
+            shm.unlink()
+        
+        # Rerun the analyses on every completed dataset; composites are recomputed
+        # only in rows where one of their items was imputed
+        imputed_rows = missing[:, :len(items)].any(axis=1)
+        runs = []
+        for values in draws:
+            completed = X.copy()
+            completed[missing] = values
+            imputed = self.df.copy()
+            imputed[items] = completed[:, :len(items)]
+            scores = self.recompute_composites(imputed)
+            imputed.loc[imputed_rows, scores.columns] = scores.values[imputed_rows]
+            
+            analyzer = self._analyzer_for(imputed)
+            with contextlib.redirect_stdout(io.StringIO()):
+                analyzer.country_comparisons()
+                analyzer.hierarchical_regression()
+                analyzer.moderation_analysis()
+            runs.append(analyzer.results)
+        
+        def average(values):
+            return float(np.mean(values))
+        
+        def pool_t(estimates, t_values, df_com):
+            # Standard errors recovered from the reported t statistics
+            estimates = np.asarray(estimates, dtype=float)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                variances = (estimates / np.asarray(t_values, dtype=float)) ** 2
+            return self.pool_rubin(estimates, variances, df_com)
+        
+        # Country comparisons: Japan - Vietnam mean difference per dimension
+        n_japan, n_vietnam = len(self.japan_df), len(self.vietnam_df)
+        comparisons = {}
+        for dim in runs[0]['country_comparisons']['ttests']:
+            res = [run['country_comparisons']['ttests'][dim] for run in runs]
+            comparisons[dim] = {
+                'mean_difference': pool_t([r['japan_mean'] - r['vietnam_mean'] for r in res],
+                                          [r['t_statistic'] for r in res], n_japan + n_vietnam - 2),
+                'japan_mean': average([r['japan_mean'] for r in res]),
+                'vietnam_mean': average([r['vietnam_mean'] for r in res]),
+                'cohens_d': average([r['cohens_d'] for r in res])
+            }
+        
+        # Hierarchical regression: 9 predictors + intercept in the full model
+        sample_sizes = {'Combined': len(self.df), 'Japan': n_japan, 'Vietnam': n_vietnam}
+        regression = {}
+        for name in runs[0]['hierarchical_regression']:
+            res = [run['hierarchical_regression'][name] for run in runs]
+            regression[name] = {
+                'model1_r2': average([r['model1_r2'] for r in res]),
+                'model2_r2': average([r['model2_r2'] for r in res]),
+                'r2_change': average([r['r2_change'] for r in res]),
+                'coefficients': {
+                    dim: pool_t([r['coefficients'][dim] for r in res], [r['t_values'][dim] for r in res],
+                                sample_sizes[name] - 10)
+                    for dim in res[0]['coefficients']
+                }
+            }
+        
+        # Moderation: predictor, moderator and interaction + intercept
+        moderation = {}
+        for mod_name in runs[0]['moderation']:
+            res = [run['moderation'][mod_name] for run in runs]
+            moderation[mod_name] = {
+                'interaction': pool_t([r['interaction_beta'] for r in res], [r['interaction_t'] for r in res],
+                                      len(self.df) - 4),
+                'predictor_beta': average([r['predictor_beta'] for r in res]),
+                'moderator_beta': average([r['moderator_beta'] for r in res]),
+                'simple_slope_high': average([r['simple_slope_high'] for r in res]),
+                'simple_slope_low': average([r['simple_slope_low'] for r in res])
+            }
+        
+        self.results['multiple_imputation'] = {
+            'model': 'joint multivariate normal (EM on bootstrap resamples)',
+            'm': m,
+            'item_missing_rate': missing_rate,
+            'imputed_cells': int(missing.sum()),
+            'country_comparisons': comparisons,
+            'hierarchical_regression': regression,
+            'moderation': moderation
+        }
+        
+        print(f"✓ Pooled {m} imputations ({missing_rate:.1%} of items missing, {workers} workers)")
+        for dim, res in regression['Combined']['coefficients'].items():
+            print(f"  {dim}: β = {res['estimate']:.3f} (SE = {res['se']:.3f}, p = {res['p_value']:.4f}, FMI = {res['fmi']:.2f})")
+        
+        return self.results['multiple_imputation']
+    
+    def run_config(self):
+        """Analysis options that change results (part of the results store run key)"""
+        return {
+            'missing': self.missing_method,
+            'imputations': self.imputations,
+            'repair_composites': self.repair_composites,
+            'screen': self.screen,
+            'outliers': self.outliers
+        }
+    
+    @profiled()
+    def record_run(self, output_dir, label=None):
+        """Store self.results in results.sqlite keyed by data hash, code version and config"""
+        
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        code_version = file_hash([os.path.abspath(__file__), os.path.join(script_dir, 'results_store.py'),
+                                  os.path.join(script_dir, 'careless_screening.py'),
+                                  os.path.join(script_dir, 'robust_outliers.py')])
+        
+        with ResultsStore(f'{output_dir}/results.sqlite') as store:
+            run_id = store.record_run(self.results, self.data_hash, code_version, self.run_config(),
+                                      data_dir=self.data_dir, label=label, commit=git_commit(script_dir))
+            run = store.runs().set_index('run_id').loc[run_id]
+        
+        self.run_id = run_id
+        print(f"✓ Recorded run {run_id} ({run['run_key']}, {run['n_statistics']} statistics) in {output_dir}/results.sqlite")
+        return run_id
+    
+    @profiled(rows=data_rows)
     def generate_outputs(self):
         """Generate tables and figures from actual data"""
         
@@ -580,23 +1610,12 @@ class ComprehensiveAnalyzer:
         
         print(f"✓ Saved: {output_dir}/analysis_results_from_data.json")
         
-        # Generate ALL dissertation tables from real data
+        # Record the run (one typed row per statistic) in the versioned results store
+        self.record_run(output_dir)
+        
+        # Generate ALL dissertation tables from real data (TXT, XLSX, CSV, LaTeX, Markdown)
         print("\nGenerating dissertation tables from actual data:")
-        self.generate_table_41(output_dir)  # Qualitative sample
-        self.generate_table_42(output_dir)  # Quantitative sample
-        self.generate_table_43(output_dir)  # Reliability
-        self.generate_table_44(output_dir)  # Discriminant validity
-        self.generate_table_45(output_dir)  # Country comparisons
-        self.generate_table_46(output_dir)  # Outcome means
-        self.generate_table_47(output_dir)  # Regression
-        self.generate_table_48(output_dir)  # Dominance
-        self.generate_table_49(output_dir)  # Moderation
-        self.generate_table_e1(output_dir)  # Factor loadings
-        self.generate_table_e2(output_dir)  # Full correlation matrix
-        
-        # Generate Excel file with all results
-        print("\nGenerating Excel file:")
-        self.generate_excel_output(output_dir)
+        self.generate_tables(output_dir)
         
         # Generate figures
         print("\nGenerating figures:")
@@ -607,549 +1626,407 @@ class ComprehensiveAnalyzer:
         
         print(f"\n✓ Generated all dissertation tables and figures in {output_dir}/")
     
-    def generate_table_41(self, output_dir):
-        """Generate Table 4.1: Qualitative Sample Characteristics from actual data"""
+    @profiled()
+    def generate_tables(self, output_dir, formats=None):
+        """Build every dissertation table once and render it in each output format"""
         
-        table = []
-        table.append("Table 4.1: Qualitative Sample Characteristics (FROM ACTUAL DATA)\n")
-        table.append("="*105)
+        tables = self.build_tables()
+        written = write_tables(tables, output_dir, formats)
         
-        japan_qual = self.qual_data[self.qual_data['Country'] == 'Japan']
-        vietnam_qual = self.qual_data[self.qual_data['Country'] == 'Vietnam']
-        total_qual = self.qual_data
+        for table in tables:
+            print(f"  ✓ {table.title.split(' (')[0]}")
+        for name, paths in written.items():
+            where = os.path.relpath(os.path.dirname(paths[0]), output_dir) if paths else '.'
+            print(f"  ✓ {name.upper()}: {len(paths)} file(s) in {where}/")
         
-        table.append(f"{'Characteristic':<30} {'Japan (n=' + str(len(japan_qual)) + ')':<25} {'Vietnam (n=' + str(len(vietnam_qual)) + ')':<25} {'Total (n=' + str(len(total_qual)) + ')':<25}")
-        table.append("-"*105)
+        return written
+    
+    def build_tables(self):
+        """All dissertation tables, built from self.results"""
+        return [
+            self.build_table_41(),   # Qualitative sample
+            self.build_table_42(),   # Quantitative sample
+            self.build_table_43(),   # Reliability
+            self.build_table_44(),   # Discriminant validity
+            self.build_table_45(),   # Country comparisons
+            self.build_table_46(),   # Outcome means
+            self.build_table_47(),   # Regression
+            self.build_table_48(),   # Dominance
+            self.build_table_49(),   # Moderation
+            self.build_table_e1(),   # Factor loadings
+            self.build_table_e2(),   # Full correlation matrix
+            self.build_summary_table(),
+            self.build_statistics_table()
+        ]
+    
+    @profiled()
+    def build_table_41(self):
+        """Table 4.1: Qualitative Sample Characteristics"""
+        
+        qual = self.results['qualitative_sample']
+        groups = ['Japan', 'Vietnam', 'Total']
         
-        # Average age
-        jp_age = japan_qual['Age'].mean()
-        vn_age = vietnam_qual['Age'].mean()
-        total_age = total_qual['Age'].mean()
-        table.append(f"{'Average Age':<30} {jp_age:.1f} years{'':<15} {vn_age:.1f} years{'':<15} {total_age:.1f} years")
+        table = Table('table_41_qualitative_sample',
+                      'Table 4.1: Qualitative Sample Characteristics (FROM ACTUAL DATA)',
+                      ['Characteristic'] + [f"{group} (n={qual[group]['n']})" for group in groups],
+                      sheet='Table 4.1 Qualitative')
         
-        # Gender
-        jp_male = (japan_qual['Gender'] == 'Male').mean() * 100
-        vn_male = (vietnam_qual['Gender'] == 'Male').mean() * 100
-        total_male = (total_qual['Gender'] == 'Male').mean() * 100
-        table.append(f"{'Gender (% Male)':<30} {jp_male:.0f}%{'':<20} {vn_male:.0f}%{'':<20} {total_male:.0f}%")
+        table.add_row('Average Age', *[Cell(qual[g]['age_mean'], '.1f', suffix=' years') for g in groups])
+        table.add_row('Gender (% Male)', *[Cell(qual[g]['gender_male_pct'], '.0f', suffix='%') for g in groups])
         
-        # Position
-        table.append("\nPosition:")
+        table.add_blank()
+        table.add_section('Position:')
         for pos in ['Senior Leader', 'Mid-level Leader']:
-            jp_pct = (japan_qual['Position'] == pos).mean() * 100
-            vn_pct = (vietnam_qual['Position'] == pos).mean() * 100
-            total_pct = (total_qual['Position'] == pos).mean() * 100
-            table.append(f"  {pos:<28} {jp_pct:.0f}%{'':<20} {vn_pct:.0f}%{'':<20} {total_pct:.0f}%")
-        
-        # Industry
-        table.append("\nIndustry:")
-        all_industries = sorted(set(japan_qual['Industry'].unique()) | set(vietnam_qual['Industry'].unique()))
-        for ind in all_industries:
-            jp_count = (japan_qual['Industry'] == ind).sum()
-            vn_count = (vietnam_qual['Industry'] == ind).sum()
-            total_count = (total_qual['Industry'] == ind).sum()
-            table.append(f"  {ind:<28} {jp_count}{'':<22} {vn_count}{'':<22} {total_count}")
-        
-        # Average experience
-        jp_exp = japan_qual['AI_Experience_Years'].mean()
-        vn_exp = vietnam_qual['AI_Experience_Years'].mean()
-        total_exp = total_qual['AI_Experience_Years'].mean()
-        table.append(f"\n{'Average AI Experience':<30} {jp_exp:.1f} years{'':<15} {vn_exp:.1f} years{'':<15} {total_exp:.1f} years")
-        
-        # Interview duration
-        jp_dur = japan_qual['Interview_Duration_Min'].mean()
-        vn_dur = vietnam_qual['Interview_Duration_Min'].mean()
-        total_dur = total_qual['Interview_Duration_Min'].mean()
-        table.append(f"{'Average Duration':<30} {jp_dur:.0f} minutes{'':<13} {vn_dur:.0f} minutes{'':<13} {total_dur:.0f} minutes")
-        
-        table.append("="*105)
-        
-        with open(f'{output_dir}/table_41_qualitative_sample.txt', 'w') as f:
-            f.write('\n'.join(table))
-        print(f"  ✓ Table 4.1: Qualitative Sample Characteristics")
-    
-    def generate_table_42(self, output_dir):
-        """Generate Table 4.2 from actual data"""
+            table.add_row(f'  {pos}', *[Cell(qual[g]['position_pct'][pos], '.0f', suffix='%') for g in groups])
         
-        desc = self.results['descriptive_stats']
+        table.add_blank()
+        table.add_section('Industry:')
+        for industry in sorted(qual['Total']['industry_count']):
+            table.add_row(f'  {industry}', *[Cell(qual[g]['industry_count'].get(industry, 0), 'd') for g in groups])
         
-        table = []
-        table.append("Table 4.2: Quantitative Sample Characteristics (FROM ACTUAL DATA)\n")
-        table.append("="*105)
+        table.add_blank()
+        table.add_row('Average AI Experience', *[Cell(qual[g]['ai_experience_mean'], '.1f', suffix=' years') for g in groups])
+        table.add_row('Average Duration', *[Cell(qual[g]['duration_mean'], '.0f', suffix=' minutes') for g in groups])
         
-        japan = desc['Japan']
-        vietnam = desc['Vietnam']
+        return table
+    
+    @profiled()
+    def build_table_42(self):
+        """Table 4.2: Quantitative Sample Characteristics"""
         
-        # Calculate total statistics
-        total_n = japan['n'] + vietnam['n']
-        total_age_mean = self.df['Age'].mean()
-        total_age_sd = self.df['Age'].std()
-        total_gender_male_pct = (self.df['Gender'] == 'Male').mean() * 100
-        total_tenure_mean = self.df['Tenure_Years'].mean()
-        total_tenure_sd = self.df['Tenure_Years'].std()
+        desc = self.results['descriptive_stats']
+        groups = ['Japan', 'Vietnam', 'Total']
         
-        table.append(f"{'Characteristic':<30} {'Japan (n=' + str(japan['n']) + ')':<25} {'Vietnam (n=' + str(vietnam['n']) + ')':<25} {'Total (n=' + str(total_n) + ')':<25}")
-        table.append("-"*105)
+        table = Table('table_42_sample_characteristics',
+                      'Table 4.2: Quantitative Sample Characteristics (FROM ACTUAL DATA)',
+                      ['Characteristic'] + [f"{group} (n={desc[group]['n']})" for group in groups],
+                      sheet='Table 4.2 Sample Char')
         
-        table.append(f"{'Average Age':<30} {japan['age_mean']:.1f} (SD={japan['age_sd']:.1f}){'':<3} {vietnam['age_mean']:.1f} (SD={vietnam['age_sd']:.1f}){'':<3} {total_age_mean:.1f} (SD={total_age_sd:.1f})")
-        table.append(f"{'Gender (% Male)':<30} {japan['gender_male_pct']:.1f}%{'':<18} {vietnam['gender_male_pct']:.1f}%{'':<18} {total_gender_male_pct:.1f}%")
-        table.append(f"{'Average Tenure (years)':<30} {japan['tenure_mean']:.1f} (SD={japan['tenure_sd']:.1f}){'':<3} {vietnam['tenure_mean']:.1f} (SD={vietnam['tenure_sd']:.1f}){'':<3} {total_tenure_mean:.1f} (SD={total_tenure_sd:.1f})")
+        table.add_row('Average Age', *[f"{desc[g]['age_mean']:.1f} (SD={desc[g]['age_sd']:.1f})" for g in groups])
+        table.add_row('Gender (% Male)', *[Cell(desc[g]['gender_male_pct'], '.1f', suffix='%') for g in groups])
+        table.add_row('Average Tenure (years)', *[f"{desc[g]['tenure_mean']:.1f} (SD={desc[g]['tenure_sd']:.1f})" for g in groups])
         
-        table.append("\nPosition Level:")
+        table.add_blank()
+        table.add_section('Position Level:')
         for pos in ['Team Leader', 'Department Head', 'Senior Executive']:
-            jp_pct = japan['position'].get(pos, 0) * 100
-            vn_pct = vietnam['position'].get(pos, 0) * 100
-            total_pct = (self.df['Position_Level'] == pos).mean() * 100
-            table.append(f"  {pos:<28} {jp_pct:.1f}%{'':<18} {vn_pct:.1f}%{'':<18} {total_pct:.1f}%")
-        
-        # Add Industry breakdown
-        table.append("\nIndustry:")
-        # Get all unique industries
-        all_industries = sorted(set(self.df['Industry'].unique()))
-        for industry in all_industries:
-            jp_pct = japan['industry'].get(industry, 0) * 100
-            vn_pct = vietnam['industry'].get(industry, 0) * 100
-            total_pct = (self.df['Industry'] == industry).mean() * 100
-            table.append(f"  {industry:<28} {jp_pct:.1f}%{'':<18} {vn_pct:.1f}%{'':<18} {total_pct:.1f}%")
-        
-        table.append("="*105)
-        
-        with open(f'{output_dir}/table_42_sample_characteristics.txt', 'w') as f:
-            f.write('\n'.join(table))
-        print(f"  ✓ Table 4.2: Sample Characteristics")
-    
-    def generate_table_43(self, output_dir):
-        """Generate Table 4.3 from actual data"""
+            table.add_row(f'  {pos}', *[Cell(desc[g]['position'].get(pos, 0) * 100, '.1f', suffix='%') for g in groups])
         
-        rel = self.results['reliability']
-        cfa = self.results['cfa']['dimensions']
-        
-        table = []
-        table.append("Table 4.3: Reliability Statistics (FROM ACTUAL DATA)\n")
-        table.append("="*110)
-        table.append(f"{'Dimension':<25} {'Cronbach α (Japan)':<20} {'Cronbach α (Vietnam)':<20} {'CR':<15} {'AVE':<15}")
-        table.append("-"*110)
-        
-        dim_names = {'TC': 'Technological Competence', 
-                     'CMC': 'Change Management', 
-                     'EA': 'Ethical Awareness', 
-                     'ALO': 'Adaptive Learning'}
-        
-        for dim, name in dim_names.items():
-            jp_alpha = rel[dim]['cronbach_alpha_japan']
-            vn_alpha = rel[dim]['cronbach_alpha_vietnam']
-            cr = cfa[dim]['composite_reliability']
-            ave = cfa[dim]['ave']
-            table.append(f"{name:<25} {jp_alpha:.2f}{'':<18} {vn_alpha:.2f}{'':<18} {cr:.2f}{'':<13} {ave:.2f}")
-        
-        table.append("="*110)
-        table.append("\nNote: Calculated from actual item responses")
-        
-        with open(f'{output_dir}/table_43_reliability.txt', 'w') as f:
-            f.write('\n'.join(table))
-        print(f"  ✓ Table 4.3: Reliability Statistics")
-    
-    def generate_table_44(self, output_dir):
-        """Generate Table 4.4: Discriminant Validity Assessment from actual data"""
-        
-        table = []
-        table.append("Table 4.4: Discriminant Validity Assessment (FROM ACTUAL DATA)\n")
-        table.append("="*80)
-        table.append("Correlation matrix with square root of AVE on diagonal\n")
-        table.append(f"{'Dimension':<25} {'1. TC':<12} {'2. CMC':<12} {'3. EA':<12} {'4. ALO':<12}")
-        table.append("-"*80)
-        
-        dimensions = ['TC_Score', 'CMC_Score', 'EA_Score', 'ALO_Score']
-        dim_names = ['1. Technological Competence', '2. Change Management', 
-                     '3. Ethical Awareness', '4. Adaptive Learning']
+        table.add_blank()
+        table.add_section('Industry:')
+        for industry in sorted(desc['Total']['industry']):
+            table.add_row(f'  {industry}', *[Cell(desc[g]['industry'].get(industry, 0) * 100, '.1f', suffix='%') for g in groups])
         
-        corr_matrix = self.df[dimensions].corr()
-        
-        # Calculate sqrt(AVE) for diagonal
-        sqrt_aves = []
-        for dim in dimensions:
-            dim_prefix = dim.replace('_Score', '')
-            items = [f'{dim_prefix}{i}' for i in range(1, 9)]
-            loadings = self.df[items].corrwith(self.df[dim])
-            ave = self.average_variance_extracted(loadings)
-            sqrt_aves.append(np.sqrt(ave))
+        return table
+    
+    @profiled()
+    def build_table_43(self):
+        """Table 4.3: Reliability Statistics"""
         
-        # Generate table
-        for i, (dim_name, sqrt_ave) in enumerate(zip(dim_names, sqrt_aves)):
-            row = [dim_name]
-            for j in range(4):
+        rel = self.results['reliability']
+        cfa = self.results['cfa']['dimensions']
+        omega = self.results['omega']['Overall']
+        
+        table = Table('table_43_reliability',
+                      'Table 4.3: Reliability Statistics (FROM ACTUAL DATA)',
+                      ['Dimension', 'Cronbach α (Japan)', 'Cronbach α (Vietnam)', 'Cronbach α (Overall)',
+                       'CR', 'AVE', 'ω', 'ω_h'],
+                      notes=['Note: Calculated from actual item responses',
+                             'CR, AVE and ω use one-factor loadings; ω_h uses the Schmid-Leiman bifactor solution.'],
+                      sheet='Table 4.3 Reliability')
+        
+        for dim, name in DIMENSION_NAMES.items():
+            table.add_row(name,
+                          Cell(rel[dim]['cronbach_alpha_japan'], '.2f'),
+                          Cell(rel[dim]['cronbach_alpha_vietnam'], '.2f'),
+                          Cell(rel[dim]['cronbach_alpha_overall'], '.2f'),
+                          Cell(cfa[dim]['composite_reliability'], '.2f'),
+                          Cell(cfa[dim]['ave'], '.2f'),
+                          Cell(omega[dim]['omega'], '.2f'),
+                          Cell(omega[dim]['omega_h'], '.2f'))
+        
+        return table
+    
+    @profiled()
+    def build_table_44(self):
+        """Table 4.4: Discriminant Validity Assessment"""
+        
+        corr = self.results['correlations']['correlation_matrix']
+        sqrt_ave = self.results['correlations']['sqrt_ave']
+        dims = list(DIMENSION_NAMES)
+        
+        table = Table('table_44_discriminant_validity',
+                      'Table 4.4: Discriminant Validity Assessment (FROM ACTUAL DATA)',
+                      ['Dimension'] + [f'{i}. {dim}' for i, dim in enumerate(dims, 1)],
+                      notes=['Note: Diagonal elements [in brackets] are square roots of AVE.',
+                             'Off-diagonal elements are correlations between constructs.'],
+                      sheet='Table 4.4 Discriminant')
+        
+        for i, dim in enumerate(dims):
+            cells = []
+            for j, other in enumerate(dims[:i + 1]):
                 if i == j:
-                    row.append(f"[{sqrt_ave:.2f}]")
-                elif j < i:
-                    row.append(f"{corr_matrix.iloc[i, j]:.2f}")
+                    cells.append(Cell(sqrt_ave[f'{dim}_Score'], '.2f', prefix='[', suffix=']'))
                 else:
-                    row.append("")
-            
-            table.append(f"{row[0]:<25} {row[1]:<12} {row[2]:<12} {row[3]:<12} {row[4]:<12}")
+                    cells.append(Cell(corr[f'{other}_Score'][f'{dim}_Score'], '.2f'))
+            table.add_row(f'{i + 1}. {DIMENSION_NAMES[dim]}', *cells)
         
-        table.append("="*80)
-        table.append("\nNote: Diagonal elements [in brackets] are square roots of AVE.")
-        table.append("Off-diagonal elements are correlations between constructs.")
-        
-        with open(f'{output_dir}/table_44_discriminant_validity.txt', 'w') as f:
-            f.write('\n'.join(table))
-        print(f"  ✓ Table 4.4: Discriminant Validity Assessment")
+        return table
     
-    def generate_table_45(self, output_dir):
-        """Generate Table 4.5 from actual data"""
+    @profiled()
+    def build_table_45(self):
+        """Table 4.5: Leadership Readiness Dimension Means by Country"""
         
         comp = self.results['country_comparisons']['ttests']
         
-        table = []
-        table.append("Table 4.5: Leadership Readiness Dimension Means by Country (FROM ACTUAL DATA)\n")
-        table.append("="*105)
-        table.append(f"{'Dimension':<25} {'Japan M (SD)':<18} {'Vietnam M (SD)':<18} {'t-value':<12} {'p-value':<12} {'d':<10}")
-        table.append("-"*105)
-        
-        dim_names = {
-            'TC_Score': 'Technological Competence',
-            'CMC_Score': 'Change Management',
-            'EA_Score': 'Ethical Awareness',
-            'ALO_Score': 'Adaptive Learning'
-        }
-        
-        for dim, name in dim_names.items():
-            jp_m = comp[dim]['japan_mean']
-            jp_sd = comp[dim]['japan_sd']
-            vn_m = comp[dim]['vietnam_mean']
-            vn_sd = comp[dim]['vietnam_sd']
-            t_val = comp[dim]['t_statistic']
-            p_val = comp[dim]['p_value']
-            d = comp[dim]['cohens_d']
-            
-            p_str = "<.001" if p_val < 0.001 else f"{p_val:.3f}"
-            sig = "***" if p_val < 0.001 else ("**" if p_val < 0.01 else ("*" if p_val < 0.05 else ""))
-            
-            table.append(f"{name:<25} {jp_m:.2f} ({jp_sd:.2f}){'':<4} {vn_m:.2f} ({vn_sd:.2f}){'':<4} {t_val:>9.2f}{sig:<3} {p_str:<12} {d:>8.2f}")
-        
-        table.append("="*105)
-        table.append("\n***p < .001, **p < .01, *p < .05")
-        
-        with open(f'{output_dir}/table_45_country_comparisons.txt', 'w') as f:
-            f.write('\n'.join(table))
-        print(f"  ✓ Table 4.5: Country Comparisons")
+        table = Table('table_45_country_comparisons',
+                      'Table 4.5: Leadership Readiness Dimension Means by Country (FROM ACTUAL DATA)',
+                      ['Dimension', 'Japan M', 'Japan SD', 'Vietnam M', 'Vietnam SD', 't-value', 'p-value', "Cohen's d"],
+                      notes=['***p < .001, **p < .01, *p < .05'],
+                      sheet='Table 4.5 Country Comp')
+        
+        for dim, name in DIMENSION_NAMES.items():
+            res = comp[f'{dim}_Score']
+            table.add_row(name,
+                          Cell(res['japan_mean'], '.2f'), Cell(res['japan_sd'], '.2f'),
+                          Cell(res['vietnam_mean'], '.2f'), Cell(res['vietnam_sd'], '.2f'),
+                          Cell(res['t_statistic'], '.2f', suffix=significance_stars(res['p_value'])),
+                          Cell(res['p_value'], 'p'),
+                          Cell(res['cohens_d'], '.2f'))
+        
+        return table
     
-    def generate_table_46(self, output_dir):
-        """Generate Table 4.6: AI Transformation Outcome Means from actual data"""
+    @profiled()
+    def build_table_46(self):
+        """Table 4.6: AI Transformation Outcome Means"""
         
-        table = []
-        table.append("Table 4.6: AI Transformation Outcome Means (FROM ACTUAL DATA)\n")
-        table.append("="*105)
-        table.append(f"{'Outcome Dimension':<30} {'Japan M (SD)':<20} {'Vietnam M (SD)':<20} {'t-value':<12} {'p-value':<12}")
-        table.append("-"*105)
-        
-        outcome_dims = {
+        comp = self.results['country_comparisons']['outcome_ttests']
+        outcomes = {
             'OI_Score': 'Operational Improvements',
             'SA_Score': 'Strategic Advantages',
             'OL_Score': 'Organizational Learning'
         }
         
-        for score_col, name in outcome_dims.items():
-            jp_scores = self.japan_df[score_col]
-            vn_scores = self.vietnam_df[score_col]
-            
-            jp_mean = jp_scores.mean()
-            jp_sd = jp_scores.std()
-            vn_mean = vn_scores.mean()
-            vn_sd = vn_scores.std()
-            
-            t_stat, p_val = ttest_ind(jp_scores, vn_scores)
-            
-            # Format p-value
-            if p_val < 0.001:
-                p_str = "<.001"
-                sig = "***"
-            elif p_val < 0.01:
-                p_str = f"{p_val:.3f}"
-                sig = "**"
-            elif p_val < 0.05:
-                p_str = f"{p_val:.3f}"
-                sig = "*"
-            else:
-                p_str = f"{p_val:.3f}"
-                sig = ""
-            
-            table.append(f"{name:<30} {jp_mean:.2f} ({jp_sd:.2f}){'':<6} {vn_mean:.2f} ({vn_sd:.2f}){'':<6} {t_stat:>9.2f}{sig:<3} {p_str:<12}")
-        
-        table.append("="*105)
-        table.append("\n***p < .001, **p < .01, *p < .05")
-        
-        with open(f'{output_dir}/table_46_outcome_means.txt', 'w') as f:
-            f.write('\n'.join(table))
-        print(f"  ✓ Table 4.6: AI Transformation Outcome Means")
+        table = Table('table_46_outcome_means',
+                      'Table 4.6: AI Transformation Outcome Means (FROM ACTUAL DATA)',
+                      ['Outcome Dimension', 'Japan M', 'Japan SD', 'Vietnam M', 'Vietnam SD', 't-value', 'p-value'],
+                      notes=['***p < .001, **p < .01, *p < .05'],
+                      sheet='Table 4.6 Outcomes')
+        
+        for outcome, name in outcomes.items():
+            res = comp[outcome]
+            table.add_row(name,
+                          Cell(res['japan_mean'], '.2f'), Cell(res['japan_sd'], '.2f'),
+                          Cell(res['vietnam_mean'], '.2f'), Cell(res['vietnam_sd'], '.2f'),
+                          Cell(res['t_statistic'], '.2f', suffix=significance_stars(res['p_value'])),
+                          Cell(res['p_value'], 'p'))
+        
+        return table
     
-    def generate_table_47(self, output_dir):
-        """Generate Table 4.7 from actual data"""
+    @profiled()
+    def build_table_47(self):
+        """Table 4.7: Hierarchical Regression Predicting AI Transformation Success"""
         
         reg = self.results['hierarchical_regression']
-        
-        table = []
-        table.append("Table 4.7: Hierarchical Regression Predicting AI Transformation Success (FROM ACTUAL DATA)\n")
-        table.append("="*85)
-        table.append(f"{'Predictors':<35} {'Japan β':<18} {'Vietnam β':<18} {'Combined β':<18}")
-        table.append("-"*85)
-        
-        # Step 1: Controls
-        table.append("\nStep 1: Controls")
-        table.append(f"{'Age':<35} {-.08:>17.2f}  {-.06:>17.2f}  {-.07:>17.2f}")
-        table.append(f"{'Gender (male=1)':<35} {.11:>17.2f}  {.09:>17.2f}  {.10:>17.2f}*")
-        table.append(f"{'Position level (Dept Head)':<35} {.14:>17.2f}* {.16:>17.2f}* {.15:>17.2f}**")
-        table.append(f"{'Position level (Senior Exec)':<35} {.18:>17.2f}**{.12:>17.2f}  {.15:>17.2f}**")
-        table.append(f"{'Organizational size':<35} {.18:>17.2f}**{.12:>17.2f}  {.15:>17.2f}**")
-        table.append(f"{'Industry (dummy variables)':<35} {'Yes':>17}  {'Yes':>17}  {'Yes':>17}")
-        table.append(f"{'R²':<35} {reg['Japan']['model1_r2']:>17.3f}**{reg['Vietnam']['model1_r2']:>17.3f}**{reg['Combined']['model1_r2']:>17.3f}***")
-        
-        # Empty line
-        table.append("")
-        
-        # Step 2: Readiness Dimensions
-        table.append("Step 2: Readiness Dimensions")
-        
-        dims = {
-            'TC': 'Technological Competence (H1)',
-            'CMC': 'Change Management Capability (H2)',
-            'EA': 'Ethical Awareness (H3)',
-            'ALO': 'Adaptive Learning Orientation (H4)'
+        samples = ['Japan', 'Vietnam', 'Combined']
+        controls = {
+            'Age': 'Age',
+            'Gender_Male': 'Gender (male=1)',
+            'Position_Dept': 'Position level (Dept Head)',
+            'Position_Senior': 'Position level (Senior Exec)',
+            'Org_Size_Numeric': 'Organizational size'
         }
         
-        for dim, name in dims.items():
-            jp_beta = reg['Japan']['coefficients'][dim]
-            vn_beta = reg['Vietnam']['coefficients'][dim]
-            cb_beta = reg['Combined']['coefficients'][dim]
-            
-            jp_p = reg['Japan']['p_values'][dim]
-            vn_p = reg['Vietnam']['p_values'][dim]
-            cb_p = reg['Combined']['p_values'][dim]
-            
-            jp_sig = "***" if jp_p < 0.001 else ("**" if jp_p < 0.01 else ("*" if jp_p < 0.05 else ""))
-            vn_sig = "***" if vn_p < 0.001 else ("**" if vn_p < 0.01 else ("*" if vn_p < 0.05 else ""))
-            cb_sig = "***" if cb_p < 0.001 else ("**" if cb_p < 0.01 else ("*" if cb_p < 0.05 else ""))
-            
-            table.append(f"{name:<35} {jp_beta:>14.3f}{jp_sig:<4} {vn_beta:>14.3f}{vn_sig:<4} {cb_beta:>14.3f}{cb_sig:<4}")
-        
-        table.append("\n" + "-"*85)
-        table.append(f"{'R² (Step 2)':<35} {reg['Japan']['model2_r2']:>17.3f}***{reg['Vietnam']['model2_r2']:>17.3f}***{reg['Combined']['model2_r2']:>17.3f}***")
-        table.append(f"{'ΔR²':<35} {reg['Japan']['r2_change']:>17.3f}***{reg['Vietnam']['r2_change']:>17.3f}***{reg['Combined']['r2_change']:>17.3f}***")
-        
-        table.append("="*85)
-        table.append("\nNote: ***p < .001, **p < .01, *p < .05")
-        table.append("Standardized regression coefficients (β) are shown.")
-        table.append("Control variables in Step 1: Demographics, position, organizational size, and industry.")
-        table.append("Readiness dimensions added in Step 2 show incremental variance explained (ΔR²).")
-        
-        with open(f'{output_dir}/table_47_regression.txt', 'w') as f:
-            f.write('\n'.join(table))
-        print(f"  ✓ Table 4.7: Hierarchical Regression")
+        def beta(sample, estimates, p_values, key):
+            return Cell(reg[sample][estimates][key], '.3f', suffix=significance_stars(reg[sample][p_values][key]))
+        
+        def r2(key, p_key):
+            return [Cell(reg[s][key], '.3f', suffix=significance_stars(reg[s][p_key])) for s in samples]
+        
+        table = Table('table_47_regression',
+                      'Table 4.7: Hierarchical Regression Predicting AI Transformation Success (FROM ACTUAL DATA)',
+                      ['Predictors'] + [f'{sample} β' for sample in samples],
+                      notes=['Note: ***p < .001, **p < .01, *p < .05',
+                             'Standardized regression coefficients (β) are shown.',
+                             'Control variables in Step 1: age, gender, position level and organizational size.',
+                             'Readiness dimensions added in Step 2 show incremental variance explained (ΔR²).'],
+                      sheet='Table 4.7 Regression')
+        
+        table.add_section('Step 1: Controls')
+        for var, name in controls.items():
+            table.add_row(name, *[beta(s, 'control_coefficients', 'control_p_values', var) for s in samples])
+        table.add_row('R²', *r2('model1_r2', 'model1_p'))
+        
+        table.add_blank()
+        table.add_section('Step 2: Readiness Dimensions')
+        for dim, hypothesis in [('TC', 'H1'), ('CMC', 'H2'), ('EA', 'H3'), ('ALO', 'H4')]:
+            table.add_row(f'{DIMENSION_NAMES[dim]} ({hypothesis})', *[beta(s, 'coefficients', 'p_values', dim) for s in samples])
+        table.add_row('R² (Step 2)', *r2('model2_r2', 'model2_p'))
+        table.add_row('ΔR²', *r2('r2_change', 'r2_change_p'))
+        
+        return table
     
-    def generate_table_48(self, output_dir):
-        """Generate Table 4.8 from actual data"""
+    @profiled()
+    def build_table_48(self):
+        """Table 4.8: Dominance Analysis Results"""
         
         dom = self.results['dominance']
         
-        table = []
-        table.append("Table 4.8: Dominance Analysis Results (FROM ACTUAL DATA)\n")
-        table.append("="*75)
-        table.append(f"{'Dimension':<40} {'Contribution to R²':<18} {'Relative %':<15}")
-        table.append("-"*75)
-        
-        sorted_dims = sorted(dom['relative_importance'].items(), key=lambda x: x[1], reverse=True)
+        table = Table('table_48_dominance',
+                      'Table 4.8: Dominance Analysis Results (FROM ACTUAL DATA)',
+                      ['Dimension', 'Contribution to R²', 'Relative %'],
+                      notes=[f"Total R² = {dom['total_r2']:.3f}"],
+                      sheet='Table 4.8 Dominance')
         
-        dim_names = {
-            'TC_Score': 'Technological Competence',
-            'CMC_Score': 'Change Management Capability',
-            'EA_Score': 'Ethical Awareness',
-            'ALO_Score': 'Adaptive Learning Orientation'
-        }
-        
-        for dim, ri in sorted_dims:
-            name = dim_names[dim]
-            gd = dom['general_dominance'][dim]
-            table.append(f"{name:<40} {gd:>16.3f}  {ri:>13.1f}%")
+        for score, importance in sorted(dom['relative_importance'].items(), key=lambda x: x[1], reverse=True):
+            table.add_row(DIMENSION_NAMES[score.replace('_Score', '')],
+                          Cell(dom['general_dominance'][score], '.3f'),
+                          Cell(importance, '.1f', suffix='%'))
         
-        table.append("="*75)
-        table.append(f"\nTotal R² = {dom['total_r2']:.3f}")
-        
-        with open(f'{output_dir}/table_48_dominance.txt', 'w') as f:
-            f.write('\n'.join(table))
-        print(f"  ✓ Table 4.8: Dominance Analysis")
+        return table
     
-    def generate_table_49(self, output_dir):
-        """Generate Table 4.9: Moderation Analysis Results from actual data"""
+    @profiled()
+    def build_table_49(self):
+        """Table 4.9: Moderation Analysis Results, with the simple slopes narrative as notes"""
         
         mod = self.results['moderation']
         
-        table = []
-        table.append("Table 4.9: Moderation Analysis Results (FROM ACTUAL DATA)\n")
-        table.append("="*100)
-        table.append(f"{'Interaction Term':<45} {'β':<12} {'t-value':<12} {'p-value':<15} {'Sig':<10}")
-        table.append("-"*100)
-        
+        # (moderator, dimension, moderator wording, low label, high label, interpretation)
         interactions = [
-            ('Power Distance', 'Technological Competence × Power Distance'),
-            ('Uncertainty Avoidance', 'Change Management × Uncertainty Avoidance'),
-            ('Collectivism', 'Ethical Awareness × Collectivism'),
-            ('Long-term Orientation', 'Adaptive Learning × Long-term Orientation')
-        ]
-        
-        for mod_name, int_name in interactions:
-            if mod_name in mod:
-                beta = mod[mod_name]['interaction_beta']
-                t_val = mod[mod_name]['interaction_t']
-                p_val = mod[mod_name]['interaction_p']
-                
-                p_str = "<.001" if p_val < 0.001 else f"{p_val:.3f}"
-                sig = "***" if p_val < 0.001 else ("**" if p_val < 0.01 else ("*" if p_val < 0.05 else "ns"))
-                
-                table.append(f"{int_name:<45} {beta:>9.3f}  {t_val:>10.2f}  {p_str:<15} {sig:<10}")
-        
-        table.append("="*100)
-        table.append("\n***p < .001, **p < .01, *p < .05, ns = not significant")
-        table.append("\nNote: Controlling for main effects of readiness dimensions, cultural values, and covariates.")
-        
-        # Add simple slopes analysis
-        table.append("\n" + "="*100)
-        table.append("SIMPLE SLOPES ANALYSIS")
-        table.append("="*100)
-        
-        # Detailed narrative for each significant interaction
-        interactions_detail = [
-            ('Power Distance', 'TC', 'technological competence', 'power distance', 
-             'egalitarian', 'hierarchical', 'leader technological competence matters more for success'),
-            ('Uncertainty Avoidance', 'CMC', 'change management capability', 'uncertainty avoidance',
-             'low uncertainty avoidance', 'high uncertainty avoidance', 
+            ('Power Distance', 'TC', 'power distance', 'egalitarian', 'hierarchical',
+             'leader technological competence matters more for success'),
+            ('Uncertainty Avoidance', 'CMC', 'uncertainty avoidance',
+             'low uncertainty avoidance', 'high uncertainty avoidance',
              'structured change management becomes more critical in cultures emphasizing stability'),
-            ('Collectivism', 'EA', 'ethical awareness', 'collectivism',
-             'individualist cultures', 'collectivist cultures',
+            ('Collectivism', 'EA', 'collectivism', 'individualist cultures', 'collectivist cultures',
              'collective welfare concerns amplify the importance of ethical considerations'),
-            ('Long-term Orientation', 'ALO', 'adaptive learning orientation', 'long-term orientation',
+            ('Long-term Orientation', 'ALO', 'long-term orientation',
              'low long-term orientation', 'high long-term orientation',
              'future focus enhances the value of continuous learning')
         ]
         
-        sig_count = 0
-        for mod_name, dim, dim_full, mod_full, low_label, high_label, interpretation in interactions_detail:
-            if mod_name in mod:
-                beta = mod[mod_name]['interaction_beta']
-                p_val = mod[mod_name]['interaction_p']
-                slope_high = mod[mod_name]['simple_slope_high']
-                slope_low = mod[mod_name]['simple_slope_low']
-                
-                if p_val < 0.05:
-                    sig_count += 1
-                    p_str = "p < .001" if p_val < 0.001 else (f"p < .01" if p_val < 0.01 else f"p < .05")
-                    
-                    table.append(f"\n{sig_count}. {mod_full.capitalize()} moderated {dim_full} effects (β = {beta:.2f}, {p_str}).")
-                    table.append(f"   Simple slopes analysis showed {dim_full} predicted outcomes more strongly at")
-                    
-                    if slope_high > slope_low:
-                        table.append(f"   {high_label} (β = {slope_high:.2f}) than {low_label} (β = {slope_low:.2f}).")
-                    else:
-                        table.append(f"   {low_label} (β = {slope_low:.2f}) than {high_label} (β = {slope_high:.2f}).")
-                    
-                    table.append(f"   Interpretation: In {high_label if slope_high > slope_low else low_label} contexts,")
-                    table.append(f"   {interpretation}.")
-        
-        if sig_count == 0:
-            table.append("\nNo significant moderation effects were found.")
-        
-        table.append("\n" + "="*100)
-        table.append("\nSimple slopes calculated at ±1 SD of the moderator variable.")
-        table.append("High = +1 SD above mean; Low = -1 SD below mean.")
-        
-        with open(f'{output_dir}/table_49_moderation.txt', 'w') as f:
-            f.write('\n'.join(table))
-        print(f"  ✓ Table 4.9: Moderation Analysis")
-    
-    def generate_table_e1(self, output_dir):
-        """Generate Table E.1: Factor Loadings from CFA from actual data"""
-        
-        table = []
-        table.append("Table E.1: Factor Loadings from Confirmatory Factor Analysis (FROM ACTUAL DATA)\n")
-        table.append("="*70)
-        table.append(f"{'Item':<10} {'TC':<12} {'CMC':<12} {'EA':<12} {'ALO':<12}")
-        table.append("-"*70)
-        
-        dimensions = {
-            'TC': [f'TC{i}' for i in range(1, 9)],
-            'CMC': [f'CMC{i}' for i in range(1, 9)],
-            'EA': [f'EA{i}' for i in range(1, 9)],
-            'ALO': [f'ALO{i}' for i in range(1, 9)]
-        }
-        
-        for dim_name, items in dimensions.items():
-            loadings = self.df[items].corrwith(self.df[f'{dim_name}_Score'])
+        table = Table('table_49_moderation',
+                      'Table 4.9: Moderation Analysis Results (FROM ACTUAL DATA)',
+                      ['Interaction Term', 'β', 't-value', 'p-value', 'Sig', 'Slope (High)', 'Slope (Low)'],
+                      sheet='Table 4.9 Moderation')
+        
+        narrative = []
+        for mod_name, dim, mod_full, low_label, high_label, interpretation in interactions:
+            if mod_name not in mod:
+                continue
+            res = mod[mod_name]
+            table.add_row(f'{DIMENSION_NAMES[dim]} × {mod_name}',
+                          Cell(res['interaction_beta'], '.3f'),
+                          Cell(res['interaction_t'], '.2f'),
+                          Cell(res['interaction_p'], 'p'),
+                          significance_stars(res['interaction_p'], ns='ns'),
+                          Cell(res['simple_slope_high'], '.2f'),
+                          Cell(res['simple_slope_low'], '.2f'))
             
-            for item, loading in zip(items, loadings):
-                row = [item]
-                for other_dim in ['TC', 'CMC', 'EA', 'ALO']:
-                    if other_dim == dim_name:
-                        row.append(f"{loading:.3f}")
-                    else:
-                        row.append("")
-                
-                table.append(f"{row[0]:<10} {row[1]:<12} {row[2]:<12} {row[3]:<12} {row[4]:<12}")
-        
-        table.append("="*70)
-        table.append("\nNote: All loadings significant at p < .001.")
-        
-        with open(f'{output_dir}/table_e1_factor_loadings.txt', 'w') as f:
-            f.write('\n'.join(table))
-        print(f"  ✓ Table E.1: Factor Loadings")
-    
-    def generate_table_e2(self, output_dir):
-        """Generate Table E.2: Full Correlation Matrix from actual data"""
-        
-        variables = [
-            'Age', 'Tenure_Years', 'TC_Score', 'CMC_Score', 'EA_Score', 'ALO_Score',
-            'OI_Score', 'SA_Score', 'OL_Score', 'Overall_Success',
-            'PD_Score', 'UA_Score', 'Collectivism_Score', 'LTO_Score'
+            if res['interaction_p'] < 0.05:
+                dim_full = DIMENSION_NAMES[dim].lower()
+                p_text = "p < .001" if res['interaction_p'] < 0.001 else ("p < .01" if res['interaction_p'] < 0.01 else "p < .05")
+                stronger, weaker = ((high_label, res['simple_slope_high']), (low_label, res['simple_slope_low']))
+                if res['simple_slope_low'] > res['simple_slope_high']:
+                    stronger, weaker = weaker, stronger
+                narrative.append(f"{len(narrative) // 4 + 1}. {mod_full.capitalize()} moderated {dim_full} effects "
+                                 f"(β = {res['interaction_beta']:.2f}, {p_text}).")
+                narrative.append(f"   Simple slopes analysis showed {dim_full} predicted outcomes more strongly at")
+                narrative.append(f"   {stronger[0]} (β = {stronger[1]:.2f}) than {weaker[0]} (β = {weaker[1]:.2f}).")
+                narrative.append(f"   Interpretation: In {stronger[0]} contexts, {interpretation}.")
+        
+        table.notes = [
+            '***p < .001, **p < .01, *p < .05, ns = not significant',
+            'Note: Controlling for main effects of readiness dimensions, cultural values, and covariates.',
+            '',
+            'SIMPLE SLOPES ANALYSIS'
+        ] + (narrative or ['No significant moderation effects were found.']) + [
+            '',
+            'Simple slopes calculated at ±1 SD of the moderator variable.',
+            'High = +1 SD above mean; Low = -1 SD below mean.'
         ]
         
-        var_labels = [
-            '1. Age', '2. Tenure', '3. TC', '4. CMC', '5. EA', '6. ALO',
-            '7. OI', '8. SA', '9. OL', '10. Overall', '11. PD', '12. UA', 
-            '13. Coll', '14. LTO'
-        ]
+        return table
+    
+    @profiled()
+    def build_table_e1(self):
+        """Table E.1: Factor Loadings from CFA"""
         
-        corr_matrix = self.df[variables].corr()
-        
-        table = []
-        table.append("Table E.2: Correlation Matrix of All Study Variables (FROM ACTUAL DATA)\n")
-        table.append("="*140)
-        
-        header = f"{'Variable':<15}"
-        for i in range(1, 15):
-            header += f"{i:<7}"
-        table.append(header)
-        table.append("-"*140)
-        
-        for i, (var, label) in enumerate(zip(variables, var_labels)):
-            row = f"{label:<15}"
-            for j in range(14):
-                if j <= i:
-                    if i == j:
-                        row += "—      "
-                    else:
-                        corr_val = corr_matrix.iloc[i, j]
-                        _, p_val = pearsonr(self.df[variables[i]].dropna(), self.df[variables[j]].dropna())
-                        sig = "**" if p_val < 0.01 else ("*" if p_val < 0.05 else "")
-                        row += f"{corr_val:.2f}{sig:<4}"
-                else:
-                    row += "       "
-            table.append(row)
+        cfa = self.results['cfa']['dimensions']
+        dims = list(DIMENSION_NAMES)
+        
+        table = Table('table_e1_factor_loadings',
+                      'Table E.1: Factor Loadings from Confirmatory Factor Analysis (FROM ACTUAL DATA)',
+                      ['Item'] + dims,
+                      notes=['Note: All loadings significant at p < .001.'],
+                      sheet='Table E.1 Loadings')
         
-        table.append("="*140)
-        table.append("\nNote: **p < .01, *p < .05")
+        for position, dim in enumerate(dims):
+            for item, loading in cfa[dim]['loadings'].items():
+                table.add_row(item, *([None] * position + [Cell(loading, '.3f')]))
         
-        with open(f'{output_dir}/table_e2_correlation_matrix.txt', 'w') as f:
-            f.write('\n'.join(table))
-        print(f"  ✓ Table E.2: Full Correlation Matrix")
+        return table
     
+    @profiled()
+    def build_table_e2(self):
+        """Table E.2: Correlation Matrix of All Study Variables"""
+        
+        study = self.results['correlations']['study_variables']
+        corr, p_values = study['correlation_matrix'], study['p_values']
+        variables = list(corr)
+        labels = ['Age', 'Tenure', 'TC', 'CMC', 'EA', 'ALO', 'OI', 'SA', 'OL', 'Overall',
+                  'PD', 'UA', 'Coll', 'LTO']
+        
+        table = Table('table_e2_correlation_matrix',
+                      'Table E.2: Correlation Matrix of All Study Variables (FROM ACTUAL DATA)',
+                      ['Variable'] + [str(i) for i in range(1, len(variables) + 1)],
+                      notes=['Note: **p < .01, *p < .05'],
+                      sheet='Table E.2 Full Corr')
+        
+        for i, (var, label) in enumerate(zip(variables, labels)):
+            cells = [Cell(corr[other][var], '.2f', suffix=significance_stars(p_values[other][var]).replace('***', '**'))
+                     for other in variables[:i]]
+            table.add_row(f'{i + 1}. {label}', *(cells + ['—']))
+        
+        return table
+    
+    @profiled()
+    def build_summary_table(self):
+        """Summary Statistics sheet"""
+        
+        desc = self.results['descriptive_stats']
+        total = desc['Total']
+        
+        table = Table('summary_statistics', 'Summary Statistics (FROM ACTUAL DATA)', ['Metric', 'Value'],
+                      sheet='Summary Statistics')
+        
+        table.add_row('Total Participants', Cell(total['n'], 'd'))
+        table.add_row('Japan Participants', Cell(desc['Japan']['n'], 'd'))
+        table.add_row('Vietnam Participants', Cell(desc['Vietnam']['n'], 'd'))
+        table.add_row('Interview Participants', Cell(self.results['qualitative_sample']['Total']['n'], 'd'))
+        table.add_row('Overall Mean Age', Cell(total['age_mean'], '.1f'))
+        table.add_row('Overall Mean Tenure', Cell(total['tenure_mean'], '.1f'))
+        table.add_row('Male Percentage', Cell(total['gender_male_pct'], '.1f', suffix='%'))
+        for pos, label in [('Team Leader', 'Team Leaders %'), ('Department Head', 'Department Heads %'),
+                           ('Senior Executive', 'Senior Executives %')]:
+            table.add_row(label, Cell(total['position'].get(pos, 0) * 100, '.1f', suffix='%'))
+        
+        return table
+    
+    @profiled()
+    def build_statistics_table(self):
+        """Every statistic in self.results, streamed row by row (workbook and CSV only)"""
+        
+        table = Table('all_statistics', 'All Statistics (FROM ACTUAL DATA)', ['Statistic', 'Type', 'Value'],
+                      sheet='All Statistics', formats=('xlsx', 'csv'))
+        
+        def rows():
+            for path, value_type, num_value, text_value in flatten_results(self.results):
+                yield path, value_type, text_value if value_type == 'text' else num_value
+        
+        table.add_rows(rows)
+        return table
+    
+    @profiled(rows=data_rows)
     def generate_figure_correlation_heatmap(self, output_dir):
         """Generate correlation heatmap from actual data"""
         
@@ -1167,6 +2044,7 @@ class ComprehensiveAnalyzer:
         plt.close()
         print(f"  ✓ Figure: Correlation Heatmap")
     
+    @profiled(rows=data_rows)
     def generate_figure_country_comparison(self, output_dir):
         """Generate country comparison from actual data"""
         
@@ -1199,16 +2077,18 @@ class ComprehensiveAnalyzer:
         plt.close()
         print(f"  ✓ Figure: Country Comparison")
     
+    @profiled(rows=data_rows)
     def generate_figure_regression_diagnostics(self, output_dir):
         """Generate regression diagnostic plots from actual data"""
         
-        df_reg = self.df.copy()
+        df_reg = self.model_data().copy()
         
         X = df_reg[['TC_Score', 'CMC_Score', 'EA_Score', 'ALO_Score']].copy()
         X = sm.add_constant(X)
         y = df_reg['Overall_Success']
         
-        model = sm.OLS(y, X).fit()
+        # Residual plots need per-respondent residuals, so complete cases only
+        model = sm.OLS(y, X, missing='drop').fit()
         
         fig, axes = plt.subplots(2, 2, figsize=(12, 10))
         
@@ -1245,6 +2125,7 @@ class ComprehensiveAnalyzer:
         plt.close()
         print(f"  ✓ Figure: Regression Diagnostics")
     
+    @profiled(rows=data_rows)
     def generate_figure_moderation_plots(self, output_dir):
         """Generate moderation interaction plots from actual data"""
         
@@ -1258,7 +2139,7 @@ class ComprehensiveAnalyzer:
             ('ALO_c', 'LTO_c', 'ALO_x_LTO', 'Long-term Orientation', 'ALO', axes[1, 1])
         ]
         
-        df_mod = self.df.copy()
+        df_mod = self.model_data().copy()
         
         for dim in ['TC', 'CMC', 'EA', 'ALO']:
             df_mod[f'{dim}_c'] = df_mod[f'{dim}_Score'] - df_mod[f'{dim}_Score'].mean()
@@ -1271,10 +2152,7 @@ class ComprehensiveAnalyzer:
         for predictor, moderator, interaction, mod_name, dim, ax in interactions:
             df_mod[interaction] = df_mod[predictor] * df_mod[moderator]
             
-            X = df_mod[[predictor, moderator, interaction]].copy()
-            X = sm.add_constant(X)
-            y = df_mod['Overall_Success']
-            model = sm.OLS(y, X).fit()
+            model = self.fit_ols(df_mod, 'Overall_Success', [predictor, moderator, interaction])
             
             mod_std = df_mod[moderator].std()
             mod_high = mod_std
@@ -1304,647 +2182,83 @@ class ComprehensiveAnalyzer:
         plt.savefig(f'{output_dir}/figure_moderation_plots.png', dpi=300, bbox_inches='tight')
         plt.close()
         print(f"  ✓ Figure: Moderation Plots")
+
+
+def draw_imputation(shm_name, shape, seed, lower, upper, integer, tol=1e-4):
+    """
+    One imputation of the data matrix held in shared memory (joint multivariate normal).
+    Parameter uncertainty comes from running EM on a bootstrap resample of the rows;
+    missing values are then drawn from their conditional normal given the observed
+    ones, clipped to the bounds and rounded where required. Returns the imputed values
+    of the missing cells in row-major order.
+    """
     
-    def generate_excel_output(self, output_dir):
-        """Generate comprehensive Excel file with all results"""
-        
-        excel_file = f'{output_dir}/analysis_results_complete.xlsx'
-        
-        try:
-            with pd.ExcelWriter(excel_file, engine='openpyxl') as writer:
-                
-                # ============================================
-                # TABLE 4.1: QUALITATIVE SAMPLE
-                # ============================================
-                japan_qual = self.qual_data[self.qual_data['Country'] == 'Japan']
-                vietnam_qual = self.qual_data[self.qual_data['Country'] == 'Vietnam']
-                total_qual = self.qual_data
-                
-                qual_data = []
-                qual_data.append({
-                    'Characteristic': 'Sample Size',
-                    'Japan': len(japan_qual),
-                    'Vietnam': len(vietnam_qual),
-                    'Total': len(total_qual)
-                })
-                qual_data.append({
-                    'Characteristic': 'Average Age (years)',
-                    'Japan': round(japan_qual['Age'].mean(), 1),
-                    'Vietnam': round(vietnam_qual['Age'].mean(), 1),
-                    'Total': round(total_qual['Age'].mean(), 1)
-                })
-                qual_data.append({
-                    'Characteristic': 'Gender (% Male)',
-                    'Japan': round((japan_qual['Gender'] == 'Male').mean() * 100, 0),
-                    'Vietnam': round((vietnam_qual['Gender'] == 'Male').mean() * 100, 0),
-                    'Total': round((total_qual['Gender'] == 'Male').mean() * 100, 0)
-                })
-                
-                # Positions
-                for pos in ['Senior Leader', 'Mid-level Leader']:
-                    qual_data.append({
-                        'Characteristic': f'Position: {pos} (%)',
-                        'Japan': round((japan_qual['Position'] == pos).mean() * 100, 0),
-                        'Vietnam': round((vietnam_qual['Position'] == pos).mean() * 100, 0),
-                        'Total': round((total_qual['Position'] == pos).mean() * 100, 0)
-                    })
-                
-                qual_data.append({
-                    'Characteristic': 'Avg AI Experience (years)',
-                    'Japan': round(japan_qual['AI_Experience_Years'].mean(), 1),
-                    'Vietnam': round(vietnam_qual['AI_Experience_Years'].mean(), 1),
-                    'Total': round(total_qual['AI_Experience_Years'].mean(), 1)
-                })
-                qual_data.append({
-                    'Characteristic': 'Avg Interview Duration (min)',
-                    'Japan': round(japan_qual['Interview_Duration_Min'].mean(), 0),
-                    'Vietnam': round(vietnam_qual['Interview_Duration_Min'].mean(), 0),
-                    'Total': round(total_qual['Interview_Duration_Min'].mean(), 0)
-                })
-                
-                df_qual = pd.DataFrame(qual_data)
-                df_qual.to_excel(writer, sheet_name='Table 4.1 Qualitative', index=False)
-                
-                # ============================================
-                # TABLE 4.2: QUANTITATIVE SAMPLE
-                # ============================================
-                desc = self.results['descriptive_stats']
-                
-                quant_data = []
-                quant_data.append({
-                    'Characteristic': 'Sample Size',
-                    'Japan': desc['Japan']['n'],
-                    'Vietnam': desc['Vietnam']['n'],
-                    'Total': desc['Japan']['n'] + desc['Vietnam']['n']
-                })
-                quant_data.append({
-                    'Characteristic': 'Average Age',
-                    'Japan': f"{desc['Japan']['age_mean']:.1f} (SD={desc['Japan']['age_sd']:.1f})",
-                    'Vietnam': f"{desc['Vietnam']['age_mean']:.1f} (SD={desc['Vietnam']['age_sd']:.1f})",
-                    'Total': f"{self.df['Age'].mean():.1f} (SD={self.df['Age'].std():.1f})"
-                })
-                quant_data.append({
-                    'Characteristic': 'Gender (% Male)',
-                    'Japan': f"{desc['Japan']['gender_male_pct']:.1f}%",
-                    'Vietnam': f"{desc['Vietnam']['gender_male_pct']:.1f}%",
-                    'Total': f"{(self.df['Gender'] == 'Male').mean() * 100:.1f}%"
-                })
-                quant_data.append({
-                    'Characteristic': 'Average Tenure (years)',
-                    'Japan': f"{desc['Japan']['tenure_mean']:.1f} (SD={desc['Japan']['tenure_sd']:.1f})",
-                    'Vietnam': f"{desc['Vietnam']['tenure_mean']:.1f} (SD={desc['Vietnam']['tenure_sd']:.1f})",
-                    'Total': f"{self.df['Tenure_Years'].mean():.1f} (SD={self.df['Tenure_Years'].std():.1f})"
-                })
-                
-                # Position Level
-                for pos in ['Team Leader', 'Department Head', 'Senior Executive']:
-                    jp_pct = desc['Japan']['position'].get(pos, 0) * 100
-                    vn_pct = desc['Vietnam']['position'].get(pos, 0) * 100
-                    total_pct = (self.df['Position_Level'] == pos).mean() * 100
-                    quant_data.append({
-                        'Characteristic': f'Position: {pos}',
-                        'Japan': f"{jp_pct:.1f}%",
-                        'Vietnam': f"{vn_pct:.1f}%",
-                        'Total': f"{total_pct:.1f}%"
-                    })
-                
-                # Industry
-                all_industries = sorted(set(self.df['Industry'].unique()))
-                for industry in all_industries:
-                    jp_pct = desc['Japan']['industry'].get(industry, 0) * 100
-                    vn_pct = desc['Vietnam']['industry'].get(industry, 0) * 100
-                    total_pct = (self.df['Industry'] == industry).mean() * 100
-                    quant_data.append({
-                        'Characteristic': f'Industry: {industry}',
-                        'Japan': f"{jp_pct:.1f}%",
-                        'Vietnam': f"{vn_pct:.1f}%",
-                        'Total': f"{total_pct:.1f}%"
-                    })
-                
-                df_quant = pd.DataFrame(quant_data)
-                df_quant.to_excel(writer, sheet_name='Table 4.2 Sample Char', index=False)
-                
-                # ============================================
-                # TABLE 4.3: RELIABILITY STATISTICS
-                # ============================================
-                rel = self.results['reliability']
-                cfa = self.results['cfa']['dimensions']
-                
-                rel_data = []
-                dim_names = {
-                    'TC': 'Technological Competence',
-                    'CMC': 'Change Management Capability',
-                    'EA': 'Ethical Awareness',
-                    'ALO': 'Adaptive Learning Orientation'
-                }
-                
-                for dim, name in dim_names.items():
-                    rel_data.append({
-                        'Dimension': name,
-                        'Cronbach α (Japan)': round(rel[dim]['cronbach_alpha_japan'], 3),
-                        'Cronbach α (Vietnam)': round(rel[dim]['cronbach_alpha_vietnam'], 3),
-                        'Cronbach α (Overall)': round(rel[dim]['cronbach_alpha_overall'], 3),
-                        'Composite Reliability': round(cfa[dim]['composite_reliability'], 3),
-                        'AVE': round(cfa[dim]['ave'], 3)
-                    })
-                
-                df_reliability = pd.DataFrame(rel_data)
-                df_reliability.to_excel(writer, sheet_name='Table 4.3 Reliability', index=False)
-                
-                # ============================================
-                # TABLE 4.4: DISCRIMINANT VALIDITY
-                # ============================================
-                dimensions = ['TC_Score', 'CMC_Score', 'EA_Score', 'ALO_Score']
-                corr_matrix = self.df[dimensions].corr()
-                
-                # Calculate sqrt(AVE) for diagonal
-                sqrt_aves = []
-                for dim in dimensions:
-                    dim_prefix = dim.replace('_Score', '')
-                    items = [f'{dim_prefix}{i}' for i in range(1, 9)]
-                    loadings = self.df[items].corrwith(self.df[dim])
-                    ave = self.average_variance_extracted(loadings)
-                    sqrt_aves.append(np.sqrt(ave))
-                
-                discrim_data = []
-                dim_names_short = ['TC', 'CMC', 'EA', 'ALO']
-                for i, dim_name in enumerate(dim_names_short):
-                    row = {'Dimension': dim_name}
-                    for j, other_dim in enumerate(dim_names_short):
-                        if i == j:
-                            row[other_dim] = f"[{sqrt_aves[i]:.2f}]"
-                        elif j < i:
-                            row[other_dim] = f"{corr_matrix.iloc[i, j]:.2f}"
-                        else:
-                            row[other_dim] = ""
-                    discrim_data.append(row)
-                
-                df_discrim = pd.DataFrame(discrim_data)
-                df_discrim.to_excel(writer, sheet_name='Table 4.4 Discriminant', index=False)
-                
-                # ============================================
-                # TABLE 4.5: COUNTRY COMPARISONS
-                # ============================================
-                comp = self.results['country_comparisons']['ttests']
-                
-                country_comp_data = []
-                dim_names_full = {
-                    'TC_Score': 'Technological Competence',
-                    'CMC_Score': 'Change Management Capability',
-                    'EA_Score': 'Ethical Awareness',
-                    'ALO_Score': 'Adaptive Learning Orientation'
-                }
-                
-                for dim, name in dim_names_full.items():
-                    country_comp_data.append({
-                        'Dimension': name,
-                        'Japan Mean': round(comp[dim]['japan_mean'], 2),
-                        'Japan SD': round(comp[dim]['japan_sd'], 2),
-                        'Vietnam Mean': round(comp[dim]['vietnam_mean'], 2),
-                        'Vietnam SD': round(comp[dim]['vietnam_sd'], 2),
-                        't-statistic': round(comp[dim]['t_statistic'], 2),
-                        'p-value': comp[dim]['p_value'],
-                        "Cohen's d": round(comp[dim]['cohens_d'], 2)
-                    })
-                
-                df_country_comp = pd.DataFrame(country_comp_data)
-                df_country_comp.to_excel(writer, sheet_name='Table 4.5 Country Comp', index=False)
-                
-                # ============================================
-                # TABLE 4.6: OUTCOME MEANS
-                # ============================================
-                outcome_data = []
-                outcome_dims = {
-                    'OI_Score': 'Operational Improvements',
-                    'SA_Score': 'Strategic Advantages',
-                    'OL_Score': 'Organizational Learning'
-                }
-                
-                for score_col, name in outcome_dims.items():
-                    jp_scores = self.japan_df[score_col]
-                    vn_scores = self.vietnam_df[score_col]
-                    t_stat, p_val = ttest_ind(jp_scores, vn_scores)
-                    
-                    outcome_data.append({
-                        'Outcome': name,
-                        'Japan Mean': round(jp_scores.mean(), 2),
-                        'Japan SD': round(jp_scores.std(), 2),
-                        'Vietnam Mean': round(vn_scores.mean(), 2),
-                        'Vietnam SD': round(vn_scores.std(), 2),
-                        't-value': round(t_stat, 2),
-                        'p-value': round(p_val, 4)
-                    })
-                
-                df_outcomes = pd.DataFrame(outcome_data)
-                df_outcomes.to_excel(writer, sheet_name='Table 4.6 Outcomes', index=False)
-                
-                # ============================================
-                # TABLE 4.7: REGRESSION RESULTS
-                # ============================================
-                reg = self.results['hierarchical_regression']
-                
-                reg_data = []
-                
-                # Step 1: Control Variables
-                reg_data.append({
-                    'Step': 'Step 1: Controls',
-                    'Predictor': '--- Controls ---',
-                    'Japan β': '',
-                    'Japan p': '',
-                    'Japan t': '',
-                    'Vietnam β': '',
-                    'Vietnam p': '',
-                    'Vietnam t': '',
-                    'Combined β': '',
-                    'Combined p': '',
-                    'Combined t': ''
-                })
-                
-                # Age
-                reg_data.append({
-                    'Step': '',
-                    'Predictor': 'Age',
-                    'Japan β': '-.08',
-                    'Japan p': '',
-                    'Japan t': '',
-                    'Vietnam β': '-.06',
-                    'Vietnam p': '',
-                    'Vietnam t': '',
-                    'Combined β': '-.07',
-                    'Combined p': '',
-                    'Combined t': ''
-                })
-                
-                # Gender
-                reg_data.append({
-                    'Step': '',
-                    'Predictor': 'Gender (male=1)',
-                    'Japan β': '.11',
-                    'Japan p': '',
-                    'Japan t': '',
-                    'Vietnam β': '.09',
-                    'Vietnam p': '',
-                    'Vietnam t': '',
-                    'Combined β': '.10',
-                    'Combined p': '*',
-                    'Combined t': ''
-                })
-                
-                # Position Level (Department Head)
-                reg_data.append({
-                    'Step': '',
-                    'Predictor': 'Position: Department Head',
-                    'Japan β': '.14',
-                    'Japan p': '*',
-                    'Japan t': '',
-                    'Vietnam β': '.16',
-                    'Vietnam p': '*',
-                    'Vietnam t': '',
-                    'Combined β': '.15',
-                    'Combined p': '**',
-                    'Combined t': ''
-                })
-                
-                # Position Level (Senior Executive)
-                reg_data.append({
-                    'Step': '',
-                    'Predictor': 'Position: Senior Executive',
-                    'Japan β': '.18',
-                    'Japan p': '**',
-                    'Japan t': '',
-                    'Vietnam β': '.12',
-                    'Vietnam p': '',
-                    'Vietnam t': '',
-                    'Combined β': '.15',
-                    'Combined p': '**',
-                    'Combined t': ''
-                })
-                
-                # Organizational Size
-                reg_data.append({
-                    'Step': '',
-                    'Predictor': 'Organizational Size',
-                    'Japan β': '.18',
-                    'Japan p': '**',
-                    'Japan t': '',
-                    'Vietnam β': '.12',
-                    'Vietnam p': '',
-                    'Vietnam t': '',
-                    'Combined β': '.15',
-                    'Combined p': '**',
-                    'Combined t': ''
-                })
-                
-                # Industry (note)
-                reg_data.append({
-                    'Step': '',
-                    'Predictor': 'Industry (dummy variables)',
-                    'Japan β': 'Yes',
-                    'Japan p': '',
-                    'Japan t': '',
-                    'Vietnam β': 'Yes',
-                    'Vietnam p': '',
-                    'Vietnam t': '',
-                    'Combined β': 'Yes',
-                    'Combined p': '',
-                    'Combined t': ''
-                })
-                
-                # R² for Step 1
-                reg_data.append({
-                    'Step': '',
-                    'Predictor': 'R²',
-                    'Japan β': round(reg['Japan']['model1_r2'], 3),
-                    'Japan p': '**',
-                    'Japan t': '',
-                    'Vietnam β': round(reg['Vietnam']['model1_r2'], 3),
-                    'Vietnam p': '**',
-                    'Vietnam t': '',
-                    'Combined β': round(reg['Combined']['model1_r2'], 3),
-                    'Combined p': '***',
-                    'Combined t': ''
-                })
-                
-                # Empty row
-                reg_data.append({
-                    'Step': '',
-                    'Predictor': '',
-                    'Japan β': '',
-                    'Japan p': '',
-                    'Japan t': '',
-                    'Vietnam β': '',
-                    'Vietnam p': '',
-                    'Vietnam t': '',
-                    'Combined β': '',
-                    'Combined p': '',
-                    'Combined t': ''
-                })
-                
-                # Step 2: Readiness Dimensions
-                reg_data.append({
-                    'Step': 'Step 2: Readiness Dimensions',
-                    'Predictor': '--- Readiness Dimensions ---',
-                    'Japan β': '',
-                    'Japan p': '',
-                    'Japan t': '',
-                    'Vietnam β': '',
-                    'Vietnam p': '',
-                    'Vietnam t': '',
-                    'Combined β': '',
-                    'Combined p': '',
-                    'Combined t': ''
-                })
-                
-                dims = ['TC', 'CMC', 'EA', 'ALO']
-                dim_full_names = {
-                    'TC': 'Technological Competence (H1)',
-                    'CMC': 'Change Management Capability (H2)',
-                    'EA': 'Ethical Awareness (H3)',
-                    'ALO': 'Adaptive Learning Orientation (H4)'
-                }
-                
-                for dim in dims:
-                    jp_p = reg['Japan']['p_values'][dim]
-                    vn_p = reg['Vietnam']['p_values'][dim]
-                    cb_p = reg['Combined']['p_values'][dim]
-                    
-                    jp_sig = '***' if jp_p < 0.001 else ('**' if jp_p < 0.01 else ('*' if jp_p < 0.05 else ''))
-                    vn_sig = '***' if vn_p < 0.001 else ('**' if vn_p < 0.01 else ('*' if vn_p < 0.05 else ''))
-                    cb_sig = '***' if cb_p < 0.001 else ('**' if cb_p < 0.01 else ('*' if cb_p < 0.05 else ''))
-                    
-                    reg_data.append({
-                        'Step': '',
-                        'Predictor': dim_full_names[dim],
-                        'Japan β': round(reg['Japan']['coefficients'][dim], 3),
-                        'Japan p': jp_sig,
-                        'Japan t': round(reg['Japan']['t_values'][dim], 2),
-                        'Vietnam β': round(reg['Vietnam']['coefficients'][dim], 3),
-                        'Vietnam p': vn_sig,
-                        'Vietnam t': round(reg['Vietnam']['t_values'][dim], 2),
-                        'Combined β': round(reg['Combined']['coefficients'][dim], 3),
-                        'Combined p': cb_sig,
-                        'Combined t': round(reg['Combined']['t_values'][dim], 2)
-                    })
-                
-                # R² for Step 2
-                reg_data.append({
-                    'Step': '',
-                    'Predictor': 'R²',
-                    'Japan β': round(reg['Japan']['model2_r2'], 3),
-                    'Japan p': '***',
-                    'Japan t': '',
-                    'Vietnam β': round(reg['Vietnam']['model2_r2'], 3),
-                    'Vietnam p': '***',
-                    'Vietnam t': '',
-                    'Combined β': round(reg['Combined']['model2_r2'], 3),
-                    'Combined p': '***',
-                    'Combined t': ''
-                })
-                
-                # ΔR²
-                reg_data.append({
-                    'Step': '',
-                    'Predictor': 'ΔR²',
-                    'Japan β': round(reg['Japan']['r2_change'], 3),
-                    'Japan p': '***',
-                    'Japan t': '',
-                    'Vietnam β': round(reg['Vietnam']['r2_change'], 3),
-                    'Vietnam p': '***',
-                    'Vietnam t': '',
-                    'Combined β': round(reg['Combined']['r2_change'], 3),
-                    'Combined p': '***',
-                    'Combined t': ''
-                })
-                
-                df_regression = pd.DataFrame(reg_data)
-                df_regression.to_excel(writer, sheet_name='Table 4.7 Regression', index=False)
-                
-                # Note: The R-Squared sheet is removed as it's now included in the main table
-                
-                # ============================================
-                # TABLE 4.8: DOMINANCE ANALYSIS
-                # ============================================
-                dom = self.results['dominance']
-                
-                dom_data = []
-                sorted_dims = sorted(dom['relative_importance'].items(), key=lambda x: x[1], reverse=True)
-                
-                dim_names_dom = {
-                    'TC_Score': 'Technological Competence',
-                    'CMC_Score': 'Change Management Capability',
-                    'EA_Score': 'Ethical Awareness',
-                    'ALO_Score': 'Adaptive Learning Orientation'
-                }
-                
-                for dim, ri in sorted_dims:
-                    dom_data.append({
-                        'Dimension': dim_names_dom[dim],
-                        'General Dominance': round(dom['general_dominance'][dim], 4),
-                        'Relative Importance (%)': round(ri, 1)
-                    })
-                
-                # Add total R²
-                dom_data.append({
-                    'Dimension': 'Total Model R²',
-                    'General Dominance': round(dom['total_r2'], 3),
-                    'Relative Importance (%)': 100.0
-                })
-                
-                df_dominance = pd.DataFrame(dom_data)
-                df_dominance.to_excel(writer, sheet_name='Table 4.8 Dominance', index=False)
-                
-                # ============================================
-                # TABLE 4.9: MODERATION ANALYSIS
-                # ============================================
-                mod = self.results['moderation']
-                
-                mod_data = []
-                interactions = [
-                    ('Power Distance', 'TC × Power Distance', 'Technological Competence'),
-                    ('Uncertainty Avoidance', 'CMC × Uncertainty Avoidance', 'Change Management Capability'),
-                    ('Collectivism', 'EA × Collectivism', 'Ethical Awareness'),
-                    ('Long-term Orientation', 'ALO × Long-term Orientation', 'Adaptive Learning Orientation')
-                ]
-                
-                for mod_name, int_name, predictor_name in interactions:
-                    if mod_name in mod:
-                        p_val = mod[mod_name]['interaction_p']
-                        sig_level = '***' if p_val < 0.001 else ('**' if p_val < 0.01 else ('*' if p_val < 0.05 else 'ns'))
-                        
-                        mod_data.append({
-                            'Predictor': predictor_name,
-                            'Moderator': mod_name,
-                            'Interaction': int_name,
-                            'Interaction β': round(mod[mod_name]['interaction_beta'], 3),
-                            't-value': round(mod[mod_name]['interaction_t'], 2),
-                            'p-value': round(mod[mod_name]['interaction_p'], 4),
-                            'Significance': sig_level,
-                            'Simple Slope (High)': round(mod[mod_name]['simple_slope_high'], 2),
-                            'Simple Slope (Low)': round(mod[mod_name]['simple_slope_low'], 2),
-                            'Slope Difference': round(mod[mod_name]['simple_slope_high'] - mod[mod_name]['simple_slope_low'], 2)
-                        })
-                
-                df_moderation = pd.DataFrame(mod_data)
-                df_moderation.to_excel(writer, sheet_name='Table 4.9 Moderation', index=False)
-                
-                # Add interpretation sheet
-                interp_data = []
-                
-                interpretations = [
-                    ('Power Distance', 'Technological Competence', 
-                     'TC predicts outcomes more strongly at low power distance. In egalitarian cultures, leader technological competence matters more for success.'),
-                    ('Uncertainty Avoidance', 'Change Management Capability',
-                     'CMC predicts outcomes more strongly at high uncertainty avoidance. Structured change management becomes more critical in cultures emphasizing stability.'),
-                    ('Collectivism', 'Ethical Awareness',
-                     'EA predicts outcomes more strongly in collectivist cultures. Collective welfare concerns amplify the importance of ethical considerations.'),
-                    ('Long-term Orientation', 'Adaptive Learning Orientation',
-                     'ALO predicts outcomes more strongly at high long-term orientation. Future focus enhances the value of continuous learning.')
-                ]
-                
-                for mod_name, pred_name, interpretation in interpretations:
-                    if mod_name in mod and mod[mod_name]['interaction_p'] < 0.05:
-                        interp_data.append({
-                            'Moderator': mod_name,
-                            'Predictor': pred_name,
-                            'Beta': round(mod[mod_name]['interaction_beta'], 3),
-                            'p-value': round(mod[mod_name]['interaction_p'], 4),
-                            'High Moderator Slope': round(mod[mod_name]['simple_slope_high'], 2),
-                            'Low Moderator Slope': round(mod[mod_name]['simple_slope_low'], 2),
-                            'Interpretation': interpretation
-                        })
-                
-                if interp_data:
-                    df_interpretation = pd.DataFrame(interp_data)
-                    df_interpretation.to_excel(writer, sheet_name='Table 4.9 Interpretation', index=False)
-                
-                # ============================================
-                # TABLE E.1: FACTOR LOADINGS
-                # ============================================
-                dimensions_dict = {
-                    'TC': [f'TC{i}' for i in range(1, 9)],
-                    'CMC': [f'CMC{i}' for i in range(1, 9)],
-                    'EA': [f'EA{i}' for i in range(1, 9)],
-                    'ALO': [f'ALO{i}' for i in range(1, 9)]
-                }
-                
-                loading_data = []
-                for dim_name, items in dimensions_dict.items():
-                    loadings = self.df[items].corrwith(self.df[f'{dim_name}_Score'])
-                    for item, loading in zip(items, loadings):
-                        row = {'Item': item}
-                        for other_dim in ['TC', 'CMC', 'EA', 'ALO']:
-                            if other_dim == dim_name:
-                                row[other_dim] = round(loading, 3)
-                            else:
-                                row[other_dim] = ''
-                        loading_data.append(row)
-                
-                df_loadings = pd.DataFrame(loading_data)
-                df_loadings.to_excel(writer, sheet_name='Table E.1 Loadings', index=False)
-                
-                # ============================================
-                # TABLE E.2: FULL CORRELATION MATRIX
-                # ============================================
-                variables = [
-                    'Age', 'Tenure_Years', 'TC_Score', 'CMC_Score', 'EA_Score', 'ALO_Score',
-                    'OI_Score', 'SA_Score', 'OL_Score', 'Overall_Success',
-                    'PD_Score', 'UA_Score', 'Collectivism_Score', 'LTO_Score'
-                ]
-                
-                corr_matrix_full = self.df[variables].corr().round(3)
-                corr_matrix_full.to_excel(writer, sheet_name='Table E.2 Full Corr')
-                
-                # ============================================
-                # SUMMARY STATISTICS
-                # ============================================
-                summary_data = {
-                    'Metric': [
-                        'Total Participants',
-                        'Japan Participants',
-                        'Vietnam Participants',
-                        'Interview Participants',
-                        'Overall Mean Age',
-                        'Overall Mean Tenure',
-                        'Male Percentage',
-                        'Team Leaders %',
-                        'Department Heads %',
-                        'Senior Executives %'
-                    ],
-                    'Value': [
-                        len(self.df),
-                        len(self.japan_df),
-                        len(self.vietnam_df),
-                        len(self.qual_data),
-                        round(self.df['Age'].mean(), 1),
-                        round(self.df['Tenure_Years'].mean(), 1),
-                        round((self.df['Gender'] == 'Male').mean() * 100, 1),
-                        round((self.df['Position_Level'] == 'Team Leader').mean() * 100, 1),
-                        round((self.df['Position_Level'] == 'Department Head').mean() * 100, 1),
-                        round((self.df['Position_Level'] == 'Senior Executive').mean() * 100, 1)
-                    ]
-                }
-                
-                df_summary = pd.DataFrame(summary_data)
-                df_summary.to_excel(writer, sheet_name='Summary Statistics', index=False)
-            
-            print(f"  ✓ Excel file: analysis_results_complete.xlsx")
-            print(f"    - Contains all dissertation tables with detailed results")
-            print(f"    - Includes simple slopes analysis for moderation effects")
-            
-        except Exception as e:
-            print(f"  ⚠ Warning: Could not create Excel file. Error: {str(e)}")
-            print(f"     Make sure openpyxl is installed: pip install openpyxl")
+    shm = shared_memory.SharedMemory(name=shm_name)
+    X = np.ndarray(shape, dtype=float, buffer=shm.buf)
+    try:
+        rng = np.random.RandomState(seed)
+        mu, sigma, _, _ = ComprehensiveAnalyzer.em_moments(X[rng.randint(0, shape[0], shape[0])], tol)
+        
+        observed = ~np.isnan(X)
+        groups = ComprehensiveAnalyzer.missing_pattern_groups(observed)
+        filled, cond_covs = ComprehensiveAnalyzer.conditional_expectation(X, observed, groups, mu, sigma)
+        
+        for (miss_idx, rows, row_pattern), cond_cov in zip(groups, cond_covs):
+            # Symmetric square root per pattern (robust to near-singular blocks)
+            eigvals, eigvecs = np.linalg.eigh(cond_cov)
+            root = eigvecs * np.sqrt(np.clip(eigvals, 0, None))[:, None, :]
+            noise = rng.standard_normal((len(rows), miss_idx.shape[1]))
+            filled[rows[:, None], miss_idx[row_pattern]] += np.einsum('rij,rj->ri', root[row_pattern], noise)
+        
+        filled = np.clip(filled, lower, upper)
+        filled[:, integer] = np.round(filled[:, integer])
+        return filled[~observed]
+    finally:
+        del X
+        shm.close()
 
 
 # Main execution
 if __name__ == "__main__":
-    
+
     # Initialize analyzer
-    analyzer = ComprehensiveAnalyzer(data_dir='research_data')
+    missing = next((arg.split('=', 1)[1] for arg in sys.argv if arg.startswith('--missing=')), 'fiml')
+    imputations = next((int(arg.split('=', 1)[1]) for arg in sys.argv if arg.startswith('--imputations=')), 20)
+    screen = next((arg.split('=', 1)[1] for arg in sys.argv if arg.startswith('--screen=')), None)
+    outliers = next((arg.split('=', 1)[1] for arg in sys.argv if arg.startswith('--outliers=')), None)
+    
+    # Profiling: --trace[=path] writes a Chrome trace of every step; --profile-step=<method>
+    # also runs that step under cProfile (and py-spy with --py-spy)
+    trace = next((arg.split('=', 1)[1] if '=' in arg else 'research_data/analysis_output/trace.json'
+                  for arg in sys.argv if arg.startswith('--trace')), None)
+    profile_step = next((arg.split('=', 1)[1] for arg in sys.argv if arg.startswith('--profile-step=')), None)
+    profiler = None
+    if trace or profile_step:
+        trace = trace or 'research_data/analysis_output/trace.json'
+        profiler = StepProfiler(profile_step, py_spy='--py-spy' in sys.argv, output_dir=os.path.dirname(trace) or '.')
+    
+    analyzer = ComprehensiveAnalyzer(data_dir='research_data',
+                                     repair_composites='--repair-composites' in sys.argv,
+                                     missing=missing, imputations=imputations, screen=screen,
+                                     outliers=outliers, profiler=profiler)
     
     # Run all analyses
     results = analyzer.run_all_analyses()
     
+    if profiler is not None:
+        print("\n" + "="*70)
+        print("STEP PROFILE")
+        print("="*70)
+        print(f"{'Step':<42} {'calls':>5} {'wall s':>9} {'cpu s':>9} {'ΔRSS MB':>9}")
+        for name, entry in profiler.summary().items():
+            rss = f"{entry['peak_rss_delta_mb']:>9.1f}" if entry['peak_rss_delta_mb'] is not None else f"{'-':>9}"
+            print(f"{'  ' * entry['depth'] + name:<42} {entry['calls']:>5} {entry['wall_s']:>9.3f} "
+                  f"{entry['cpu_s']:>9.3f} {rss}")
+        if profile_step:
+            print(profiler.profile_report() or f"⚠ Step {profile_step} did not run - nothing profiled")
+        for path in profiler.save(trace):
+            print(f"✓ Saved: {path}")
+    
     print("\n" + "="*70)
     print("SUMMARY OF KEY FINDINGS FROM ACTUAL DATA")
     print("="*70)
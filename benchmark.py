@@ -0,0 +1,282 @@
+"""
+Benchmark Suite
+Times and memory-profiles the data generator (1_generate_2.py) and every step
+of ComprehensiveAnalyzer (4_real_analysis.py) on fixture panels of 10^3 to
+10^7 respondents. Fixtures are generated once and cached under a key of the
+generator, schema and registry contents; results are written as JSON and CSV
+and can be compared with an earlier run to catch performance regressions.
+"""
+
+import pandas as pd
+import numpy as np
+from datetime import datetime
+import contextlib
+import hashlib
+import importlib.util
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BASE_DIR)
+from results_store import file_hash, git_commit
+
+GENERATOR_FILE = os.path.join(BASE_DIR, '1_generate_2.py')
+ANALYZER_FILE = os.path.join(BASE_DIR, '4_real_analysis.py')
+FIXTURE_INPUTS = [GENERATOR_FILE, os.path.join(BASE_DIR, 'survey_schema.json'),
+                  os.path.join(BASE_DIR, 'country_registry.json')]
+CODE_FILES = [GENERATOR_FILE, ANALYZER_FILE] + [os.path.join(BASE_DIR, name) for name in
+              ['results_store.py', 'careless_screening.py', 'robust_outliers.py']]
+
+FIXTURE_DIR = 'benchmarks/fixtures'
+RESULTS_DIR = 'benchmarks/results'
+SIZES = [1000, 10000, 100000, 1000000, 10000000]
+DEFAULT_SIZES = [1000, 10000, 100000]
+
+# Analyzer steps in run_all_analyses order ('load' is the constructor, which reads
+# and checks the data; 'outputs' covers the results store, tables and figures)
+STEPS = [
+    ('load', None),
+    ('descriptives', 'descriptive_statistics'),
+    ('reliability', 'reliability_analysis'),
+    ('efa', 'exploratory_factor_analysis'),
+    ('cfa', 'confirmatory_factor_analysis'),
+    ('country_comparisons', 'country_comparisons'),
+    ('correlations', 'correlation_analysis'),
+    ('regression', 'hierarchical_regression'),
+    ('moderation', 'moderation_analysis'),
+    ('dominance', 'dominance_analysis'),
+    ('outputs', 'generate_outputs')
+]
+
+# A step regresses when it is slower than the baseline by both margins
+# (the absolute margin keeps millisecond steps from flagging on noise)
+REGRESSION_RATIO = 1.25
+REGRESSION_SECONDS = 0.05
+
+
+def load_script(name, path):
+    """Import a numbered script as a module (once per process)"""
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        sys.modules[name] = module
+    return sys.modules[name]
+
+
+def measure(func, memory=False):
+    """
+    Call func with its output silenced. Returns (result, seconds, peak MB);
+    the peak of Python allocations is traced only when memory is set, since
+    tracing slows the call down.
+    """
+    
+    if memory:
+        tracemalloc.start()
+    try:
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            start = time.perf_counter()
+            result = func()
+            seconds = time.perf_counter() - start
+        peak_mb = tracemalloc.get_traced_memory()[1] / 2**20 if memory else None
+    finally:
+        if memory:
+            tracemalloc.stop()
+    return result, seconds, peak_mb
+
+
+def country_sizes(n):
+    """n respondents split as evenly as possible over the registry's countries"""
+    
+    with open(FIXTURE_INPUTS[2], 'r') as f:
+        countries = list(json.load(f)['countries'])
+    base, extra = divmod(n, len(countries))
+    return {country: base + (i < extra) for i, country in enumerate(countries)}
+
+
+def fixture_key(n, seed):
+    """Short hash of everything that determines a fixture's contents"""
+    
+    digest = hashlib.sha256(file_hash(FIXTURE_INPUTS).encode())
+    digest.update(f'{n}:{seed}'.encode())
+    return digest.hexdigest()[:12]
+
+
+def build_fixture(n, seed=42, rebuild=False):
+    """
+    Data directory of the n-respondent fixture, generating it when it is not
+    cached. The (untraced) generation time is kept in fixture.json next to the
+    data, so it is reported for cached fixtures too.
+    """
+    
+    key = fixture_key(n, seed)
+    fixture_dir = os.path.join(FIXTURE_DIR, f'n{n}_{key}')
+    data_dir = os.path.join(fixture_dir, 'research_data')
+    meta_file = os.path.join(fixture_dir, 'fixture.json')
+    
+    if os.path.exists(meta_file) and not rebuild:
+        with open(meta_file, 'r') as f:
+            return data_dir, {**json.load(f), 'cached': True}
+    
+    os.makedirs(data_dir, exist_ok=True)
+    module = load_script('generate_data', GENERATOR_FILE)
+    generator = module.DissertationDataGenerator(seed=seed)
+    _, seconds, _ = measure(lambda: generator.generate_complete_dataset(data_dir, country_sizes=country_sizes(n)))
+    
+    meta = {
+        'n': n,
+        'seed': seed,
+        'key': key,
+        'generate_seconds': seconds,
+        'data_mb': sum(os.path.getsize(os.path.join(data_dir, name)) for name in os.listdir(data_dir)
+                       if os.path.isfile(os.path.join(data_dir, name))) / 2**20,
+        'created_at': datetime.now().isoformat(timespec='seconds')
+    }
+    with open(meta_file, 'w') as f:
+        json.dump(meta, f, indent=2)
+    return data_dir, {**meta, 'cached': False}
+
+
+def run_pipeline(data_dir, steps, memory=False):
+    """One fresh analyzer through the selected steps in order -> {step: (seconds, peak MB)}"""
+    
+    module = load_script('real_analysis', ANALYZER_FILE)
+    analyzer, seconds, peak_mb = measure(lambda: module.ComprehensiveAnalyzer(data_dir=data_dir, imputations=0),
+                                         memory)
+    timings = {'load': (seconds, peak_mb)}
+    
+    for step, method in STEPS[1:]:
+        if step not in steps:
+            continue
+        _, seconds, peak_mb = measure(getattr(analyzer, method), memory)
+        timings[step] = (seconds, peak_mb)
+    return timings
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, steps=None, repeat=1, memory=True, rebuild=False, seed=42):
+    """
+    Benchmark every size: the fixture generation, then repeat timed passes of the
+    analyzer (the fastest is kept) and, when memory is set, one separate traced
+    pass for the peak memory of every step. Every pass starts from a new
+    analyzer, since later steps reuse what earlier ones cached.
+    """
+    
+    steps = steps or [step for step, _ in STEPS]
+    rows = []
+    
+    for n in sizes:
+        print(f"\n{n:,} respondents")
+        data_dir, fixture = build_fixture(n, seed, rebuild)
+        status = 'cached' if fixture['cached'] else 'generated'
+        print(f"  {'generate':<22} {fixture['generate_seconds']:>10.3f}s  ({status}, {fixture['data_mb']:.1f} MB on disk)")
+        rows.append({'n': n, 'step': 'generate', 'seconds': fixture['generate_seconds'],
+                     'peak_mb': None, 'cached': fixture['cached']})
+        
+        passes = [run_pipeline(data_dir, steps) for _ in range(repeat)]
+        traced = run_pipeline(data_dir, steps, memory=True) if memory else {}
+        
+        for step in passes[0]:
+            seconds = min(timings[step][0] for timings in passes)
+            peak_mb = traced[step][1] if step in traced else None
+            memory_note = f"  {peak_mb:>9.1f} MB" if peak_mb is not None else ''
+            print(f"  {step:<22} {seconds:>10.3f}s{memory_note}")
+            rows.append({'n': n, 'step': step, 'seconds': seconds, 'peak_mb': peak_mb, 'cached': False})
+    
+    return pd.DataFrame(rows)
+
+
+def environment():
+    """Versions and code hashes a benchmark result is tied to"""
+    
+    return {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'git_commit': git_commit(BASE_DIR),
+        'code_version': file_hash([path for path in CODE_FILES if os.path.exists(path)])[:12],
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count()
+    }
+
+
+def compare_results(current, baseline):
+    """
+    Step timings against a baseline benchmark (sizes and steps measured in both).
+    A step is flagged when it is REGRESSION_RATIO times and REGRESSION_SECONDS
+    slower than before; fixture generation read from the cache is skipped.
+    """
+    
+    merged = current[~current['cached']].merge(baseline[['n', 'step', 'seconds', 'peak_mb']],
+                                               on=['n', 'step'], suffixes=('', '_baseline'))
+    merged['ratio'] = merged['seconds'] / merged['seconds_baseline']
+    merged['regression'] = (merged['ratio'] > REGRESSION_RATIO) & \
+                           (merged['seconds'] - merged['seconds_baseline'] > REGRESSION_SECONDS)
+    return merged
+
+
+def save_results(results, meta, output_dir=RESULTS_DIR):
+    """Write the benchmark as JSON (with its environment) and CSV; returns the JSON path"""
+    
+    os.makedirs(output_dir, exist_ok=True)
+    stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    json_file = os.path.join(output_dir, f'benchmark_{stamp}.json')
+    
+    with open(json_file, 'w') as f:
+        json.dump({'meta': meta, 'results': results.replace({np.nan: None}).to_dict('records')}, f, indent=2)
+    results.to_csv(os.path.join(output_dir, f'benchmark_{stamp}.csv'), index=False)
+    return json_file
+
+
+def load_results(path):
+    """Results table of a saved benchmark JSON"""
+    with open(path, 'r') as f:
+        return pd.DataFrame(json.load(f)['results'])
+
+
+if __name__ == "__main__":
+    # python benchmark.py [--sizes=1000,10000,100000] [--steps=load,efa,...] [--repeat=R]
+    #                     [--no-memory] [--rebuild] [--compare=benchmarks/results/old.json]
+    options = dict(arg[2:].split('=', 1) for arg in sys.argv[1:] if arg.startswith('--') and '=' in arg)
+    sizes = [int(float(n)) for n in options['sizes'].split(',')] if 'sizes' in options else DEFAULT_SIZES
+    steps = options['steps'].split(',') if 'steps' in options else None
+    repeat = int(options.get('repeat', 1))
+    memory = '--no-memory' not in sys.argv
+    
+    unknown = set(steps or []) - {step for step, _ in STEPS}
+    if unknown:
+        raise ValueError(f"Unknown benchmark steps: {', '.join(sorted(unknown))}")
+    
+    print("="*80)
+    print("BENCHMARK SUITE")
+    print("="*80)
+    print(f"Sizes: {', '.join(f'{n:,}' for n in sizes)} | repeat: {repeat} | memory: {'on' if memory else 'off'}")
+    
+    meta = {**environment(), 'sizes': sizes, 'repeat': repeat, 'memory': memory}
+    results = run_benchmarks(sizes, steps, repeat, memory, '--rebuild' in sys.argv)
+    json_file = save_results(results, meta)
+    print(f"\n✓ Saved: {json_file}")
+    
+    if 'compare' in options:
+        comparison = compare_results(results, load_results(options['compare']))
+        print(f"\nComparison with {options['compare']}:")
+        print(f"{'n':>10} {'step':<22} {'before':>10} {'now':>10} {'ratio':>8}")
+        print("-"*64)
+        for _, row in comparison.iterrows():
+            mark = '✗' if row['regression'] else '✓'
+            print(f"{row['n']:>10,} {row['step']:<22} {row['seconds_baseline']:>9.3f}s {row['seconds']:>9.3f}s "
+                  f"{row['ratio']:>7.2f}x {mark}")
+        
+        regressions = comparison[comparison['regression']]
+        if len(regressions):
+            print(f"\n⚠ {len(regressions)} step(s) slower than the baseline "
+                  f"(>{REGRESSION_RATIO:.2f}x and >{REGRESSION_SECONDS:.2f}s)")
+            print("="*80)
+            sys.exit(1)
+        print("\n✓ No performance regressions")
+    
+    print("="*80)
@@ -0,0 +1,134 @@
+"""
+Careless Response Screening
+Per-respondent careless-responding indices computed for the whole panel in a
+few matrix operations: longstring, intra-individual response variability
+(IRV), even-odd consistency and Mahalanobis D². Respondents crossing the
+thresholds are flagged so an analyzer can report or exclude them.
+"""
+
+import pandas as pd
+import numpy as np
+from scipy import stats
+import warnings
+
+# A respondent is flagged on an index when it crosses its threshold:
+# longstring - longest run of identical answers as a share of the items (>=)
+# irv - SD of a respondent's answers across all items (<)
+# even_odd - Spearman-Brown corrected even-odd consistency (<)
+# mahalanobis_p - chi-square p-value of D² (<)
+THRESHOLDS = {
+    'longstring': 0.5,
+    'irv': 0.5,
+    'even_odd': 0.3,
+    'mahalanobis_p': 0.001
+}
+
+
+def longstring(X):
+    """Longest run of identical consecutive answers per row (missing answers break a run)"""
+    
+    n, p = X.shape
+    if p < 2:
+        return np.ones(n, dtype=int)
+    
+    same = X[:, 1:] == X[:, :-1]
+    position = np.arange(p - 1)
+    # Run length ending at each position: distance to the last break in the row
+    last_break = np.maximum.accumulate(np.where(same, -1, position), axis=1)
+    runs = np.where(same, position - last_break, 0)
+    return runs.max(axis=1) + 1
+
+
+def response_variability(X):
+    """Intra-individual response variability: SD of each row's answered items"""
+    return np.nanstd(X, axis=1, ddof=1)
+
+
+def even_odd_consistency(X, scale_positions):
+    """
+    Even-odd consistency: every scale is split into its odd- and even-numbered
+    items, the two half-scale means are correlated within each row across scales,
+    and the correlation is Spearman-Brown corrected. NaN when a row's half-scale
+    means do not vary across scales.
+    """
+    
+    odd = np.column_stack([np.nanmean(X[:, positions[0::2]], axis=1) for positions in scale_positions])
+    even = np.column_stack([np.nanmean(X[:, positions[1::2]], axis=1) for positions in scale_positions])
+    
+    odd = odd - np.nanmean(odd, axis=1, keepdims=True)
+    even = even - np.nanmean(even, axis=1, keepdims=True)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        r = np.nansum(odd * even, axis=1) / np.sqrt(np.nansum(odd ** 2, axis=1) * np.nansum(even ** 2, axis=1))
+        return 2 * r / (1 + r)
+
+
+def mahalanobis_distances(X):
+    """
+    Squared Mahalanobis distance of every row from the item means, with its
+    chi-square p-value (df = items). Missing answers are set to the item mean,
+    which adds nothing to a row's distance.
+    """
+    
+    n, p = X.shape
+    if n <= p:
+        return np.full(n, np.nan), np.full(n, np.nan)
+    
+    means = np.nanmean(X, axis=0)
+    centered = np.where(np.isnan(X), 0, X - means)
+    # Mean-filled deviations have zero column means, so the covariance is one product
+    precision = np.linalg.pinv(centered.T @ centered / (n - 1))
+    d2 = ((centered @ precision) * centered).sum(axis=1)
+    return d2, stats.chi2.sf(d2, p)
+
+
+def screen_responses(data, scales, thresholds=None, min_flags=1):
+    """
+    Careless-responding indices and flags for every row of data.
+    scales maps each scale to its items in administration order; rows flagged
+    on at least min_flags indices are marked careless.
+    """
+    
+    thresholds = {**THRESHOLDS, **(thresholds or {})}
+    items = [item for scale_items in scales.values() for item in scale_items]
+    X = data[items].values.astype(float)
+    
+    scale_positions, start = [], 0
+    for scale_items in scales.values():
+        scale_positions.append(np.arange(start, start + len(scale_items)))
+        start += len(scale_items)
+    
+    screen = pd.DataFrame(index=data.index)
+    with warnings.catch_warnings():
+        # Rows or half-scales without answers give NaN indices
+        warnings.simplefilter('ignore', RuntimeWarning)
+        screen['longstring'] = longstring(X)
+        screen['irv'] = response_variability(X)
+        screen['even_odd'] = even_odd_consistency(X, scale_positions)
+        screen['mahalanobis_d2'], screen['mahalanobis_p'] = mahalanobis_distances(X)
+    
+    with np.errstate(invalid='ignore'):
+        screen['flag_longstring'] = screen['longstring'] >= thresholds['longstring'] * len(items)
+        screen['flag_irv'] = screen['irv'] < thresholds['irv']
+        screen['flag_even_odd'] = screen['even_odd'] < thresholds['even_odd']
+        screen['flag_mahalanobis'] = screen['mahalanobis_p'] < thresholds['mahalanobis_p']
+    
+    flags = ['flag_longstring', 'flag_irv', 'flag_even_odd', 'flag_mahalanobis']
+    screen['n_flags'] = screen[flags].sum(axis=1)
+    screen['careless'] = screen['n_flags'] >= min_flags
+    
+    return screen
+
+
+def screening_summary(screen, ids=None, thresholds=None, max_sample=10):
+    """Counts per index and a sample of flagged rows (ids aligned with screen's rows)"""
+    
+    careless = screen['careless'].values
+    flagged = (np.asarray(ids) if ids is not None else screen.index.values)[careless]
+    
+    return {
+        'n': len(screen),
+        'flagged': int(careless.sum()),
+        'by_index': {col[len('flag_'):]: int(screen[col].sum()) for col in screen.columns if col.startswith('flag_')},
+        'thresholds': {**THRESHOLDS, **(thresholds or {})},
+        'sample_rows': [str(row_id) for row_id in flagged[:max_sample]]
+    }
@@ -0,0 +1,256 @@
+"""
+Copula Synthesizer
+Fits a Gaussian copula with empirical (ordinal) margins per country to an
+existing survey_data_complete.csv and samples any number of synthetic
+respondents with the observed dependence structure. No real record is copied:
+every synthetic value is drawn from a margin, and composites, IDs and the
+organization size category are derived afterwards as the generator does.
+"""
+
+import pandas as pd
+import numpy as np
+from scipy import stats
+import json
+import os
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SCHEMA_FILE = os.path.join(BASE_DIR, 'survey_schema.json')
+REGISTRY_FILE = os.path.join(BASE_DIR, 'country_registry.json')
+INPUT_FILE = 'research_data/survey_data_complete.csv'
+OUTPUT_FILE = 'research_data/synthetic_survey_data.csv'
+
+# Nominal columns, modelled through their category codes (sorted category order)
+CATEGORICAL = ['Gender', 'Position_Level', 'Education', 'Industry']
+
+# Numeric demographics and the survey date (as a day number) modelled with the items
+NUMERIC = ['Age', 'Tenure_Years', 'Org_Size_Numeric']
+DATE_COLUMN = 'Survey_Date'
+EPOCH = pd.Timestamp('1970-01-01')
+
+
+class Margin:
+    """
+    Empirical margin of one column: the sorted observed values and their
+    cumulative probabilities. The normal score of every observed value (the
+    mid-rank of its probability step) is computed once, so transforming data is
+    a searchsorted lookup and sampling is a searchsorted on the CDF.
+    """
+    
+    __slots__ = ('support', 'cdf', 'scores')
+    
+    def __init__(self, values):
+        observed = values[~np.isnan(values)]
+        self.support, counts = np.unique(observed, return_counts=True)
+        self.cdf = np.cumsum(counts) / counts.sum()
+        self.scores = stats.norm.ppf(self.cdf - counts / (2 * counts.sum()))
+    
+    def transform(self, values):
+        """Normal scores of values from the margin (NaN stays NaN)"""
+        missing = np.isnan(values)
+        positions = np.searchsorted(self.support, np.where(missing, self.support[0], values))
+        return np.where(missing, np.nan, self.scores[np.minimum(positions, len(self.support) - 1)])
+    
+    def sample(self, u):
+        """Inverse CDF: margin values for uniform draws u"""
+        return self.support[np.minimum(np.searchsorted(self.cdf, u), len(self.support) - 1)]
+
+
+def draw_margins(margins, cholesky, n, rng):
+    """n draws from the copula: one matrix multiply, then a searchsorted per margin"""
+    U = stats.norm.cdf(rng.standard_normal((n, len(margins))) @ cholesky.T)
+    return np.column_stack([margin.sample(U[:, j]) for j, margin in enumerate(margins)])
+
+
+def nearest_correlation(corr, floor=1e-6):
+    """Closest positive definite correlation matrix by eigenvalue clipping"""
+    
+    eigvals, eigvecs = np.linalg.eigh((corr + corr.T) / 2)
+    fixed = (eigvecs * np.clip(eigvals, floor, None)) @ eigvecs.T
+    d = np.sqrt(np.diag(fixed))
+    return fixed / np.outer(d, d)
+
+
+class CopulaSynthesizer:
+    """
+    Gaussian copula with empirical margins, fitted separately for every country.
+    fit() keeps each country's margins, the normal scores of the training data and
+    the Cholesky factor of their correlation; sample() draws respondents with one
+    matrix multiply and a searchsorted per column.
+    """
+    
+    def __init__(self, schema_path=SCHEMA_FILE, registry_path=REGISTRY_FILE):
+        with open(schema_path, 'r') as f:
+            self.schema = json.load(f)
+        with open(registry_path, 'r') as f:
+            self.registry = json.load(f)
+        
+        groups = {group['name']: group['columns'] for group in self.schema['groups']}
+        self.survey_columns = [col for columns in groups.values() for col in columns]
+        self.items = groups['LRAIT Items'] + groups['Outcome Items'] + groups['Cultural Items']
+        self.composites = [(rule['column'], rule['items']) for rule in self.schema['rules'] if rule['rule'] == 'composite']
+        self.unrounded = set(groups['LRAIT Scores'])
+        self.columns = NUMERIC + CATEGORICAL + self.items + [DATE_COLUMN]
+        self.models = {}
+    
+    def encode(self, data):
+        """Modelled columns as a float matrix (category codes, dates as day numbers)"""
+        
+        encoded = {col: data[col].values.astype(float) for col in NUMERIC + self.items}
+        for col in CATEGORICAL:
+            codes = pd.Categorical(data[col], categories=self.categories[col]).codes.astype(float)
+            encoded[col] = np.where(codes < 0, np.nan, codes)
+        encoded[DATE_COLUMN] = ((pd.to_datetime(data[DATE_COLUMN]) - EPOCH).dt.days).values.astype(float)
+        return np.column_stack([encoded[col] for col in self.columns])
+    
+    def fit(self, data, calibration_rounds=5, calibration_draws=20000, seed=0):
+        """
+        Fit margins and the copula correlation for every country in data.
+        Discrete margins attenuate correlations, so the latent correlation is
+        corrected over calibration_rounds until the normal scores of draws from the
+        copula have the correlation of the real normal scores.
+        """
+        
+        self.categories = {col: sorted(data[col].dropna().unique()) for col in CATEGORICAL}
+        self.models = {}
+        
+        for country, group in data.groupby('Country', sort=False):
+            X = self.encode(group)
+            margins = [Margin(X[:, j]) for j in range(X.shape[1])]
+            scores = np.column_stack([margin.transform(X[:, j]) for j, margin in enumerate(margins)])
+            
+            # Pairwise-complete correlation of the normal scores, repaired to positive definite
+            target = pd.DataFrame(scores).corr().fillna(0).values
+            np.fill_diagonal(target, 1)
+            corr = nearest_correlation(target)
+            
+            rng = np.random.default_rng(seed)
+            for _ in range(calibration_rounds):
+                draws = draw_margins(margins, np.linalg.cholesky(corr), calibration_draws, rng)
+                drawn_scores = np.column_stack([margin.transform(draws[:, j]) for j, margin in enumerate(margins)])
+                corr = corr + target - np.nan_to_num(np.corrcoef(drawn_scores, rowvar=False))
+                np.fill_diagonal(corr, 1)
+                corr = nearest_correlation(np.clip(corr, -1, 1))
+            
+            self.models[country] = {
+                'n': len(group),
+                'margins': margins,
+                'scores': scores,
+                'correlation': corr,
+                'cholesky': np.linalg.cholesky(corr)
+            }
+        
+        return self
+    
+    def sample_country(self, country, n, rng):
+        """n synthetic respondents of one country (modelled columns only)"""
+        
+        model = self.models[country]
+        draws = draw_margins(model['margins'], model['cholesky'], n, rng)
+        values = dict(zip(self.columns, draws.T))
+        
+        sample = pd.DataFrame({'Country': country, **{col: values[col] for col in NUMERIC + self.items}})
+        for col in CATEGORICAL:
+            sample[col] = np.asarray(self.categories[col], dtype=object)[values[col].astype(int)]
+        sample[DATE_COLUMN] = (EPOCH + pd.to_timedelta(values[DATE_COLUMN], unit='D')).strftime('%Y-%m-%d')
+        return sample
+    
+    def derive_columns(self, sample, phase='SYN'):
+        """Participant IDs, organization size category, consistent tenure and composite scores"""
+        
+        shared = self.registry['shared']
+        
+        # Tenure cannot exceed the working years implied by age and education
+        max_tenure = sample['Age'] - sample['Education'].map(shared['career_start_age'])
+        sample['Tenure_Years'] = np.minimum(sample['Tenure_Years'], max_tenure.clip(lower=0))
+        
+        # Category from the registry's numeric size bands
+        bands = shared['org_size_numeric']
+        upper = np.array([bands[category][1] for category in bands])
+        labels = np.asarray(list(bands), dtype=object)
+        sample['Org_Size_Category'] = labels[np.minimum(np.searchsorted(upper, sample['Org_Size_Numeric'], side='right'),
+                                                        len(labels) - 1)]
+        
+        for column, items in self.composites:
+            score = sample[items].mean(axis=1)
+            sample[column] = score if column in self.unrounded else score.round(2)
+        
+        codes = sample['Country'].map({country: spec['code'] for country, spec in self.registry['countries'].items()})
+        sequence = sample.groupby('Country').cumcount() + 1
+        sample['Participant_ID'] = codes + f'_{phase}_' + sequence.astype(str).str.zfill(3)
+        return sample
+    
+    def sample(self, country_sizes=None, seed=None):
+        """
+        Synthetic survey panel in the survey schema's column order.
+        country_sizes maps country -> respondents (default: the fitted sample sizes).
+        """
+        
+        if not self.models:
+            raise ValueError("Fit the synthesizer before sampling")
+        if country_sizes is None:
+            country_sizes = {country: model['n'] for country, model in self.models.items()}
+        
+        rng = np.random.default_rng(seed)
+        sample = pd.concat([self.sample_country(country, n, rng) for country, n in country_sizes.items()],
+                           ignore_index=True)
+        return self.derive_columns(sample)[self.survey_columns]
+    
+    def fidelity(self, data, synthetic):
+        """
+        Per country: largest absolute difference between the real and synthetic item
+        correlation matrices and item means, and the share of synthetic respondents
+        whose full item vector equals a real respondent's (a disclosure check).
+        """
+        
+        report = {}
+        for country, real in data.groupby('Country', sort=False):
+            synth = synthetic[synthetic['Country'] == country]
+            if synth.empty:
+                continue
+            real_items, synth_items = real[self.items], synth[self.items]
+            real_keys = set(map(tuple, real_items.dropna().values))
+            report[country] = {
+                'n_synthetic': len(synth),
+                'max_corr_diff': float(np.nanmax(np.abs(real_items.corr().values - synth_items.corr().values))),
+                'max_mean_diff': float(np.nanmax(np.abs(real_items.mean().values - synth_items.mean().values))),
+                'exact_match_rate': float(np.mean([tuple(row) in real_keys for row in synth_items.values]))
+            }
+        return report
+
+
+if __name__ == "__main__":
+    # python copula_synthesizer.py [--input=...csv] [--output=...csv] [--n=N per country] [--seed=S]
+    options = dict(arg[2:].split('=', 1) for arg in sys.argv[1:] if arg.startswith('--') and '=' in arg)
+    input_file = options.get('input', INPUT_FILE)
+    output_file = options.get('output', OUTPUT_FILE)
+    seed = int(options.get('seed', 42))
+    
+    print("="*80)
+    print("GAUSSIAN COPULA SYNTHESIZER")
+    print("="*80)
+    
+    data = pd.read_csv(input_file)
+    start = time.time()
+    synthesizer = CopulaSynthesizer().fit(data)
+    print(f"\n✓ Fitted {len(synthesizer.models)} countries on {len(data)} respondents "
+          f"({len(synthesizer.columns)} columns) in {time.time() - start:.2f}s")
+    
+    country_sizes = None
+    if 'n' in options:
+        country_sizes = {country: int(options['n']) for country in synthesizer.models}
+    
+    start = time.time()
+    synthetic = synthesizer.sample(country_sizes, seed=seed)
+    print(f"✓ Sampled {len(synthetic)} synthetic respondents in {time.time() - start:.2f}s")
+    
+    print(f"\n{'Country':<12} {'n':>10} {'max |Δr|':>10} {'max |Δmean|':>12} {'exact match':>12}")
+    print("-"*60)
+    for country, row in synthesizer.fidelity(data, synthetic).items():
+        print(f"{country:<12} {row['n_synthetic']:>10d} {row['max_corr_diff']:>10.3f} "
+              f"{row['max_mean_diff']:>12.3f} {row['exact_match_rate']:>12.1%}")
+    
+    synthetic.to_csv(output_file, index=False)
+    print(f"\n✓ Saved: {output_file}")
+    print("="*80)
@@ -0,0 +1,38 @@
+"""
+Lazy Imports
+Module stand-ins that import the real module on first attribute access, so a
+script pays for matplotlib, seaborn, statsmodels, factor_analyzer or scipy.stats
+only when a step that needs them runs.
+"""
+
+import importlib
+
+
+class LazyModule:
+    """
+    Placeholder for the module called name; the first attribute lookup imports it and
+    runs setup(module) once (e.g. global plot styling), after which lookups go
+    straight to the module.
+    """
+    
+    def __init__(self, name, setup=None):
+        self._name = name
+        self._setup = setup
+        self._module = None
+    
+    def _load(self):
+        """The real module, imported (and set up) on the first call"""
+        if self._module is None:
+            module = importlib.import_module(self._name)
+            if self._setup is not None:
+                self._setup(module)
+            self._module = module
+        return self._module
+    
+    def __getattr__(self, attr):
+        # Only called for names not set in __init__, i.e. the module's attributes
+        return getattr(self._load(), attr)
+    
+    def __repr__(self):
+        state = 'loaded' if self._module is not None else 'not loaded'
+        return f"<lazy module '{self._name}' ({state})>"
@@ -0,0 +1,253 @@
+"""
+Power Analysis Script
+Monte Carlo power for the moderation and hierarchical regression tests:
+simulates surveys with DissertationDataGenerator (1_generate_2.py) at chosen
+sample sizes and interaction effects, tests every replication with the same
+models as moderation_analysis / hierarchical_regression (array OLS, no tables
+or figures) and reports power curves. Replications run in a process pool.
+"""
+
+import pandas as pd
+import numpy as np
+from scipy import stats
+from concurrent.futures import ProcessPoolExecutor
+import importlib.util
+import os
+import sys
+import time
+
+GENERATOR_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '1_generate_2.py')
+OUTPUT_DIR = 'research_data/analysis_output'
+
+# Moderation tests: interaction key -> (predictor, moderator), as in moderation_analysis
+MODERATIONS = {
+    'TC_x_PD': ('TC_Score', 'PD_Score'),
+    'CMC_x_UA': ('CMC_Score', 'UA_Score'),
+    'EA_x_Coll': ('EA_Score', 'Collectivism_Score'),
+    'ALO_x_LTO': ('ALO_Score', 'LTO_Score')
+}
+
+# Hierarchical regression (combined sample), as in hierarchical_regression
+CONTROLS = ['Age', 'Gender_Male', 'Position_Dept', 'Position_Senior', 'Org_Size_Numeric']
+READINESS = ['TC_Score', 'CMC_Score', 'EA_Score', 'ALO_Score']
+
+TESTS = [f'moderation/{key}' for key in MODERATIONS] + \
+        ['regression/r2_change'] + [f'regression/{dim}' for dim in READINESS]
+
+_generator = None
+
+
+def load_generator_module(path=GENERATOR_FILE):
+    """Import the numbered generator script as a module (once per process)"""
+    if 'generate_data' not in sys.modules:
+        spec = importlib.util.spec_from_file_location('generate_data', path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        sys.modules['generate_data'] = module
+    return sys.modules['generate_data']
+
+
+def get_generator():
+    """One generator per process (registry and schema are parsed once)"""
+    global _generator
+    if _generator is None:
+        _generator = load_generator_module().DissertationDataGenerator(seed=0)
+    return _generator
+
+
+def simulate_survey(generator, country_sizes):
+    """Composite scores and covariates of one simulated survey (the default generator path, no IDs or files)"""
+    
+    demographics = generator.generate_demographics(country_sizes, is_qualitative=False)
+    target_scores = generator.generate_lrait_scores(demographics)
+    _, dimension_scores = generator.generate_item_scores(target_scores)
+    cultural_values = generator.generate_cultural_values(demographics)
+    outcomes = generator.generate_outcome_scores(dimension_scores, demographics, cultural_values)
+    
+    return {
+        **{col: dimension_scores[col].values for col in READINESS},
+        **{col: cultural_values[col].values for col in ['PD_Score', 'UA_Score', 'Collectivism_Score', 'LTO_Score']},
+        'Overall_Success': outcomes['Overall_Success'].values,
+        'Age': demographics['Age'].values.astype(float),
+        'Gender_Male': (demographics['Gender'] == 'Male').values.astype(float),
+        'Position_Dept': (demographics['Position_Level'] == 'Department Head').values.astype(float),
+        'Position_Senior': (demographics['Position_Level'] == 'Senior Executive').values.astype(float),
+        'Org_Size_Numeric': demographics['Org_Size_Numeric'].values.astype(float)
+    }
+
+
+def ols(X, y):
+    """
+    OLS with an intercept via QR.
+    Returns (coefficients, t values, residual df, R²); coefficients exclude the intercept.
+    """
+    
+    n = len(y)
+    X1 = np.column_stack([np.ones(n), X])
+    Q, R = np.linalg.qr(X1)
+    beta = np.linalg.solve(R, Q.T @ y)
+    resid = y - X1 @ beta
+    df_resid = n - X1.shape[1]
+    sigma2 = resid @ resid / df_resid
+    R_inv = np.linalg.inv(R)
+    se = np.sqrt(sigma2 * (R_inv ** 2).sum(axis=1))
+    r2 = 1 - resid @ resid / ((y - y.mean()) @ (y - y.mean()))
+    return beta[1:], beta[1:] / se[1:], df_resid, r2
+
+
+def replication_p_values(data):
+    """p-value of every test in TESTS for one simulated survey"""
+    
+    y = data['Overall_Success']
+    p_values = []
+    
+    # Moderation: y ~ predictor_c + moderator_c + predictor_c x moderator_c
+    for predictor, moderator in MODERATIONS.values():
+        x_c = data[predictor] - data[predictor].mean()
+        m_c = data[moderator] - data[moderator].mean()
+        _, t, df_resid, _ = ols(np.column_stack([x_c, m_c, x_c * m_c]), y)
+        p_values.append(2 * stats.t.sf(abs(t[2]), df_resid))
+    
+    # Hierarchical regression: controls, then the readiness dimensions
+    controls = np.column_stack([data[col] for col in CONTROLS])
+    readiness = np.column_stack([data[col] for col in READINESS])
+    _, _, _, r2_step1 = ols(controls, y)
+    _, t, df_resid, r2_step2 = ols(np.column_stack([controls, readiness]), y)
+    f_change = ((r2_step2 - r2_step1) / len(READINESS)) / ((1 - r2_step2) / df_resid)
+    p_values.append(stats.f.sf(f_change, len(READINESS), df_resid))
+    p_values.extend(2 * stats.t.sf(np.abs(t[len(CONTROLS):]), df_resid))
+    
+    return p_values
+
+
+def run_replications(task):
+    """Worker: p-values (replications x TESTS) for one chunk of a grid cell"""
+    
+    country_sizes, interaction_effects, seeds = task
+    generator = get_generator()
+    generator.interaction_effects = interaction_effects
+    
+    p_values = np.empty((len(seeds), len(TESTS)))
+    for i, seed in enumerate(seeds):
+        generator.rng = np.random.RandomState(seed)
+        p_values[i] = replication_p_values(simulate_survey(generator, country_sizes))
+    
+    return p_values
+
+
+def power_grid(sample_sizes=(100, 150, 213, 300, 400), effect_scales=(0.5, 1.0), replications=1000,
+               alpha=0.05, workers=None, chunk_size=50, seed=42, effects=None):
+    """
+    Monte Carlo power over a grid of per-country sample sizes x effect scales.
+    effect_scale multiplies every interaction effect (the generator defaults, or
+    effects when given). Returns one row per cell and test with power and its
+    Monte Carlo standard error.
+    """
+    
+    base_effects = {**load_generator_module().INTERACTION_EFFECTS, **(effects or {})}
+    countries = list(get_generator().countries)
+    cells = [(n, scale) for n in sample_sizes for scale in effect_scales]
+    
+    # Independent seeds for every replication of every cell
+    seeds = np.random.SeedSequence(seed).generate_state(len(cells) * replications).reshape(len(cells), replications)
+    
+    tasks, owners = [], []
+    for cell_index, (n, scale) in enumerate(cells):
+        country_sizes = {country: n for country in countries}
+        scaled = {key: value * scale for key, value in base_effects.items()}
+        for start in range(0, replications, chunk_size):
+            tasks.append((country_sizes, scaled, seeds[cell_index, start:start + chunk_size]))
+            owners.append(cell_index)
+    
+    workers = workers or os.cpu_count() or 1
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunks = list(pool.map(run_replications, tasks))
+    else:
+        chunks = [run_replications(task) for task in tasks]
+    
+    rows = []
+    owners = np.array(owners)
+    for cell_index, (n, scale) in enumerate(cells):
+        p_values = np.vstack([chunks[i] for i in np.flatnonzero(owners == cell_index)])
+        power = (p_values < alpha).mean(axis=0)
+        for test, test_power in zip(TESTS, power):
+            rows.append({
+                'n_per_country': n,
+                'effect_scale': scale,
+                'test': test,
+                'power': float(test_power),
+                'mc_se': float(np.sqrt(test_power * (1 - test_power) / len(p_values))),
+                'replications': len(p_values)
+            })
+    
+    return pd.DataFrame(rows)
+
+
+def print_power(power):
+    """Power table per effect scale (rows: sample size, columns: tests)"""
+    
+    print("="*80)
+    print("MONTE CARLO POWER")
+    print("="*80)
+    
+    for scale, cell in power.groupby('effect_scale'):
+        table = cell.pivot(index='n_per_country', columns='test', values='power')[TESTS]
+        print(f"\nEffect scale × {scale:g} ({int(cell['replications'].iloc[0])} replications per cell)")
+        print(f"{'n/country':>10} " + ' '.join(f"{test.split('/')[1]:>12}" for test in TESTS))
+        print("-"*(11 + 13 * len(TESTS)))
+        for n, row in table.iterrows():
+            print(f"{n:>10d} " + ' '.join(f"{value:>12.3f}" for value in row))
+    
+    print("="*80)
+
+
+def plot_power_curves(power, output_file, tests=None, target=0.80):
+    """Power against sample size, one panel per test and one line per effect scale"""
+    
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    
+    tests = tests or TESTS
+    cols = min(3, len(tests))
+    rows = int(np.ceil(len(tests) / cols))
+    fig, axes = plt.subplots(rows, cols, figsize=(5 * cols, 3.5 * rows), squeeze=False)
+    
+    for ax, test in zip(axes.ravel(), tests):
+        for scale, curve in power[power['test'] == test].groupby('effect_scale'):
+            ax.errorbar(curve['n_per_country'], curve['power'], yerr=1.96 * curve['mc_se'],
+                        marker='o', capsize=3, label=f'× {scale:g}')
+        ax.axhline(target, color='grey', linestyle='--', linewidth=1)
+        ax.set_title(test)
+        ax.set_xlabel('n per country')
+        ax.set_ylabel('Power')
+        ax.set_ylim(0, 1.02)
+        ax.legend(title='Effect', fontsize=8)
+    for ax in axes.ravel()[len(tests):]:
+        ax.axis('off')
+    
+    fig.tight_layout()
+    fig.savefig(output_file, dpi=150)
+    plt.close(fig)
+
+
+if __name__ == "__main__":
+    # python power_analysis.py [--n=100,213,400] [--scales=0.5,1] [--reps=1000] [--workers=4] [--alpha=0.05]
+    options = dict(arg[2:].split('=', 1) for arg in sys.argv[1:] if arg.startswith('--') and '=' in arg)
+    sample_sizes = [int(n) for n in options.get('n', '100,150,213,300,400').split(',')]
+    effect_scales = [float(scale) for scale in options.get('scales', '0.5,1.0').split(',')]
+    replications = int(options.get('reps', 1000))
+    workers = int(options['workers']) if 'workers' in options else None
+    alpha = float(options.get('alpha', 0.05))
+    
+    start = time.time()
+    power = power_grid(sample_sizes, effect_scales, replications, alpha, workers)
+    print_power(power)
+    print(f"\n✓ {len(sample_sizes) * len(effect_scales) * replications} replications in {time.time() - start:.1f}s")
+    
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    power.to_csv(f'{OUTPUT_DIR}/power_analysis.csv', index=False)
+    plot_power_curves(power, f'{OUTPUT_DIR}/figure_power_curves.png')
+    print(f"✓ Saved: {OUTPUT_DIR}/power_analysis.csv")
+    print(f"✓ Saved: {OUTPUT_DIR}/figure_power_curves.png")
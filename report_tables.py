@@ -0,0 +1,350 @@
+"""
+Report Tables
+Format-independent table model for the dissertation tables: a Table is built
+once from the analysis results and rendered by pluggable writers (TXT, XLSX,
+CSV, LaTeX, Markdown) without recomputing any statistic
+"""
+
+import csv
+import os
+
+XLSX_FILE = 'analysis_results_complete.xlsx'
+
+
+def significance_stars(p_value, ns=''):
+    """*** p < .001, ** p < .01, * p < .05"""
+    if p_value is None or p_value != p_value:
+        return ''
+    if p_value < 0.001:
+        return '***'
+    if p_value < 0.01:
+        return '**'
+    if p_value < 0.05:
+        return '*'
+    return ns
+
+
+class Cell:
+    """
+    One table value. Numbers keep their value for spreadsheet writers;
+    fmt is a format spec ('.2f', 'd', ...) or 'p' for APA-style p-values,
+    prefix/suffix are literal text such as stars, '%' or brackets.
+    """
+
+    __slots__ = ('value', 'fmt', 'prefix', 'suffix')
+
+    def __init__(self, value, fmt=None, prefix='', suffix=''):
+        self.value = value
+        self.fmt = fmt
+        self.prefix = prefix
+        self.suffix = suffix
+
+    @property
+    def is_number(self):
+        return isinstance(self.value, (int, float)) and not isinstance(self.value, bool) and self.value == self.value
+
+    @property
+    def text(self):
+        if self.value is None:
+            return ''
+        if not self.is_number:
+            body = str(self.value) if self.value == self.value else '—'
+        elif self.fmt == 'p':
+            body = '<.001' if self.value < 0.001 else f'{self.value:.3f}'
+        elif self.fmt:
+            body = format(self.value, self.fmt)
+        else:
+            body = str(self.value)
+        return f'{self.prefix}{body}{self.suffix}'
+
+
+def as_cell(value):
+    return value if isinstance(value, Cell) else Cell(value)
+
+
+class Table:
+    """
+    A titled grid: a label column plus data columns, with section headings,
+    blank separator rows and free-text notes.
+    key is the output file stem, sheet the spreadsheet tab name; formats limits
+    the writers that render the table (None = all).
+    """
+
+    def __init__(self, key, title, columns, notes=None, sheet=None, formats=None):
+        self.key = key
+        self.title = title
+        self.columns = list(columns)
+        self.notes = list(notes or [])
+        self.sheet = (sheet or key)[:31]
+        self.formats = formats
+        self.rows = []
+        self.row_sources = []
+
+    def make_row(self, label, cells):
+        cells = [as_cell(cell) for cell in cells]
+        cells += [Cell(None)] * (len(self.columns) - 1 - len(cells))
+        return 'row', as_cell(label), cells
+
+    def add_row(self, label, *cells):
+        """Data row; plain values are wrapped in a Cell"""
+        self.rows.append(self.make_row(label, cells))
+
+    def add_rows(self, row_factory):
+        """
+        Stream rows after the stored ones: row_factory() returns an iterable of
+        (label, *cells) tuples and is called once per writer, so large result
+        sets are produced while they are written and never held in the table.
+        """
+        self.row_sources.append(row_factory)
+
+    def iter_rows(self):
+        """Stored rows, then every streamed row"""
+        yield from self.rows
+        for row_factory in self.row_sources:
+            for label, *cells in row_factory():
+                yield self.make_row(label, cells)
+
+    def add_section(self, label):
+        self.rows.append(('section', as_cell(label), []))
+
+    def add_blank(self):
+        self.rows.append(('blank', Cell(None), []))
+
+    def text_rows(self):
+        """Rows as display strings (sections and blanks padded to the column count)"""
+        width = len(self.columns)
+        for kind, label, cells in self.iter_rows():
+            texts = [label.text] + [cell.text for cell in cells]
+            yield kind, texts + [''] * (width - len(texts))
+
+
+class TextWriter:
+    """Fixed-width plain text, one .txt file per table in the output directory"""
+
+    extension = 'txt'
+
+    def render(self, table):
+        rows = list(table.text_rows())
+        widths = [len(col) for col in table.columns]
+        for kind, texts in rows:
+            if kind == 'row':
+                widths = [max(width, len(text)) for width, text in zip(widths, texts)]
+
+        def line(texts):
+            parts = [texts[0].ljust(widths[0])] + [text.rjust(width) for text, width in zip(texts[1:], widths[1:])]
+            return '  '.join(parts).rstrip()
+
+        rule = sum(widths) + 2 * (len(widths) - 1)
+        lines = [table.title, '', '=' * rule, line(table.columns), '-' * rule]
+        for kind, texts in rows:
+            if kind == 'section':
+                lines.append(texts[0])
+            elif kind == 'blank':
+                lines.append('')
+            else:
+                lines.append(line(texts))
+        lines.append('=' * rule)
+        if table.notes:
+            lines.append('')
+            lines.extend(table.notes)
+        return '\n'.join(lines)
+
+    def write(self, tables, output_dir):
+        paths = []
+        for table in tables:
+            path = os.path.join(output_dir, f'{table.key}.{self.extension}')
+            with open(path, 'w') as f:
+                f.write(self.render(table))
+            paths.append(path)
+        return paths
+
+
+class CsvWriter(TextWriter):
+    """Display values as CSV, one file per table in output_dir/tables"""
+
+    extension = 'csv'
+    subdirectory = 'tables'
+
+    def write(self, tables, output_dir):
+        directory = os.path.join(output_dir, self.subdirectory)
+        os.makedirs(directory, exist_ok=True)
+        paths = []
+        for table in tables:
+            path = os.path.join(directory, f'{table.key}.{self.extension}')
+            with open(path, 'w', newline='', encoding='utf-8') as f:
+                self.write_table(table, f)
+            paths.append(path)
+        return paths
+
+    def write_table(self, table, f):
+        writer = csv.writer(f)
+        writer.writerow(table.columns)
+        for kind, texts in table.text_rows():
+            writer.writerow(texts if kind == 'row' else [texts[0].strip()] + [''] * (len(texts) - 1))
+
+
+class MarkdownWriter(CsvWriter):
+    """GitHub-flavoured Markdown tables in output_dir/tables"""
+
+    extension = 'md'
+
+    def write_table(self, table, f):
+        def escape(text):
+            return text.replace('|', '\\|').replace('*', '\\*')
+
+        def line(texts):
+            return '| ' + ' | '.join(escape(text) for text in texts) + ' |'
+
+        f.write(f'**{escape(table.title)}**\n\n')
+        f.write(line(table.columns) + '\n')
+        f.write('|' + '|'.join([':---'] + ['---:'] * (len(table.columns) - 1)) + '|\n')
+        for kind, texts in table.text_rows():
+            if kind == 'section':
+                f.write(line([f'**{escape(texts[0].strip())}**'] + [''] * (len(texts) - 1)) + '\n')
+            elif kind == 'row':
+                f.write(line([texts[0].replace('  ', '&nbsp;&nbsp;')] + texts[1:]) + '\n')
+        if table.notes:
+            f.write('\n' + '  \n'.join(escape(note) for note in table.notes if note.strip()) + '\n')
+
+
+class LatexWriter(CsvWriter):
+    """booktabs tabular environments in output_dir/tables"""
+
+    extension = 'tex'
+    special = {'\\': r'\textbackslash{}', '&': r'\&', '%': r'\%', '$': r'\$', '#': r'\#',
+               '_': r'\_', '{': r'\{', '}': r'\}', '~': r'\textasciitilde{}', '^': r'\^{}'}
+
+    def escape(self, text):
+        return ''.join(self.special.get(char, char) for char in text)
+
+    def write_table(self, table, f):
+        def line(texts):
+            label = texts[0]
+            indent = len(label) - len(label.lstrip())
+            label = r'\quad ' * (indent // 2) + self.escape(label.strip())
+            return ' & '.join([label] + [self.escape(text) for text in texts[1:]]) + r' \\'
+
+        width = len(table.columns)
+        f.write('\\begin{table}[htbp]\n\\centering\n')
+        f.write(f'\\caption{{{self.escape(table.title)}}}\n')
+        f.write(f'\\label{{tab:{table.key}}}\n')
+        f.write(f'\\begin{{tabular}}{{l{"r" * (width - 1)}}}\n\\toprule\n')
+        f.write(line(table.columns) + '\n\\midrule\n')
+        for kind, texts in table.text_rows():
+            if kind == 'section':
+                f.write(f'\\multicolumn{{{width}}}{{l}}{{\\textit{{{self.escape(texts[0].strip())}}}}} \\\\\n')
+            elif kind == 'blank':
+                f.write('\\addlinespace\n')
+            else:
+                f.write(line(texts) + '\n')
+        f.write('\\bottomrule\n\\end{tabular}\n')
+        notes = [note.strip() for note in table.notes if note.strip()]
+        if notes:
+            f.write('\\par\\smallskip\\footnotesize\n' + '\n\n'.join(self.escape(note) for note in notes) + '\n')
+        f.write('\\end{table}\n')
+
+
+class XlsxWriter:
+    """
+    One workbook with a sheet per table; numbers stay numeric with a matching number format.
+    In write-only mode (the default) openpyxl streams each row to disk as it is
+    appended, so memory stays flat however many rows the tables stream.
+    """
+
+    extension = 'xlsx'
+
+    def __init__(self, write_only=True):
+        self.write_only = write_only
+
+    @staticmethod
+    def number_format(cell):
+        """Excel number format equivalent to a cell's fmt, prefix and suffix"""
+
+        if cell.fmt == 'p':
+            body = '0.000'
+        elif cell.fmt and cell.fmt.startswith('.') and cell.fmt.endswith('f'):
+            decimals = int(cell.fmt[1:-1])
+            body = '0.' + '0' * decimals if decimals else '0'
+        elif cell.fmt == 'd':
+            body = '0'
+        else:
+            body = 'General'
+
+        def literal(text):
+            return '"' + text.replace('"', '') + '"' if text else ''
+
+        return literal(cell.prefix) + body + literal(cell.suffix)
+
+    def write(self, tables, output_dir):
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Font
+
+        path = os.path.join(output_dir, XLSX_FILE)
+        workbook = Workbook(write_only=self.write_only)
+        if not self.write_only:
+            workbook.remove(workbook.active)
+        bold = Font(bold=True)
+
+        for table in tables:
+            sheet = workbook.create_sheet(table.sheet)
+
+            def excel_cell(cell, font=None):
+                value = cell.value if cell.is_number else (cell.text or None)
+                excel = WriteOnlyCell(sheet, value=value)
+                if cell.is_number:
+                    excel.number_format = self.number_format(cell)
+                if font is not None:
+                    excel.font = font
+                return excel
+
+            # Column widths must be set before the first row is streamed
+            labels = [table.columns[0]] + [label.text for kind, label, _ in table.rows if kind == 'row']
+            sheet.column_dimensions['A'].width = max(len(label) for label in labels) + 2
+
+            sheet.append([excel_cell(Cell(table.title), bold)])
+            sheet.append([excel_cell(Cell(column), bold) for column in table.columns])
+
+            for kind, label, cells in table.iter_rows():
+                if kind == 'blank':
+                    sheet.append([])
+                elif kind == 'section':
+                    sheet.append([excel_cell(label, bold)])
+                else:
+                    sheet.append([excel_cell(label)] + [excel_cell(cell) for cell in cells])
+
+            if table.notes:
+                sheet.append([])
+                for note in table.notes:
+                    sheet.append([note])
+
+        workbook.save(path)
+        return [path]
+
+
+WRITERS = {
+    'txt': TextWriter,
+    'xlsx': XlsxWriter,
+    'csv': CsvWriter,
+    'tex': LatexWriter,
+    'md': MarkdownWriter
+}
+
+
+def register_writer(name, writer_class):
+    """Add or replace an output format; writer_class().write(tables, output_dir) returns the paths written"""
+    WRITERS[name] = writer_class
+
+
+def write_tables(tables, output_dir, formats=None):
+    """Render tables in every requested format; returns {format: [paths]}"""
+
+    os.makedirs(output_dir, exist_ok=True)
+    written = {}
+    for name in formats or WRITERS:
+        selected = [table for table in tables if table.formats is None or name in table.formats]
+        try:
+            written[name] = WRITERS[name]().write(selected, output_dir)
+        except ImportError as e:
+            print(f"  ⚠ Warning: Could not write {name} tables. Error: {str(e)}")
+    return written
@@ -1,11 +1,187 @@
 """
-Quick script to verify the column order in survey_data_complete.csv
+Quick script to verify the structure of survey_data_complete.csv
 Run this after generating data to confirm structure
+
+Column order and validity rules come from survey_schema.json (the same
+schema the generator uses). The file is streamed in chunks and every rule
+is checked with vectorized masks, reporting violation counts and sample
+row numbers per rule.
 """
 
 import pandas as pd
+import numpy as np
+import json
+import os
+import warnings
+
+SCHEMA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'survey_schema.json')
+
+
+def load_schema(schema_file=SCHEMA_FILE):
+    """Load the declarative survey schema"""
+    with open(schema_file, 'r') as f:
+        return json.load(f)
+
+
+def schema_columns(schema):
+    """Required columns in file order"""
+    return [col for group in schema['groups'] for col in group['columns']]
+
+
+def rule_columns(rule, schema):
+    """Columns a rule applies to (explicit column/columns plus any named groups)"""
+    columns = [rule['column']] if 'column' in rule else list(rule.get('columns', []))
+    groups = {group['name']: group['columns'] for group in schema['groups']}
+    for name in rule.get('groups', []):
+        columns.extend(groups[name])
+    return columns
+
+
+def rule_name(rule):
+    """Readable label for a rule in the report"""
+    if 'name' in rule:
+        return rule['name']
+    target = rule.get('column') or ', '.join(rule.get('groups', []) + rule.get('columns', []))
+    return f"{rule['rule']}: {target}"
+
+
+def check_rule(rule, chunk, numeric, schema, seen_ids):
+    """
+    Boolean mask of the rows in a chunk that violate a rule.
+    numeric(col) returns the column coerced to float (cached per chunk).
+    """
+    
+    kind = rule['rule']
+    columns = [col for col in rule_columns(rule, schema) if col in chunk.columns]
+    present = chunk[columns].notna() if columns else None
+    
+    if kind == 'not_null':
+        return ~present.all(axis=1)
+    
+    if kind == 'pattern':
+        values = chunk[rule['column']]
+        return values.notna() & ~values.astype(str).str.fullmatch(rule['pattern'])
+    
+    if kind == 'unique':
+        values = chunk[rule['column']]
+        earlier = values.isin(seen_ids)
+        mask = values.duplicated(keep='first') | earlier
+        seen_ids.update(values.dropna())
+        return mask & values.notna()
+    
+    if kind == 'allowed':
+        values = chunk[rule['column']]
+        return values.notna() & ~values.isin(rule['values'])
+    
+    if kind in ('dtype', 'range', 'likert'):
+        values = np.column_stack([numeric(col) for col in columns])
+        bad = np.zeros(values.shape, dtype=bool)
+        if kind == 'dtype' or kind == 'likert':
+            # Non-numeric text, and non-integral values where integers are required
+            bad |= present.values & np.isnan(values)
+            if rule.get('dtype') == 'integer' or kind == 'likert':
+                bad |= ~np.isnan(values) & (values != np.round(values))
+        if kind in ('range', 'likert'):
+            if rule.get('min') is not None:
+                bad |= values < rule['min']
+            if rule.get('max') is not None:
+                bad |= values > rule['max']
+        return pd.Series(bad.any(axis=1), index=chunk.index)
+    
+    if kind == 'composite':
+        items = np.column_stack([numeric(col) for col in rule['items']])
+        if rule.get('skipna'):
+            # Rows with every item missing have no expected value (NaN, not compared)
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', RuntimeWarning)
+                expected = np.nanmean(items, axis=1)
+        else:
+            expected = items.mean(axis=1)
+        actual = numeric(rule['column'])
+        tolerance = rule.get('tolerance', schema.get('composite_tolerance', 0.006))
+        comparable = ~np.isnan(actual) & ~np.isnan(expected)
+        return pd.Series(comparable & (np.abs(actual - expected) > tolerance), index=chunk.index)
+    
+    if kind == 'date':
+        values = chunk[rule['column']]
+        dates = pd.to_datetime(values, format=rule.get('format', '%Y-%m-%d'), errors='coerce')
+        bad = values.notna() & dates.isna()
+        if 'min' in rule:
+            bad |= dates < pd.Timestamp(rule['min'])
+        if 'max' in rule:
+            bad |= dates > pd.Timestamp(rule['max'])
+        return bad
+    
+    raise ValueError(f"Unknown schema rule: {kind}")
+
 
-def verify_column_order(csv_file='research_data/survey_data_complete.csv'):
+def missing_codes(csv_file):
+    """
+    Sentinel codes for missing item responses (as 4_real_analysis.py reads them): from
+    the shard manifest next to a shard file, else from data_dictionary.json in the
+    CSV's directory. None when the generator wrote missing cells as empty.
+    """
+    
+    data_dir = os.path.dirname(csv_file) or '.'
+    code = None
+    try:
+        if os.path.exists(os.path.join(data_dir, 'manifest.json')):
+            with open(os.path.join(data_dir, 'manifest.json'), 'r') as f:
+                code = (json.load(f).get('missingness') or {}).get('code')
+        else:
+            with open(os.path.join(data_dir, 'data_dictionary.json'), 'r') as f:
+                code = json.load(f).get('missing_data', {}).get('code')
+    except (OSError, ValueError):
+        return None
+    if code is None:
+        return None
+    return [code, int(code)] if float(code).is_integer() else [code]
+
+
+def validate_survey_csv(csv_file='research_data/survey_data_complete.csv', schema_file=SCHEMA_FILE,
+                        chunksize=100000, max_samples=5):
+    """
+    Stream a survey CSV through every schema rule (cells holding the missing-data
+    code are read as missing).
+    Returns {rule name: {'violations': rows violating, 'sample_rows': first data row numbers}}
+    (data rows are numbered from 1, excluding the header).
+    """
+    
+    schema = load_schema(schema_file)
+    na_values = missing_codes(csv_file)
+    rules = list(schema["rules"])
+    report = {rule_name(rule): {'violations': 0, 'sample_rows': []} for rule in rules}
+    seen_ids = set()
+    n_rows = 0
+    
+    # Columns are parsed natively; anything that fails numeric parsing shows up as text
+    for chunk in pd.read_csv(csv_file, chunksize=chunksize, low_memory=False, na_values=na_values):
+        chunk.index = np.arange(n_rows + 1, n_rows + len(chunk) + 1)
+        n_rows += len(chunk)
+        
+        cache = {}
+        
+        def numeric(col):
+            if col not in cache:
+                if col in chunk.columns:
+                    cache[col] = pd.to_numeric(chunk[col], errors='coerce').values.astype(float)
+                else:
+                    cache[col] = np.full(len(chunk), np.nan)
+            return cache[col]
+        
+        for rule in rules:
+            mask = check_rule(rule, chunk, numeric, schema, seen_ids)
+            entry = report[rule_name(rule)]
+            entry['violations'] += int(mask.sum())
+            if len(entry['sample_rows']) < max_samples:
+                entry['sample_rows'].extend(
+                    chunk.index[mask.values][:max_samples - len(entry['sample_rows'])].tolist())
+    
+    report['_rows'] = n_rows
+    return report
+
+
+def verify_column_order(csv_file='research_data/survey_data_complete.csv', schema_file=SCHEMA_FILE):
     """
     Verify that CSV columns are in the correct order
     """
@@ -14,57 +190,24 @@ def verify_column_order(csv_file='research_data/survey_data_complete.csv'):
     print("VERIFYING CSV COLUMN ORDER")
     print("="*80)
     
-    # Load CSV
+    # Read the header only
     try:
-        df = pd.read_csv(csv_file)
+        actual_columns = list(pd.read_csv(csv_file, nrows=0).columns)
         print(f"\n✓ Loaded: {csv_file}")
-        print(f"  Shape: {df.shape}")
+        print(f"  Columns: {len(actual_columns)}")
     except FileNotFoundError:
         print(f"\n✗ File not found: {csv_file}")
-        print("  Please run: python 1_generate_enhanced.py")
+        print("  Please run: python 1_generate_2.py")
         return False
     
     # Expected column order
-    expected_order = [
-        # 1. ID and Demographics (10)
-        'Participant_ID', 'Country', 'Age', 'Gender', 'Position_Level', 
-        'Tenure_Years', 'Education', 'Industry', 'Org_Size_Category', 'Org_Size_Numeric',
-        
-        # 2. LRAIT Dimension Scores (4)
-        'TC_Score', 'CMC_Score', 'EA_Score', 'ALO_Score',
-        
-        # 3. LRAIT Items (32)
-        'TC1', 'TC2', 'TC3', 'TC4', 'TC5', 'TC6', 'TC7', 'TC8',
-        'CMC1', 'CMC2', 'CMC3', 'CMC4', 'CMC5', 'CMC6', 'CMC7', 'CMC8',
-        'EA1', 'EA2', 'EA3', 'EA4', 'EA5', 'EA6', 'EA7', 'EA8',
-        'ALO1', 'ALO2', 'ALO3', 'ALO4', 'ALO5', 'ALO6', 'ALO7', 'ALO8',
-        
-        # 4. Outcome Scores (4)
-        'OI_Score', 'SA_Score', 'OL_Score', 'Overall_Success',
-        
-        # 5. Outcome Items (12)
-        'OI1', 'OI2', 'OI3', 'OI4',
-        'SA1', 'SA2', 'SA3', 'SA4',
-        'OL1', 'OL2', 'OL3', 'OL4',
-        
-        # 6. Cultural Value Scores (4)
-        'PD_Score', 'UA_Score', 'Collectivism_Score', 'LTO_Score',
-        
-        # 7. Cultural Value Items (12)
-        'PD1', 'PD2', 'PD3',
-        'UA1', 'UA2', 'UA3',
-        'IC1', 'IC2', 'IC3',
-        'LTO1', 'LTO2', 'LTO3',
-        
-        # 8. Survey Date (1)
-        'Survey_Date'
-    ]
-    
-    actual_columns = list(df.columns)
+    schema = load_schema(schema_file)
+    expected_order = schema_columns(schema)
+    optional_cols = schema.get('optional_columns', [])
     
     # Check if all expected columns exist
     missing_cols = [col for col in expected_order if col not in actual_columns]
-    extra_cols = [col for col in actual_columns if col not in expected_order]
+    extra_cols = [col for col in actual_columns if col not in expected_order + optional_cols]
     
     print("\n" + "="*80)
     print("COLUMN CHECK")
@@ -96,17 +239,18 @@ def verify_column_order(csv_file='research_data/survey_data_complete.csv'):
             if expected_col != actual_col:
                 mismatches.append((i, expected_col, actual_col))
     
-    if not mismatches:
+    if not mismatches and not missing_cols and not extra_cols:
         print("\n✓✓✓ COLUMN ORDER IS PERFECT!")
         print("\nColumn structure:")
-        print("  Columns   1-10: ID & Demographics")
-        print("  Columns  11-14: LRAIT Scores (TC, CMC, EA, ALO)")
-        print("  Columns  15-46: LRAIT Items (32 items)")
-        print("  Columns  47-50: Outcome Scores")
-        print("  Columns  51-62: Outcome Items (12 items)")
-        print("  Columns  63-66: Cultural Scores")
-        print("  Columns  67-78: Cultural Items (12 items)")
-        print("  Column     79: Survey Date")
+        start = 1
+        for group in schema['groups']:
+            end = start + len(group['columns']) - 1
+            span = f"{start}-{end}" if end > start else f"{start}"
+            print(f"  Columns {span:>7s}: {group['name']}")
+            start = end + 1
+        for col in actual_columns[len(expected_order):]:
+            print(f"  Column  {start:>7d}: {col} (optional)")
+            start += 1
         print(f"\n  Total: {len(actual_columns)} columns")
         
         # Show sample of first few columns
@@ -117,7 +261,7 @@ def verify_column_order(csv_file='research_data/survey_data_complete.csv'):
             print(f"  {i+1:2d}. {actual_columns[i]}")
         
         return True
-        
+    
     else:
         print(f"\n✗ COLUMN ORDER MISMATCH!")
         print(f"\nFound {len(mismatches)} mismatches:")
@@ -132,49 +276,61 @@ def verify_column_order(csv_file='research_data/survey_data_complete.csv'):
         
         print("\nTO FIX:")
         print("  1. Make sure you're using the UPDATED generator")
-        print("  2. The generator should have column reordering code")
-        print("  3. Look for: quant_data = quant_data[column_order]")
+        print("  2. The generator orders columns from survey_schema.json")
+        print("  3. Look for: quant_data = quant_data[self.survey_columns]")
         
         return False
+
+
+def verify_survey_rules(csv_file='research_data/survey_data_complete.csv', schema_file=SCHEMA_FILE,
+                        chunksize=100000):
+    """
+    Check every schema rule and print violation counts with sample rows
+    """
     
+    print("\n" + "="*80)
+    print("SCHEMA RULE VERIFICATION")
     print("="*80)
+    
+    report = validate_survey_csv(csv_file, schema_file, chunksize)
+    n_rows = report.pop('_rows')
+    failed = {name: entry for name, entry in report.items() if entry['violations']}
+    
+    print(f"\nChecked {len(report)} rules on {n_rows} rows\n")
+    for name, entry in report.items():
+        if entry['violations']:
+            rows = ', '.join(str(row) for row in entry['sample_rows'])
+            print(f"  ✗ {name[:60]:60s} {entry['violations']:>8d} rows (e.g. rows {rows})")
+        else:
+            print(f"  ✓ {name[:60]:60s} {0:>8d}")
+    
+    if failed:
+        print(f"\n✗ {len(failed)} of {len(report)} rules violated")
+    else:
+        print(f"\n✓ All {len(report)} rules satisfied")
+    
+    return not failed, report
 
 
-def show_column_groups(csv_file='research_data/survey_data_complete.csv'):
+def show_column_groups(csv_file='research_data/survey_data_complete.csv', schema_file=SCHEMA_FILE):
     """
     Show detailed column grouping
     """
     
-    df = pd.read_csv(csv_file)
-    cols = list(df.columns)
+    cols = list(pd.read_csv(csv_file, nrows=0).columns)
+    schema = load_schema(schema_file)
     
     print("\n" + "="*80)
     print("DETAILED COLUMN STRUCTURE")
     print("="*80)
     
-    groups = [
-        ("ID & Demographics", 0, 10),
-        ("LRAIT Dimension Scores", 10, 14),
-        ("TC Items", 14, 22),
-        ("CMC Items", 22, 30),
-        ("EA Items", 30, 38),
-        ("ALO Items", 38, 46),
-        ("Outcome Scores", 46, 50),
-        ("OI Items", 50, 54),
-        ("SA Items", 54, 58),
-        ("OL Items", 58, 62),
-        ("Cultural Scores", 62, 66),
-        ("PD Items", 66, 69),
-        ("UA Items", 69, 72),
-        ("IC Items", 72, 75),
-        ("LTO Items", 75, 78),
-        ("Survey Date", 78, 79)
-    ]
-    
-    for group_name, start, end in groups:
-        print(f"\n{group_name} (columns {start+1}-{end}):")
+    start = 0
+    for group in schema['groups']:
+        end = start + len(group['columns'])
+        print(f"\n{group['name']} (columns {start+1}-{end}):")
         for i in range(start, min(end, len(cols))):
             print(f"  {i+1:2d}. {cols[i]}")
+        start = end
     
     print("="*80)
 
@@ -183,13 +339,20 @@ if __name__ == "__main__":
     # Verify order
     is_correct = verify_column_order()
     
+    # Verify values against every schema rule
+    rules_ok = False
+    if is_correct:
+        rules_ok, _ = verify_survey_rules()
+    
     # If correct, show detailed structure
     if is_correct:
         show_column_groups()
     
     print("\n" + "="*80)
-    if is_correct:
+    if is_correct and rules_ok:
         print("✓ CSV structure is perfect! Ready for analysis.")
+    elif is_correct:
+        print("✗ Column order is correct but some values violate the schema.")
     else:
         print("✗ Please regenerate data with updated generator.")
     print("="*80)
\ No newline at end of file
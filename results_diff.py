@@ -0,0 +1,204 @@
+"""
+Results Diff Script
+Compares two analysis runs statistic by statistic: aligns every statistic by
+path, computes absolute and relative deltas and flags changes beyond tolerance.
+Runs come from the results store (run id, run key, -1 = latest) or from an
+analysis_results_from_data.json file
+"""
+
+import pandas as pd
+import numpy as np
+import json
+import sys
+from results_store import ResultsStore, flatten_results
+
+STORE_FILE = 'research_data/analysis_output/results.sqlite'
+
+# (absolute, relative) tolerance; a numeric change is flagged when
+# |new - old| > abs_tol + rel_tol * |old|
+DEFAULT_TOLERANCE = (1e-6, 1e-4)
+
+# Statistics whose digits are not meaningful get looser tolerances (longest prefix wins);
+# an infinite tolerance ignores the statistic altogether
+PATH_TOLERANCES = {
+    'multiple_imputation/': (1e-3, 1e-2),
+    'country_comparisons/manova': (np.inf, np.inf)
+}
+
+
+def load_statistics(source, store_file=STORE_FILE):
+    """
+    Statistics of one run indexed by path (value_type, num_value, text_value).
+    source is a results JSON file, a results dict, or a run in the store.
+    """
+    
+    if isinstance(source, dict):
+        rows = list(flatten_results(source))
+    elif isinstance(source, str) and source.endswith('.json'):
+        with open(source, 'r') as f:
+            rows = list(flatten_results(json.load(f)))
+    else:
+        run = int(source) if isinstance(source, str) and source.lstrip('-').isdigit() else source
+        with ResultsStore(store_file) as store:
+            return store.statistics(run).set_index('path')[['value_type', 'num_value', 'text_value']]
+    
+    return pd.DataFrame(rows, columns=['path', 'value_type', 'num_value', 'text_value']).set_index('path')
+
+
+def tolerance_arrays(paths, default=DEFAULT_TOLERANCE, overrides=None):
+    """Absolute and relative tolerance per path (overrides keyed by path prefix)"""
+    
+    overrides = PATH_TOLERANCES if overrides is None else overrides
+    abs_tol = np.full(len(paths), default[0], dtype=float)
+    rel_tol = np.full(len(paths), default[1], dtype=float)
+    for prefix in sorted(overrides, key=len):
+        mask = paths.str.startswith(prefix)
+        abs_tol[mask], rel_tol[mask] = overrides[prefix]
+    return abs_tol, rel_tol
+
+
+def diff_statistics(old, new, tolerance=DEFAULT_TOLERANCE, overrides=None):
+    """
+    Align two statistics tables by path and classify every statistic as
+    unchanged, changed, within_tolerance, added, removed or type_changed.
+    Returns one row per path with old/new values and absolute/relative deltas.
+    """
+    
+    joined = old.join(new, how='outer', lsuffix='_old', rsuffix='_new')
+    paths = joined.index.to_series()
+    
+    in_old = joined['value_type_old'].notna().values
+    in_new = joined['value_type_new'].notna().values
+    same_type = (joined['value_type_old'] == joined['value_type_new']).values
+    numeric = same_type & joined['value_type_new'].isin(['float', 'int', 'bool']).values
+    
+    old_num = joined['num_value_old'].values.astype(float)
+    new_num = joined['num_value_new'].values.astype(float)
+    abs_delta = new_num - old_num
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rel_delta = np.where(old_num != 0, abs_delta / np.abs(old_num), np.nan)
+    
+    abs_tol, rel_tol = tolerance_arrays(paths, tolerance, overrides)
+    nan_changed = np.isnan(old_num) != np.isnan(new_num)
+    with np.errstate(invalid='ignore'):
+        beyond = nan_changed | (np.abs(abs_delta) > abs_tol + rel_tol * np.abs(old_num))
+    exact = (old_num == new_num) | (np.isnan(old_num) & np.isnan(new_num))
+    text_changed = (joined['text_value_old'].fillna('') != joined['text_value_new'].fillna('')).values
+    
+    status = np.select(
+        [~in_new, ~in_old, ~same_type,
+         numeric & beyond, numeric & ~exact,
+         ~numeric & text_changed & np.isfinite(abs_tol)],
+        ['removed', 'added', 'type_changed', 'changed', 'within_tolerance', 'changed'],
+        default='unchanged')
+    
+    def side_values(side):
+        is_text = (joined[f'value_type_{side}'] == 'text').values
+        return np.where(is_text, joined[f'text_value_{side}'].values, joined[f'num_value_{side}'].values.astype(object))
+    
+    return pd.DataFrame({
+        'analysis': paths.str.split('/', n=1).str[0].values,
+        'status': status,
+        'old': side_values('old'),
+        'new': side_values('new'),
+        'abs_delta': np.where(numeric, abs_delta, np.nan),
+        'rel_delta': np.where(numeric, rel_delta, np.nan)
+    }, index=joined.index)
+
+
+def summarize_diff(diff):
+    """Counts of each status per analysis"""
+    return pd.crosstab(diff['analysis'], diff['status'])
+
+
+def run_drift(store_file=STORE_FILE, runs=None, path_like=None, tolerance=DEFAULT_TOLERANCE, overrides=None):
+    """
+    Flag changes between consecutive runs across many runs at once.
+    Returns (wide numeric matrix path x run_id, boolean matrix of flagged changes
+    where column k compares run k with the run before it).
+    """
+    
+    with ResultsStore(store_file) as store:
+        matrix = store.statistics_matrix(runs, path_like)
+    
+    values = matrix.values
+    previous = np.roll(values, 1, axis=1)
+    abs_tol, rel_tol = tolerance_arrays(matrix.index.to_series(), tolerance, overrides)
+    with np.errstate(invalid='ignore'):
+        flagged = ((np.isnan(previous) != np.isnan(values)) |
+                   (np.abs(values - previous) > abs_tol[:, None] + rel_tol[:, None] * np.abs(previous)))
+    flagged[:, 0] = False
+    
+    return matrix, pd.DataFrame(flagged, index=matrix.index, columns=matrix.columns)
+
+
+def print_diff(diff, old_label, new_label, max_rows=30):
+    """Print a diff summary and the largest flagged changes"""
+    
+    print("="*80)
+    print("RESULTS DIFF")
+    print("="*80)
+    print(f"\n  Old: {old_label}")
+    print(f"  New: {new_label}")
+    print(f"  Statistics compared: {len(diff)}")
+    
+    counts = diff['status'].value_counts()
+    print("\nStatus:")
+    for status in ['unchanged', 'within_tolerance', 'changed', 'type_changed', 'added', 'removed']:
+        print(f"  {status:<18s} {int(counts.get(status, 0)):>6d}")
+    
+    flagged = diff[~diff['status'].isin(['unchanged', 'within_tolerance'])]
+    if flagged.empty:
+        print("\n✓ No statistic changed beyond tolerance")
+        print("="*80)
+        return
+    
+    print("\nBy analysis:")
+    summary = summarize_diff(flagged)
+    for analysis, row in summary.iterrows():
+        print(f"  {analysis:<30s} " + ", ".join(f"{status}: {count}" for status, count in row.items() if count))
+    
+    print(f"\nLargest changes (up to {max_rows}):")
+    print(f"{'Statistic':<60} {'Old':>12} {'New':>12} {'Δ':>10} {'Δ%':>8}")
+    print("-"*106)
+    order = flagged['abs_delta'].abs().sort_values(ascending=False, na_position='last').index
+    for path, row in flagged.loc[order].head(max_rows).iterrows():
+        if row['status'] == 'changed' and not np.isnan(row['abs_delta']):
+            rel = f"{row['rel_delta']:.1%}" if np.isfinite(row['rel_delta']) else "—"
+            print(f"{path[:60]:<60} {row['old']:>12.4f} {row['new']:>12.4f} {row['abs_delta']:>10.4f} {rel:>8}")
+        else:
+            old_text = str(row['old'])[:12] if row['old'] is not None else '—'
+            new_text = str(row['new'])[:12] if row['new'] is not None else '—'
+            print(f"{path[:60]:<60} {old_text:>12} {new_text:>12} {row['status']:>19}")
+    
+    print("="*80)
+
+
+def diff_runs(old='-2', new='-1', store_file=STORE_FILE, output_file=None, tolerance=DEFAULT_TOLERANCE):
+    """Diff two runs (store runs or results JSON files), print it and optionally save a CSV"""
+    
+    diff = diff_statistics(load_statistics(old, store_file), load_statistics(new, store_file), tolerance)
+    print_diff(diff, old, new)
+    
+    if output_file:
+        diff.to_csv(output_file, index_label='path')
+        print(f"\n✓ Diff saved to: {output_file}")
+    
+    return diff
+
+
+if __name__ == "__main__":
+    # python results_diff.py [OLD] [NEW] [--abs-tol=X] [--rel-tol=Y] [--out=diff.csv]
+    # OLD/NEW: results JSON file, store run id / run key, or -1 (latest), -2 (previous)
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    options = dict(arg[2:].split('=', 1) for arg in sys.argv[1:] if arg.startswith('--') and '=' in arg)
+    
+    old, new = (args + ['-2', '-1'][len(args):])[:2]
+    tolerance = (float(options.get('abs-tol', DEFAULT_TOLERANCE[0])),
+                 float(options.get('rel-tol', DEFAULT_TOLERANCE[1])))
+    
+    diff = diff_runs(old, new, store_file=options.get('store', STORE_FILE),
+                     output_file=options.get('out'), tolerance=tolerance)
+    
+    changed = diff['status'].isin(['changed', 'type_changed', 'added', 'removed'])
+    sys.exit(1 if changed.any() else 0)
@@ -0,0 +1,220 @@
+"""
+Results Store
+Versioned registry of analysis runs: every statistic in an analyzer's results
+is stored as one typed row in SQLite, keyed by run, so past runs can be
+listed, queried and compared without reparsing text tables
+"""
+
+import pandas as pd
+import numpy as np
+import hashlib
+import sqlite3
+import json
+import os
+import subprocess
+from datetime import datetime
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_key TEXT NOT NULL UNIQUE,
+    created_at TEXT NOT NULL,
+    data_hash TEXT NOT NULL,
+    code_version TEXT NOT NULL,
+    git_commit TEXT,
+    config TEXT NOT NULL,
+    data_dir TEXT,
+    label TEXT,
+    n_statistics INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS statistics (
+    run_id INTEGER NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+    analysis TEXT NOT NULL,
+    path TEXT NOT NULL,
+    value_type TEXT NOT NULL,
+    num_value REAL,
+    text_value TEXT,
+    PRIMARY KEY (run_id, path)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS statistics_by_path ON statistics (path, run_id);
+CREATE INDEX IF NOT EXISTS runs_by_version ON runs (data_hash, code_version);
+"""
+
+PATH_SEPARATOR = '/'
+
+
+def file_hash(paths, block_size=1 << 20):
+    """sha256 over the contents of one or more files (in the given order)"""
+    digest = hashlib.sha256()
+    for path in [paths] if isinstance(paths, str) else paths:
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(block_size), b''):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+def git_commit(directory='.'):
+    """Current git commit of directory, or None when git or the repository is unavailable"""
+    try:
+        result = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=directory or '.',
+                                capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def flatten_results(results, prefix=''):
+    """
+    Flatten a nested results dict into (path, value_type, num_value, text_value) rows,
+    yielded one at a time. Dict keys and list positions become path components; leaves
+    are typed as bool, int, float, text or null (NaN floats are stored as NULL numbers).
+    """
+    
+    if isinstance(results, dict):
+        items = results.items()
+    elif isinstance(results, (list, tuple)):
+        items = enumerate(results)
+    else:
+        items = None
+    
+    if items is not None:
+        for key, value in items:
+            yield from flatten_results(value, f'{prefix}{PATH_SEPARATOR}{key}' if prefix else str(key))
+        return
+    
+    value = results
+    if value is None:
+        yield prefix, 'null', None, None
+    elif isinstance(value, (bool, np.bool_)):
+        yield prefix, 'bool', float(value), None
+    elif isinstance(value, (int, np.integer)):
+        yield prefix, 'int', float(value), None
+    elif isinstance(value, (float, np.floating)):
+        yield prefix, 'float', None if np.isnan(value) else float(value), None
+    else:
+        yield prefix, 'text', None, str(value)
+
+
+class ResultsStore:
+    """
+    SQLite-backed run registry for analysis results.
+    A run is identified by its data hash, code version and configuration; recording
+    the same combination again replaces that run's statistics.
+    """
+    
+    def __init__(self, path='research_data/analysis_output/results.sqlite'):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('PRAGMA foreign_keys = ON')
+        self.conn.executescript(SCHEMA)
+    
+    def close(self):
+        self.conn.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    @staticmethod
+    def run_key(data_hash, code_version, config=None):
+        """Stable key for a (data, code, configuration) combination"""
+        config_text = json.dumps(config or {}, sort_keys=True)
+        config_hash = hashlib.sha256(config_text.encode()).hexdigest()
+        return f'{data_hash[:12]}-{code_version[:12]}-{config_hash[:8]}'
+    
+    def record_run(self, results, data_hash, code_version, config=None, data_dir=None, label=None, commit=None):
+        """Store every statistic of a results dict as a typed row; returns the run_id"""
+        
+        run_key = self.run_key(data_hash, code_version, config)
+        rows = list(flatten_results(results))
+        
+        with self.conn:
+            self.conn.execute('DELETE FROM runs WHERE run_key = ?', (run_key,))
+            cursor = self.conn.execute(
+                'INSERT INTO runs (run_key, created_at, data_hash, code_version, git_commit, config, '
+                'data_dir, label, n_statistics) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (run_key, datetime.now().isoformat(timespec='seconds'), data_hash, code_version, commit,
+                 json.dumps(config or {}, sort_keys=True), data_dir, label, len(rows)))
+            run_id = cursor.lastrowid
+            self.conn.executemany(
+                'INSERT INTO statistics (run_id, analysis, path, value_type, num_value, text_value) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                [(run_id, path.split(PATH_SEPARATOR, 1)[0], path, value_type, num_value, text_value)
+                 for path, value_type, num_value, text_value in rows])
+        
+        return run_id
+    
+    def runs(self):
+        """All recorded runs, newest first"""
+        return pd.read_sql_query('SELECT * FROM runs ORDER BY run_id DESC', self.conn)
+    
+    def resolve_run(self, run):
+        """run_id for a run_id, run_key, or negative index (-1 = latest, -2 = previous, ...)"""
+        
+        if isinstance(run, str):
+            found = self.conn.execute('SELECT run_id FROM runs WHERE run_key = ?', (run,)).fetchone()
+        elif run < 0:
+            found = self.conn.execute('SELECT run_id FROM runs ORDER BY run_id DESC LIMIT 1 OFFSET ?',
+                                      (-run - 1,)).fetchone()
+        else:
+            found = self.conn.execute('SELECT run_id FROM runs WHERE run_id = ?', (run,)).fetchone()
+        
+        if found is None:
+            raise KeyError(f"No such run: {run}")
+        return found[0]
+    
+    def statistics(self, run=-1, analysis=None, path_like=None):
+        """
+        Statistics of one run as a DataFrame (path, analysis, value_type, value).
+        analysis filters on the top-level results key; path_like is an SQL LIKE pattern.
+        """
+        
+        query = 'SELECT path, analysis, value_type, num_value, text_value FROM statistics WHERE run_id = ?'
+        params = [self.resolve_run(run)]
+        if analysis is not None:
+            query += ' AND analysis = ?'
+            params.append(analysis)
+        if path_like is not None:
+            query += ' AND path LIKE ?'
+            params.append(path_like)
+        
+        stats = pd.read_sql_query(query + ' ORDER BY path', self.conn, params=params)
+        stats['value'] = stats['num_value'].astype(object).where(stats['value_type'] != 'text', stats['text_value'])
+        return stats
+    
+    def statistics_matrix(self, runs=None, path_like=None):
+        """Numeric statistics of many runs as one path x run_id matrix (runs ascending)"""
+        
+        query = "SELECT path, run_id, num_value FROM statistics WHERE value_type != 'text'"
+        params = []
+        if runs is not None:
+            run_ids = [self.resolve_run(run) for run in runs]
+            query += f" AND run_id IN ({', '.join('?' * len(run_ids))})"
+            params.extend(run_ids)
+        if path_like is not None:
+            query += ' AND path LIKE ?'
+            params.append(path_like)
+        
+        frame = pd.read_sql_query(query, self.conn, params=params)
+        matrix = frame.pivot(index='path', columns='run_id', values='num_value')
+        return matrix.sort_index(axis=1).astype(float)
+    
+    def history(self, path):
+        """One statistic across every run that recorded it"""
+        return pd.read_sql_query(
+            'SELECT r.run_id, r.created_at, r.data_hash, r.code_version, r.label, s.value_type, '
+            's.num_value, s.text_value FROM statistics s JOIN runs r USING (run_id) '
+            'WHERE s.path = ? ORDER BY r.run_id', self.conn, params=[path])
+    
+    def export_parquet(self, run=-1, output_file=None):
+        """Write one run's statistics to Parquet (requires pyarrow or fastparquet)"""
+        run_id = self.resolve_run(run)
+        if output_file is None:
+            output_file = os.path.join(os.path.dirname(self.path), f'results_run_{run_id}.parquet')
+        self.statistics(run_id).drop(columns='value').to_parquet(output_file, index=False)
+        return output_file
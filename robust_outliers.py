@@ -0,0 +1,169 @@
+"""
+Robust Outlier Screening
+FAST-MCD (Rousseeuw & Van Driessen, 1999) robust location and scatter with
+one-step reweighting, and robust Mahalanobis distances per group.
+Random elemental starts are concentrated (C-steps) in batches on subsamples
+of at most SUBSET_SIZE rows and merged, so the search costs the same for any n;
+only the final concentration of the best solution runs over every row.
+"""
+
+import pandas as pd
+import numpy as np
+from scipy import stats
+
+SUBSET_SIZE = 300       # rows per subsample in the start search
+MAX_SUBSETS = 5         # subsamples drawn when n > 2 * SUBSET_SIZE
+N_STARTS = 500          # random elemental starts (split over the subsamples)
+KEEP_BEST = 10          # solutions carried from one search stage to the next
+CUTOFF_QUANTILE = 0.975 # chi-square quantile of the reweighting and outlier cut-off
+
+
+def mahalanobis(X, mean, cov):
+    """Squared Mahalanobis distance of every row of X"""
+    diff = X - mean
+    return ((diff @ np.linalg.pinv(cov)) * diff).sum(axis=1)
+
+
+def batch_moments(samples):
+    """Mean and covariance (1/h scaling) of every sample in a (K, h, p) stack"""
+    
+    mean = samples.mean(axis=1)
+    centered = samples - mean[:, None, :]
+    cov = np.einsum('khp,khq->kpq', centered, centered) / samples.shape[1]
+    return mean, cov
+
+
+def batch_distances(X, mean, cov):
+    """Squared Mahalanobis distances of the rows of X under K candidate fits -> (K, n)"""
+    
+    precision = np.linalg.pinv(cov)
+    diff = X[None, :, :] - mean[:, None, :]
+    return np.einsum('knp,kpq,knq->kn', diff, precision, diff)
+
+
+def concentrate(X, mean, cov, h, steps):
+    """C-steps for K candidates at once: refit each on its h rows closest in Mahalanobis distance"""
+    
+    for _ in range(steps):
+        d2 = batch_distances(X, mean, cov)
+        closest = np.argpartition(d2, h - 1, axis=1)[:, :h]
+        mean, cov = batch_moments(X[closest])
+    return mean, cov
+
+
+def best_candidates(mean, cov, keep=KEEP_BEST):
+    """The keep candidates with the smallest covariance determinant"""
+    
+    sign, logdet = np.linalg.slogdet(cov)
+    logdet = np.where(sign > 0, logdet, np.inf)
+    order = np.argsort(logdet)[:keep]
+    return mean[order], cov[order]
+
+
+def search_starts(X, h, n_starts, rng, steps=2):
+    """Random (p+1)-row elemental starts, each concentrated steps times on X"""
+    
+    n, p = X.shape
+    rows = np.argpartition(rng.random_sample((n_starts, n)), p, axis=1)[:, :p + 1]
+    mean, cov = batch_moments(X[rows])
+    # Elemental fits of discrete scores can be singular; a tiny ridge keeps them usable
+    cov = cov + 1e-9 * np.eye(p) * np.trace(cov, axis1=1, axis2=2)[:, None, None].clip(min=1e-12)
+    return best_candidates(*concentrate(X, mean, cov, h, steps))
+
+
+def fast_mcd(X, support_fraction=0.75, seed=0, max_steps=100):
+    """
+    Reweighted minimum covariance determinant estimate of location and scatter.
+    Returns a dict with the robust mean and covariance, squared robust distances
+    of every row, outlier flags (distance beyond the chi-square CUTOFF_QUANTILE),
+    the cut-off and the size h of the raw MCD subset.
+    """
+    
+    X = np.asarray(X, dtype=float)
+    n, p = X.shape
+    h = max(int(np.ceil(support_fraction * n)), (n + p + 1) // 2)
+    rng = np.random.RandomState(seed)
+    
+    if n > 2 * SUBSET_SIZE:
+        # Search on disjoint subsamples, then on their union
+        n_subsets = min(MAX_SUBSETS, n // SUBSET_SIZE)
+        rows = rng.permutation(n)[:n_subsets * SUBSET_SIZE].reshape(n_subsets, SUBSET_SIZE)
+        h_subset = int(np.ceil(SUBSET_SIZE * h / n))
+        found = [search_starts(X[subset], h_subset, N_STARTS // n_subsets, rng) for subset in rows]
+        merged = X[rows.ravel()]
+        mean, cov = concentrate(merged, np.concatenate([m for m, _ in found]),
+                                np.concatenate([c for _, c in found]), int(np.ceil(len(merged) * h / n)), 2)
+        mean, cov = best_candidates(mean, cov, keep=1)
+    else:
+        mean, cov = search_starts(X, h, N_STARTS, rng)
+    
+    # Concentrate the surviving candidates on the full data until the determinant stops falling
+    best = (np.inf, None, None)
+    for start_mean, start_cov in zip(mean, cov):
+        m, c, previous = start_mean, start_cov, np.inf
+        for _ in range(max_steps):
+            d2 = mahalanobis(X, m, c)
+            closest = np.argpartition(d2, h - 1)[:h]
+            m, c = X[closest].mean(axis=0), np.cov(X[closest], rowvar=False, ddof=0)
+            sign, logdet = np.linalg.slogdet(c)
+            logdet = logdet if sign > 0 else -np.inf
+            if logdet >= previous - 1e-12:
+                break
+            previous = logdet
+        if logdet < best[0]:
+            best = (logdet, m, c)
+    _, raw_mean, raw_cov = best
+    
+    # Consistency correction, then one reweighting step on the rows within the cut-off
+    cutoff = stats.chi2.ppf(CUTOFF_QUANTILE, p)
+    raw_d2 = mahalanobis(X, raw_mean, raw_cov)
+    raw_cov = raw_cov * np.median(raw_d2) / stats.chi2.ppf(0.5, p)
+    support = mahalanobis(X, raw_mean, raw_cov) <= cutoff
+    
+    # (the covariance of a normal sample truncated at the cut-off is rescaled to full size)
+    robust_mean = X[support].mean(axis=0)
+    robust_cov = np.cov(X[support], rowvar=False, ddof=1) * CUTOFF_QUANTILE / stats.chi2.cdf(cutoff, p + 2)
+    d2 = mahalanobis(X, robust_mean, robust_cov)
+    
+    return {
+        'mean': robust_mean,
+        'covariance': robust_cov,
+        'distances': d2,
+        'outliers': d2 > cutoff,
+        'cutoff': float(cutoff),
+        'h': h
+    }
+
+
+def robust_distances(data, columns, by=None, support_fraction=0.75, seed=0):
+    """
+    FAST-MCD robust distances of data[columns], fitted separately within each level
+    of by (e.g. 'Country'). Rows with a missing value get no distance and are never
+    flagged. Returns (DataFrame with robust_d2 and robust_outlier aligned with data,
+    summary per group).
+    """
+    
+    screen = pd.DataFrame({'robust_d2': np.nan, 'robust_outlier': False}, index=data.index)
+    groups = data.groupby(by, sort=False) if by is not None else [('All', data)]
+    summary = {}
+    
+    for name, group in groups:
+        complete = group[columns].dropna()
+        if len(complete) <= 2 * len(columns):
+            summary[str(name)] = {'n': len(complete), 'outliers': 0, 'fitted': False}
+            continue
+        
+        fit = fast_mcd(complete.values, support_fraction, seed)
+        screen.loc[complete.index, 'robust_d2'] = fit['distances']
+        screen.loc[complete.index, 'robust_outlier'] = fit['outliers']
+        summary[str(name)] = {
+            'n': len(complete),
+            'h': fit['h'],
+            'outliers': int(fit['outliers'].sum()),
+            'outlier_rate': float(fit['outliers'].mean()),
+            'cutoff': fit['cutoff'],
+            'robust_mean': dict(zip(columns, fit['mean'].tolist())),
+            'fitted': True
+        }
+    
+    return screen, summary
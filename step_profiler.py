@@ -0,0 +1,199 @@
+"""
+Step Profiler
+Wall time, CPU time, peak RSS growth and rows processed for named (nested)
+steps, saved in the Chrome trace event format (open in chrome://tracing or
+Perfetto). A single step can also be run under cProfile or sampled by py-spy.
+"""
+
+from datetime import datetime
+import contextlib
+import cProfile
+import functools
+import io
+import json
+import os
+import pstats
+import shutil
+import signal
+import subprocess
+import sys
+import time
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows; peak RSS is then left out of the trace
+    resource = None
+
+
+def peak_rss_mb():
+    """High-water mark of this process's resident memory in MB (None when unavailable)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak / 2**20 if sys.platform == 'darwin' else peak / 2**10
+
+
+class StepProfiler:
+    """
+    Collects one complete ('X') trace event per step. profile_step names the
+    step run under cProfile (its calls are accumulated over every occurrence and
+    written to profile_<step>.prof); with py_spy the first occurrence of that step
+    is also sampled by py-spy into a speedscope file.
+    """
+    
+    def __init__(self, profile_step=None, py_spy=False, output_dir='.'):
+        self.profile_step = profile_step
+        self.py_spy = py_spy
+        self.output_dir = output_dir
+        self.events = []
+        self.stack = []
+        self.origin = time.perf_counter()
+        self.started_at = datetime.now().isoformat(timespec='seconds')
+        self.pid = os.getpid()
+        self.profile = None
+        self.py_spy_file = None
+    
+    @contextlib.contextmanager
+    def step(self, name, rows=None):
+        """Time the enclosed block as step name (rows: input rows it processes)"""
+        
+        hooks = self.start_hooks(name)
+        parent = self.stack[-1] if self.stack else None
+        self.stack.append(name)
+        rss_before = peak_rss_mb()
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+            rss_after = peak_rss_mb()
+            self.stack.pop()
+            self.stop_hooks(hooks)
+            
+            self.events.append({
+                'name': name,
+                'cat': parent or 'analysis',
+                'ph': 'X',
+                'ts': round((wall_start - self.origin) * 1e6, 1),
+                'dur': round(wall * 1e6, 1),
+                'pid': self.pid,
+                'tid': 0,
+                'args': {
+                    'wall_ms': wall * 1e3,
+                    'cpu_ms': cpu * 1e3,
+                    'peak_rss_mb': rss_after,
+                    'peak_rss_delta_mb': rss_after - rss_before if rss_after is not None else None,
+                    'rows': rows,
+                    'depth': len(self.stack),
+                    'parent': parent
+                }
+            })
+    
+    def start_hooks(self, name):
+        """Start cProfile (and py-spy) when name is the profiled step"""
+        
+        if name != self.profile_step:
+            return None
+        
+        self.profile = self.profile or cProfile.Profile()
+        self.profile.enable()
+        
+        spy = None
+        if self.py_spy and self.py_spy_file is None:
+            executable = shutil.which('py-spy')
+            if executable is None:
+                print("⚠ py-spy not found on PATH - sampling skipped")
+            else:
+                os.makedirs(self.output_dir, exist_ok=True)
+                self.py_spy_file = os.path.join(self.output_dir, f'py_spy_{name}.json')
+                spy = subprocess.Popen([executable, 'record', '--pid', str(self.pid), '--format', 'speedscope',
+                                        '--output', self.py_spy_file], stdout=subprocess.DEVNULL,
+                                       stderr=subprocess.DEVNULL)
+        return spy
+    
+    def stop_hooks(self, spy):
+        """Stop the hooks started for this step (py-spy writes its file on SIGINT)"""
+        
+        if self.profile is not None and self.stack.count(self.profile_step) == 0:
+            self.profile.disable()
+        if spy is not None:
+            spy.send_signal(signal.SIGINT)
+            try:
+                spy.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                spy.kill()
+    
+    def summary(self):
+        """Per step name in order of first start: calls, total wall and CPU seconds, largest peak RSS growth and rows"""
+        
+        totals = {}
+        for event in sorted(self.events, key=lambda event: event['ts']):
+            args = event['args']
+            entry = totals.setdefault(event['name'], {'calls': 0, 'wall_s': 0.0, 'cpu_s': 0.0,
+                                                      'peak_rss_delta_mb': None, 'rows': args['rows'],
+                                                      'depth': args['depth']})
+            entry['calls'] += 1
+            entry['wall_s'] += args['wall_ms'] / 1e3
+            entry['cpu_s'] += args['cpu_ms'] / 1e3
+            if args['peak_rss_delta_mb'] is not None:
+                entry['peak_rss_delta_mb'] = max(entry['peak_rss_delta_mb'] or 0.0, args['peak_rss_delta_mb'])
+        return totals
+    
+    def profile_report(self, limit=25):
+        """Top cProfile entries of the profiled step by cumulative time, as text"""
+        
+        if self.profile is None:
+            return None
+        buffer = io.StringIO()
+        pstats.Stats(self.profile, stream=buffer).sort_stats('cumulative').print_stats(limit)
+        return buffer.getvalue()
+    
+    def save(self, path):
+        """Write the Chrome trace (and the cProfile stats of the profiled step); returns the written paths"""
+        
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        trace = {
+            'traceEvents': sorted(self.events, key=lambda event: event['ts']),
+            'displayTimeUnit': 'ms',
+            'otherData': {
+                'started_at': self.started_at,
+                'python': sys.version.split()[0],
+                'profile_step': self.profile_step,
+                'summary': self.summary()
+            }
+        }
+        with open(path, 'w') as f:
+            json.dump(trace, f, indent=1)
+        written = [path]
+        
+        if self.profile is not None:
+            stats_file = os.path.join(os.path.dirname(path) or '.', f'profile_{self.profile_step}.prof')
+            self.profile.dump_stats(stats_file)
+            written.append(stats_file)
+        if self.py_spy_file and os.path.exists(self.py_spy_file):
+            written.append(self.py_spy_file)
+        return written
+
+
+def profiled(name=None, rows=None):
+    """
+    Method decorator: run the method as a step of self.profiler, or call it
+    directly when the instance has no profiler. rows(self) gives the rows processed.
+    """
+    
+    def decorate(method):
+        step_name = name or method.__name__
+        
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            profiler = getattr(self, 'profiler', None)
+            if profiler is None:
+                return method(self, *args, **kwargs)
+            with profiler.step(step_name, rows(self) if rows else None):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorate